@@ -0,0 +1,260 @@
+"""
+Módulo del almacén columnar del inventario.
+Guarda los objetos del hogar en arreglos compactos (una columna por atributo)
+y sólo crea instancias de ObjetoHogar cuando se solicitan.
+"""
+from array import array
+from datetime import date, datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Type
+
+from entities.categorias import ObjetoHogar, Categoria, EstadoConservacion
+from entities import depreciacion
+from entities.objetos_hogar import (
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+)
+from entities.objetos_compactos import EQUIVALENTES
+
+# Tablas de códigos: la posición en la lista es el código guardado en la columna
+CATEGORIAS: List[Categoria] = list(Categoria)
+ESTADOS: List[EstadoConservacion] = list(EstadoConservacion)
+TIPOS: List[Type[ObjetoHogar]] = sorted(
+    [Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza],
+    key=lambda tipo: tipo.CODIGO_TIPO
+)
+
+CODIGO_CATEGORIA: Dict[Categoria, int] = {c: i for i, c in enumerate(CATEGORIAS)}
+CODIGO_ESTADO: Dict[EstadoConservacion, int] = {e: i for i, e in enumerate(ESTADOS)}
+CODIGO_TIPO: Dict[Type[ObjetoHogar], int] = {t: t.CODIGO_TIPO for t in TIPOS}
+
+# Atributos propios de cada subclase, en el orden en que se guardan
+ATRIBUTOS_TIPO: Dict[Type[ObjetoHogar], Tuple[str, ...]] = {
+    Electrodomestico: ("_marca", "_potencia_w", "_garantia_meses"),
+    Herramienta: ("_material", "_es_electrica"),
+    Ropa: ("_tela", "_talla", "_temporada"),
+    Mueble: ("_material", "_dimensiones", "_estilo", "_codigo_material"),
+    UtensilioCocina: ("_material", "_es_afilable"),
+    ArticuloLimpieza: ("_tipo_limpieza", "_es_desechable"),
+}
+
+# Las clases compactas se guardan igual que su clase normal equivalente
+for _compacta, _normal in EQUIVALENTES.items():
+    CODIGO_TIPO[_compacta] = CODIGO_TIPO[_normal]
+    ATRIBUTOS_TIPO[_compacta] = ATRIBUTOS_TIPO[_normal]
+
+MAX_HABITACIONES = 32767  # límite de la columna int16
+SIN_HABITACION = -1  # marca de fila eliminada en la columna de habitación
+# Las columnas se compactan cuando las filas eliminadas pasan de esta
+# proporción: cada compactación copia a lo sumo tantas filas como se
+# eliminaron desde la anterior
+PROPORCION_COMPACTACION = 0.5
+
+
+class AlmacenColumnar:
+    """Almacén de objetos del hogar organizado por columnas"""
+
+    def __init__(self):
+        self._valor_estimado = array('d')
+        self._categoria = array('b')
+        self._estado = array('b')
+        self._habitacion = array('h')
+        self._tipo = array('b')
+        self._material = array('b')
+        self._fecha = array('d')
+        # Fecha de adquisición codificada para el motor de depreciación (codigo_fecha)
+        self._codigo_fecha = array('i')
+        self._nombre: List[str] = []
+        self._ubicacion: List[str] = []
+        self._extras: List[Tuple[Any, ...]] = []
+        self._habitaciones: List[str] = []
+        self._filas_habitacion: List[array] = []
+        self._eliminadas = 0
+
+    def __len__(self) -> int:
+        return len(self._valor_estimado) - self._eliminadas
+
+    def registrar_habitacion(self, nombre: str) -> int:
+        """Registra una habitación y retorna su identificador numérico"""
+        if len(self._habitaciones) >= MAX_HABITACIONES:
+            raise ValueError("El almacén no admite más habitaciones")
+        self._habitaciones.append(nombre)
+        self._filas_habitacion.append(array('q'))
+        return len(self._habitaciones) - 1
+
+    def agregar(self, objeto: ObjetoHogar, id_habitacion: int) -> int:
+        """Guarda un objeto en las columnas y retorna el número de fila"""
+        tipo = type(objeto)
+        if tipo not in CODIGO_TIPO:
+            raise TypeError(f"Tipo de objeto no soportado: {tipo.__name__}")
+        if not 0 <= id_habitacion < len(self._habitaciones):
+            raise ValueError(f"Habitación no registrada: {id_habitacion}")
+
+        fila = len(self._valor_estimado)
+        self._valor_estimado.append(objeto.valor_estimado)
+        self._categoria.append(CODIGO_CATEGORIA[objeto.categoria])
+        self._estado.append(CODIGO_ESTADO[objeto.estado])
+        self._habitacion.append(id_habitacion)
+        self._tipo.append(CODIGO_TIPO[tipo])
+        self._material.append(objeto.codigo_material)
+        fecha = objeto.fecha_adquisicion
+        self._fecha.append(fecha.timestamp())
+        self._codigo_fecha.append(depreciacion.codigo_fecha(fecha))
+        self._nombre.append(objeto.nombre)
+        self._ubicacion.append(objeto.ubicacion)
+        self._extras.append(tuple(getattr(objeto, attr) for attr in ATRIBUTOS_TIPO[tipo]))
+        self._filas_habitacion[id_habitacion].append(fila)
+        return fila
+
+    def obtener_objeto(self, fila: int) -> ObjetoHogar:
+        """
+        Crea una vista del objeto guardado en la fila indicada.
+        La vista es una instancia nueva: modificarla no cambia el almacén.
+        Las vistas no se guardan (eso anularía el ahorro de memoria), así que
+        su obtener_informacion() en caché sólo sirve mientras se conserve la
+        vista: recorrer el inventario completo arma cada registro de nuevo.
+        """
+        tipo = TIPOS[self._tipo[fila]]
+        objeto = tipo.__new__(tipo)
+        atributos = objeto.__dict__
+        atributos["_nombre"] = self._nombre[fila]
+        atributos["_categoria"] = CATEGORIAS[self._categoria[fila]]
+        atributos["_ubicacion"] = self._ubicacion[fila]
+        atributos["_estado"] = ESTADOS[self._estado[fila]]
+        atributos["_valor_estimado"] = self._valor_estimado[fila]
+        atributos["_fecha_adquisicion"] = datetime.fromtimestamp(self._fecha[fila])
+        atributos.update(zip(ATRIBUTOS_TIPO[tipo], self._extras[fila]))
+        return objeto
+
+    def fila_en_posicion(self, id_habitacion: int, posicion: int) -> int:
+        """Traduce la posición de un objeto dentro de su habitación a su fila"""
+        return self._filas_habitacion[id_habitacion][posicion]
+
+    def eliminar(self, id_habitacion: int, posicion: int) -> ObjetoHogar:
+        """
+        Quita un objeto de su habitación y retorna una vista del mismo.
+        La fila queda marcada como eliminada para no mover las columnas en
+        cada eliminación; cuando las eliminadas superan
+        PROPORCION_COMPACTACION de las filas, se compactan (ver compactar).
+        """
+        filas = self._filas_habitacion[id_habitacion]
+        fila = filas[posicion]
+        objeto = self.obtener_objeto(fila)
+        del filas[posicion]
+        self._habitacion[fila] = SIN_HABITACION
+        self._eliminadas += 1
+        if self._eliminadas > PROPORCION_COMPACTACION * len(self._valor_estimado):
+            self.compactar()
+        return objeto
+
+    def compactar(self):
+        """
+        Quita de las columnas las filas eliminadas. Las filas restantes
+        cambian de número pero no de orden, así que las posiciones dentro de
+        cada habitación siguen siendo las mismas.
+        """
+        if not self._eliminadas:
+            return
+        habitaciones = self._habitacion
+        vivas = [f for f in range(len(habitaciones)) if habitaciones[f] != SIN_HABITACION]
+        nueva_fila = array('q', [SIN_HABITACION]) * len(habitaciones)
+        for nueva, fila in enumerate(vivas):
+            nueva_fila[fila] = nueva
+
+        for atributo in ("_valor_estimado", "_categoria", "_estado", "_habitacion",
+                         "_tipo", "_material", "_fecha", "_codigo_fecha"):
+            columna = getattr(self, atributo)
+            setattr(self, atributo, array(columna.typecode, [columna[f] for f in vivas]))
+        for atributo in ("_nombre", "_ubicacion", "_extras"):
+            columna = getattr(self, atributo)
+            setattr(self, atributo, [columna[f] for f in vivas])
+        for filas in self._filas_habitacion:
+            for posicion, fila in enumerate(filas):
+                filas[posicion] = nueva_fila[fila]
+        self._eliminadas = 0
+
+    def cambiar_estado(self, fila: int, estado: EstadoConservacion):
+        self._estado[fila] = CODIGO_ESTADO[estado]
+
+    def cambiar_valor(self, fila: int, valor_estimado: float):
+        self._valor_estimado[fila] = valor_estimado
+
+    def filas(self, id_habitacion: Optional[int] = None) -> array:
+        """Retorna las filas de una habitación (o de todo el almacén)"""
+        if id_habitacion is None:
+            if self._eliminadas:
+                habitaciones = self._habitacion
+                return array('q', (f for f in range(len(habitaciones))
+                                   if habitaciones[f] != SIN_HABITACION))
+            return array('q', range(len(self._valor_estimado)))
+        return self._filas_habitacion[id_habitacion]
+
+    def extraer_columnas(self, filas: Iterable[int]) -> Tuple[array, array, array, array, array]:
+        """Copia valor, tipo, material, categoría y fecha codificada de las filas indicadas"""
+        valores, tipos = array('d'), array('b')
+        materiales, categorias = array('b'), array('b')
+        fechas = array('i')
+        for fila in filas:
+            valores.append(self._valor_estimado[fila])
+            tipos.append(self._tipo[fila])
+            materiales.append(self._material[fila])
+            categorias.append(self._categoria[fila])
+            fechas.append(self._codigo_fecha[fila])
+        return valores, tipos, materiales, categorias, fechas
+
+    def total_filas(self, id_habitacion: Optional[int] = None) -> int:
+        if id_habitacion is None:
+            return len(self)
+        return len(self._filas_habitacion[id_habitacion])
+
+    def iterar_objetos(self, id_habitacion: Optional[int] = None) -> Iterator[ObjetoHogar]:
+        """Genera vistas de los objetos de una habitación (o de todo el almacén)"""
+        for fila in self.filas(id_habitacion):
+            yield self.obtener_objeto(fila)
+
+    def valor_original_total(self, id_habitacion: Optional[int] = None) -> float:
+        if id_habitacion is None and not self._eliminadas:
+            return sum(self._valor_estimado)
+        valores = self._valor_estimado
+        return sum(valores[fila] for fila in self.filas(id_habitacion))
+
+    def valores_actuales(self, id_habitacion: Optional[int] = None,
+                         fecha: Optional[date] = None):
+        """
+        Calcula en lote el valor de cada fila a la fecha indicada (hoy por
+        defecto) con el motor de depreciación
+        """
+        if id_habitacion is None and not self._eliminadas:
+            return depreciacion.calcular_valores_actuales(
+                self._valor_estimado, self._tipo, self._material, self._codigo_fecha, fecha
+            )
+        filas = self.filas(id_habitacion)
+        return depreciacion.calcular_valores_actuales(
+            [self._valor_estimado[f] for f in filas],
+            [self._tipo[f] for f in filas],
+            [self._material[f] for f in filas],
+            [self._codigo_fecha[f] for f in filas],
+            fecha,
+        )
+
+    def valor_actual_total(self, id_habitacion: Optional[int] = None,
+                           fecha: Optional[date] = None) -> float:
+        return float(sum(self.valores_actuales(id_habitacion, fecha)))
+
+    def curva_valores(self, fechas: Iterable[date],
+                      id_habitacion: Optional[int] = None) -> List[float]:
+        """Valor total de las filas en cada una de las fechas indicadas"""
+        columnas = self.extraer_columnas(self.filas(id_habitacion))
+        valores, tipos, materiales, _, codigos = columnas
+        return depreciacion.curva_valores(valores, tipos, materiales, codigos, list(fechas))
+
+    def totales_por_categoria(self, id_habitacion: Optional[int] = None,
+                              fecha: Optional[date] = None) -> Dict[str, Dict[str, float]]:
+        """Suma valores original y actual (a la fecha indicada) agrupados por categoría"""
+        totales: Dict[str, Dict[str, float]] = {}
+        actuales = self.valores_actuales(id_habitacion, fecha)
+        for fila, actual in zip(self.filas(id_habitacion), actuales):
+            categoria = CATEGORIAS[self._categoria[fila]].value
+            if categoria not in totales:
+                totales[categoria] = {"original": 0, "actual": 0}
+            totales[categoria]["original"] += self._valor_estimado[fila]
+            totales[categoria]["actual"] += float(actual)
+        return totales
@@ -0,0 +1,250 @@
+"""
+Módulo de estadísticas del inventario en una sola pasada.
+Además de las sumas del reporte financiero, calcula mediana, p90 y p99 del
+valor estimado y del valor actual por categoría y por habitación, y los
+objetos más valiosos y más depreciados, sin ordenar ni guardar todos los
+valores:
+    - los cuantiles salen de un sketch con error relativo acotado (los
+      valores se cuentan en cubetas logarítmicas, como DDSketch)
+    - los k mayores se mantienen en montículos de tamaño k
+Los resultados parciales de distintas particiones (archivos, procesos,
+casas) se combinan con fusionar() y dan lo mismo que una sola pasada.
+"""
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from main import LectorInventarioJSONL
+
+PRECISION_RELATIVA = 0.01  # error relativo máximo de los cuantiles
+K_DESTACADOS = 10
+CUANTILES = {"mediana": 0.5, "p90": 0.9, "p99": 0.99}
+
+class SketchCuantiles:
+    """
+    Cuantiles aproximados con error relativo `precision`: el valor x se
+    cuenta en la cubeta ceil(log_gamma(x)), con gamma = (1 + p) / (1 - p).
+    La memoria crece con el logaritmo del rango de valores, no con la
+    cantidad, y dos sketches con la misma precisión se suman cubeta a cubeta.
+    """
+
+    def __init__(self, precision: float = PRECISION_RELATIVA):
+        if not 0 < precision < 1:
+            raise ValueError("La precisión relativa debe estar entre 0 y 1")
+        self.precision = precision
+        self._gamma = (1 + precision) / (1 - precision)
+        self._log_gamma = math.log(self._gamma)
+        self._cubetas: Dict[int, int] = {}
+        self._ceros = 0  # valores <= 0 (p. ej. objetos totalmente depreciados)
+        self.cantidad = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, valor: float):
+        if valor > 0:
+            cubeta = math.ceil(math.log(valor) / self._log_gamma)
+            self._cubetas[cubeta] = self._cubetas.get(cubeta, 0) + 1
+        else:
+            self._ceros += 1
+        self.cantidad += 1
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def fusionar(self, otro: "SketchCuantiles") -> "SketchCuantiles":
+        if otro.precision != self.precision:
+            raise ValueError("Sólo se pueden fusionar sketches con la misma precisión")
+        for cubeta, cantidad in otro._cubetas.items():
+            self._cubetas[cubeta] = self._cubetas.get(cubeta, 0) + cantidad
+        self._ceros += otro._ceros
+        self.cantidad += otro.cantidad
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+
+    def cuantil(self, q: float) -> Optional[float]:
+        """Valor aproximado del cuantil q (entre 0 y 1); None si no hay valores"""
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1")
+        if self.cantidad == 0:
+            return None
+        rango = q * (self.cantidad - 1)
+        acumulado = self._ceros
+        if acumulado > rango:
+            return max(self.minimo, 0.0)
+        for cubeta in sorted(self._cubetas):
+            acumulado += self._cubetas[cubeta]
+            if acumulado > rango:
+                # Punto de la cubeta con error relativo <= precision
+                estimado = 2 * self._gamma ** cubeta / (self._gamma + 1)
+                return min(max(estimado, self.minimo), self.maximo)
+        return self.maximo
+
+class ObjetoDestacado(NamedTuple):
+    """Datos de un objeto en los rankings; comparable para desempatar"""
+    nombre: str
+    tipo: str
+    categoria: str
+    habitacion: str
+    valor_original: float
+    valor_actual: float
+
+class MayoresK:
+    """Los k elementos de mayor clave vistos, en un montículo de tamaño k"""
+
+    def __init__(self, k: int = K_DESTACADOS):
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        self.k = k
+        self._monticulo: List[Tuple[float, ObjetoDestacado]] = []
+
+    def agregar(self, clave: float, elemento: ObjetoDestacado):
+        if len(self._monticulo) < self.k:
+            heapq.heappush(self._monticulo, (clave, elemento))
+        elif (clave, elemento) > self._monticulo[0]:
+            heapq.heapreplace(self._monticulo, (clave, elemento))
+
+    def fusionar(self, otro: "MayoresK") -> "MayoresK":
+        for clave, elemento in otro._monticulo:
+            self.agregar(clave, elemento)
+        return self
+
+    def elementos(self) -> List[ObjetoDestacado]:
+        """De mayor a menor clave"""
+        return [elemento for _, elemento in sorted(self._monticulo, reverse=True)]
+
+class EstadisticasGrupo:
+    """Sketches del valor estimado y del valor actual de un grupo de objetos"""
+
+    def __init__(self, precision: float = PRECISION_RELATIVA):
+        self.valor_estimado = SketchCuantiles(precision)
+        self.valor_actual = SketchCuantiles(precision)
+
+    def fusionar(self, otro: "EstadisticasGrupo") -> "EstadisticasGrupo":
+        self.valor_estimado.fusionar(otro.valor_estimado)
+        self.valor_actual.fusionar(otro.valor_actual)
+        return self
+
+    def resumen(self) -> Dict[str, Any]:
+        return {
+            "cantidad": self.valor_estimado.cantidad,
+            "valor_estimado": _cuantiles(self.valor_estimado),
+            "valor_actual": _cuantiles(self.valor_actual)
+        }
+
+def _cuantiles(sketch: SketchCuantiles) -> Dict[str, Optional[float]]:
+    resultado = {}
+    for nombre, q in CUANTILES.items():
+        valor = sketch.cuantil(q)
+        resultado[nombre] = round(valor, 2) if valor is not None else None
+    return resultado
+
+class AnaliticaInventario:
+    """
+    Acumula estadísticas de objetos de una o varias casas. Se alimenta con
+    agregar_casa / agregar_habitacion o con registros JSONL (los de
+    exportar_inventario_jsonl o LectorInventarioJSONL.iterar_registros).
+    """
+
+    def __init__(self, k: int = K_DESTACADOS, precision: float = PRECISION_RELATIVA):
+        self.k = k
+        self.precision = precision
+        self._por_categoria: Dict[str, EstadisticasGrupo] = {}
+        self._por_habitacion: Dict[str, EstadisticasGrupo] = {}
+        self._mas_valiosos = MayoresK(k)
+        self._mas_depreciados = MayoresK(k)
+
+    def _grupo(self, grupos: Dict[str, EstadisticasGrupo], nombre: str) -> EstadisticasGrupo:
+        grupo = grupos.get(nombre)
+        if grupo is None:
+            grupo = grupos[nombre] = EstadisticasGrupo(self.precision)
+        return grupo
+
+    def agregar(self, habitacion: str, categoria: str, tipo: str, nombre: str,
+                valor_original: float, valor_actual: float):
+        """Cuenta un objeto"""
+        for grupo in (self._grupo(self._por_categoria, categoria),
+                      self._grupo(self._por_habitacion, habitacion)):
+            grupo.valor_estimado.agregar(valor_original)
+            grupo.valor_actual.agregar(valor_actual)
+        destacado = ObjetoDestacado(nombre, tipo, categoria, habitacion,
+                                    valor_original, valor_actual)
+        self._mas_valiosos.agregar(valor_actual, destacado)
+        self._mas_depreciados.agregar(valor_original - valor_actual, destacado)
+
+    def agregar_habitacion(self, habitacion) -> "AnaliticaInventario":
+        nombre = habitacion.nombre
+        for objeto in habitacion.iterar_objetos():
+            self.agregar(nombre, objeto.categoria.value, objeto.TIPO, objeto.nombre,
+                         objeto.valor_estimado, objeto.calcular_valor_actual())
+        return self
+
+    def agregar_casa(self, casa) -> "AnaliticaInventario":
+        for habitacion in casa.habitaciones:
+            self.agregar_habitacion(habitacion)
+        return self
+
+    def agregar_registros(self, registros: Iterable[Dict[str, Any]]) -> "AnaliticaInventario":
+        """
+        Cuenta registros de objetos; las líneas de casa y de habitación se
+        ignoran. Sin campo "habitacion" se usa la ubicación del objeto.
+        """
+        for registro in registros:
+            if registro.get("registro", "objeto") != "objeto":
+                continue
+            self.agregar(registro.get("habitacion") or registro["ubicacion"],
+                         registro["categoria"], registro["tipo"], registro["nombre"],
+                         registro["valor_original"], registro["valor_actual"])
+        return self
+
+    def fusionar(self, otra: "AnaliticaInventario") -> "AnaliticaInventario":
+        """Suma a esta analítica la de otra partición (con la misma precisión)"""
+        for propios, ajenos in ((self._por_categoria, otra._por_categoria),
+                                (self._por_habitacion, otra._por_habitacion)):
+            for nombre, grupo in ajenos.items():
+                self._grupo(propios, nombre).fusionar(grupo)
+        self._mas_valiosos.fusionar(otra._mas_valiosos)
+        self._mas_depreciados.fusionar(otra._mas_depreciados)
+        return self
+
+    def resumen(self) -> Dict[str, Any]:
+        return {
+            "por_categoria": {
+                nombre: grupo.resumen() for nombre, grupo in self._por_categoria.items()
+            },
+            "por_habitacion": {
+                nombre: grupo.resumen() for nombre, grupo in self._por_habitacion.items()
+            },
+            "mas_valiosos": [objeto._asdict() for objeto in self._mas_valiosos.elementos()],
+            "mas_depreciados": [
+                objeto._asdict() for objeto in self._mas_depreciados.elementos()
+            ]
+        }
+
+def analizar_archivo(archivo: str, k: int = K_DESTACADOS,
+                     precision: float = PRECISION_RELATIVA) -> AnaliticaInventario:
+    """Analítica de un inventario JSONL (puede estar comprimido con gzip)"""
+    return AnaliticaInventario(k, precision).agregar_registros(
+        LectorInventarioJSONL(archivo).iterar_registros()
+    )
+
+def analizar_archivos(archivos: Iterable[str], procesos: Optional[int] = None,
+                      k: int = K_DESTACADOS,
+                      precision: float = PRECISION_RELATIVA) -> AnaliticaInventario:
+    """
+    Analiza cada archivo por separado (en varios procesos salvo procesos=1)
+    y fusiona los resultados parciales
+    """
+    funcion = partial(analizar_archivo, k=k, precision=precision)
+    total = AnaliticaInventario(k, precision)
+    if procesos == 1:
+        for parcial in map(funcion, archivos):
+            total.fusionar(parcial)
+        return total
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        for parcial in ejecutor.map(funcion, archivos):
+            total.fusionar(parcial)
+    return total
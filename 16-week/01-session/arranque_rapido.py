@@ -0,0 +1,127 @@
+"""
+Módulo de arranque rápido de la línea de comandos.
+`python main.py` compila main.py en cada llamada (un script no usa el caché
+de bytecode) y reconstruye el inventario predefinido objeto por objeto.
+
+Este punto de entrada importa main como módulo (con su bytecode en caché) y
+carga la Casa predefinida de un snapshot binario (ver snapshot_binario)
+guardado en __pycache__, en lugar de reconstruirla. El snapshot se invalida
+si cambia la fecha (las fechas de adquisición son relativas a hoy), la
+versión de Python o alguno de los módulos del proyecto que se cargaron al
+generarlo; en ese caso se arma la casa y se guarda un snapshot nuevo.
+Sin opciones corre la ejecución por defecto sobre esa casa; con opciones
+delega en main.main. Cualquier otro camino que necesite la Casa predefinida
+puede usar cargar_casa_predefinida().
+
+Uso:
+    python arranque_rapido.py [--instrumentar] [--perfil ARCHIVO]
+"""
+# Sin typing: sólo se importa lo que main ya necesita
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+import time
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+# Datos para validar el snapshot (marshal) y el snapshot de la casa
+RUTA_CACHE = os.path.join(DIRECTORIO, "__pycache__", "inventario_predefinido.cache")
+RUTA_SNAPSHOT = os.path.join(DIRECTORIO, "__pycache__", "inventario_predefinido.bin")
+VERSION_CACHE = 2
+
+
+def _fecha() -> str:
+    # Los valores dependen de la fecha (depreciación, fechas de adquisición)
+    return time.strftime("%Y-%m-%d")
+
+
+def _estado_fuente(ruta: str) -> tuple[int, int]:
+    estado = os.stat(ruta)
+    return estado.st_mtime_ns, estado.st_size
+
+
+def _fuentes_cargadas() -> list[tuple[str, int, int]]:
+    """(ruta, mtime, tamaño) de cada módulo del proyecto importado hasta ahora"""
+    fuentes = []
+    prefijo = DIRECTORIO + os.sep
+    for modulo in list(sys.modules.values()):
+        ruta = getattr(modulo, "__file__", None)
+        if ruta and os.path.abspath(ruta).startswith(prefijo):
+            ruta = os.path.abspath(ruta)
+            fuentes.append((ruta, *_estado_fuente(ruta)))
+    return sorted(fuentes)
+
+
+def leer_cache() -> dict | None:
+    """Los datos del snapshot en caché, o None si falta o quedó viejo"""
+    try:
+        with open(RUTA_CACHE, "rb") as f:
+            cache = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (not isinstance(cache, dict) or cache.get("version") != VERSION_CACHE
+            or cache.get("python") != sys.version or cache.get("fecha") != _fecha()
+            or not os.path.exists(RUTA_SNAPSHOT)):
+        return None
+    for ruta, mtime, tamano in cache["fuentes"]:
+        try:
+            if _estado_fuente(ruta) != (mtime, tamano):
+                return None
+        except OSError:
+            return None
+    return cache
+
+
+def guardar_cache(casa):
+    """Guarda el snapshot de la casa y, después, los datos que lo validan"""
+    import snapshot_binario
+    os.makedirs(os.path.dirname(RUTA_SNAPSHOT), exist_ok=True)
+    snapshot_binario.guardar_snapshot(casa, RUTA_SNAPSHOT)
+    cache = {
+        "version": VERSION_CACHE,
+        "python": sys.version,
+        "fecha": _fecha(),
+        "fuentes": _fuentes_cargadas()
+    }
+    temporal = f"{RUTA_CACHE}.{os.getpid()}"
+    with open(temporal, "wb") as f:
+        marshal.dump(cache, f)
+    os.replace(temporal, RUTA_CACHE)
+
+
+def cargar_casa_predefinida():
+    """
+    La Casa del inventario predefinido, decodificada del snapshot en caché.
+    Si el caché no sirve se arma con main.crear_inventario_predefinido y se
+    guarda para la próxima vez.
+    """
+    import main
+    if leer_cache() is not None:
+        import snapshot_binario
+        try:
+            with snapshot_binario.SnapshotCasa(RUTA_SNAPSHOT) as snapshot:
+                return main.Casa.desde_snapshot(snapshot)
+        except (OSError, snapshot_binario.ErrorSnapshot):
+            pass  # se vuelve a generar
+    casa = main.crear_inventario_predefinido()
+    try:
+        guardar_cache(casa)
+    except OSError:
+        pass  # sin caché la próxima ejecución sólo es más lenta
+    return casa
+
+
+def iniciar(argv: list[str] | None = None):
+    """Punto de entrada: casa del snapshot sin opciones, main.main con opciones"""
+    if argv is None:
+        argv = sys.argv[1:]
+    import main
+    if argv:
+        main.main(argv)
+        return
+    main.ejecutar(cargar_casa_predefinida())
+
+
+if __name__ == "__main__":
+    iniciar()
@@ -0,0 +1,133 @@
+"""
+Benchmark del arranque de la línea de comandos.
+
+Cada caso se corre en un proceso nuevo, como se usa en la práctica:
+    - main.py: el script completo (compila main.py e importa todo)
+    - arranque_rapido.py sin caché: arma la casa y guarda su snapshot
+    - arranque_rapido.py con caché: carga la casa del snapshot binario
+El tiempo total es el de reloj del proceso completo. El de imports sale de
+`python -X importtime` (microsegundos acumulados de los imports de primer
+nivel) junto con los módulos más caros. Los procesos corren en un directorio
+temporal, así que data/inventario_completo.json no se toca.
+
+Uso:
+    python benchmark_arranque.py --repeticiones 20 --salida arranque.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import arranque_rapido
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+MODULOS_MOSTRADOS = 8
+
+def _borrar_cache():
+    try:
+        os.remove(arranque_rapido.RUTA_CACHE)
+    except FileNotFoundError:
+        pass
+
+def _correr(script: str, directorio: str, opciones: Tuple[str, ...] = ()) -> str:
+    """Corre el script en un proceso nuevo y retorna lo que escribió en stderr"""
+    resultado = subprocess.run(
+        [sys.executable, *opciones, os.path.join(DIRECTORIO, script)], cwd=directorio,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+    )
+    return resultado.stderr
+
+def leer_importtime(texto: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """
+    Total de microsegundos de los imports de primer nivel y la lista
+    (módulo, acumulado) ordenada de mayor a menor
+    """
+    total = 0
+    modulos = []
+    for linea in texto.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        acumulado = int(acumulado)
+        # La indentación del nombre marca la profundidad: 1 espacio = primer nivel
+        if not nombre[1:].startswith(" "):
+            total += acumulado
+        modulos.append((nombre.strip(), acumulado))
+    modulos.sort(key=lambda modulo: modulo[1], reverse=True)
+    return total, modulos
+
+def medir_caso(script: str, preparar: Callable[[], None],
+               repeticiones: int) -> Dict[str, Any]:
+    """Tiempo de reloj por proceso y perfil de imports de un caso"""
+    tiempos = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for _ in range(repeticiones):
+            preparar()
+            inicio = time.perf_counter()
+            _correr(script, directorio)
+            tiempos.append(time.perf_counter() - inicio)
+        preparar()
+        total_imports, modulos = leer_importtime(
+            _correr(script, directorio, ("-X", "importtime")))
+    tiempos.sort()
+    return {
+        "mejor_ms": tiempos[0] * 1e3,
+        "mediana_ms": tiempos[len(tiempos) // 2] * 1e3,
+        "imports_ms": total_imports / 1e3,
+        "modulos_importados": len(modulos),
+        "mas_caros": [
+            {"modulo": nombre, "ms": acumulado / 1e3}
+            for nombre, acumulado in modulos[:MODULOS_MOSTRADOS]
+        ]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del arranque del inventario")
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    args = parser.parse_args()
+
+    def con_cache():
+        if arranque_rapido.leer_cache() is None:
+            with tempfile.TemporaryDirectory() as directorio:
+                _correr("arranque_rapido.py", directorio)
+
+    casos: Dict[str, Tuple[str, Callable[[], None]]] = {
+        "main.py": ("main.py", lambda: None),
+        "arranque_rapido sin caché": ("arranque_rapido.py", _borrar_cache),
+        "arranque_rapido con caché": ("arranque_rapido.py", con_cache),
+    }
+    reporte: Dict[str, Any] = {
+        "fecha": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticiones": args.repeticiones,
+        "resultados": {},
+    }
+    base: Optional[float] = None
+    for caso, (script, preparar) in casos.items():
+        print(f"Midiendo {caso}...", file=sys.stderr)
+        medida = medir_caso(script, preparar, args.repeticiones)
+        reporte["resultados"][caso] = medida
+        base = base or medida["mediana_ms"]
+        print(f"  total {medida['mediana_ms']:>8.1f} ms (mediana, "
+              f"{base / medida['mediana_ms']:.1f}x)   imports {medida['imports_ms']:>7.1f} ms"
+              f"   {medida['modulos_importados']} módulos", file=sys.stderr)
+        for modulo in medida["mas_caros"]:
+            print(f"    {modulo['modulo']:<36}{modulo['ms']:>8.1f} ms", file=sys.stderr)
+
+    salida = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(salida)
+    else:
+        print(salida)
+
+if __name__ == "__main__":
+    main()
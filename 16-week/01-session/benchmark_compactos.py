@@ -0,0 +1,81 @@
+"""
+Benchmark de memoria y tiempo de construcción:
+clases normales de objetos_hogar contra las compactas de objetos_compactos.
+
+Uso: python benchmark_compactos.py [cantidad_por_tipo]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from entities.categorias import EstadoConservacion
+from entities.objetos_hogar import (
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+)
+from entities.objetos_compactos import (
+    ElectrodomesticoCompacto, HerramientaCompacta, RopaCompacta, MuebleCompacto,
+    UtensilioCocinaCompacto, ArticuloLimpiezaCompacto
+)
+
+BUENO = EstadoConservacion.BUENO
+
+# (clase normal, clase compacta, argumentos del constructor)
+CASOS: List[Tuple[type, type, tuple]] = [
+    (Electrodomestico, ElectrodomesticoCompacto,
+     ("Refrigerador", "Cocina", "Samsung", 350, BUENO, 25000, 24)),
+    (Herramienta, HerramientaCompacta,
+     ("Taladro", "Garaje", "Metal", BUENO, 1800, True)),
+    (Ropa, RopaCompacta,
+     ("Traje", "Dormitorio", "Lana", "M", BUENO, 3000, "Invierno")),
+    (Mueble, MuebleCompacto,
+     ("Mesa", "Sala", "Roble", "1.2m x 0.8m", BUENO, 4500, "Rústico")),
+    (UtensilioCocina, UtensilioCocinaCompacto,
+     ("Sartén", "Cocina", "Tefal", BUENO, 800, False)),
+    (ArticuloLimpieza, ArticuloLimpiezaCompacto,
+     ("Aspiradora", "Garaje", "Pisos", BUENO, 4500, False)),
+]
+
+def medir_memoria(fabrica: Callable[[], object], cantidad: int) -> float:
+    """Construye `cantidad` objetos y retorna los bytes retenidos por objeto"""
+    gc.collect()
+    tracemalloc.start()
+    objetos = [fabrica() for _ in range(cantidad)]
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objetos
+    return memoria / cantidad
+
+def comparar(cantidad: int) -> List[Dict[str, object]]:
+    resultados = []
+    for normal, compacta, args in CASOS:
+        assert normal(*args).obtener_informacion() == compacta(*args).obtener_informacion()
+        # El tiempo se mide sin tracemalloc, que encarece cada asignación
+        tiempos = {}
+        for clase in (normal, compacta):
+            inicio = time.perf_counter()
+            for _ in range(cantidad):
+                clase(*args)
+            tiempos[clase] = (time.perf_counter() - inicio) / cantidad * 1e9
+        resultados.append({
+            "tipo": normal.__name__,
+            "ns_normal": tiempos[normal],
+            "ns_compacto": tiempos[compacta],
+            "bytes_normal": medir_memoria(lambda: normal(*args), cantidad),
+            "bytes_compacto": medir_memoria(lambda: compacta(*args), cantidad),
+        })
+    return resultados
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"Objetos por tipo: {cantidad:,}")
+    print(f"{'Tipo':<18}{'ns normal':>11}{'ns compacto':>13}"
+          f"{'B normal':>10}{'B compacto':>12}{'ahorro':>9}")
+    for fila in comparar(cantidad):
+        ahorro = 1 - fila["bytes_compacto"] / fila["bytes_normal"]
+        print(f"{fila['tipo']:<18}{fila['ns_normal']:>11.0f}{fila['ns_compacto']:>13.0f}"
+              f"{fila['bytes_normal']:>10.0f}{fila['bytes_compacto']:>12.0f}{ahorro:>9.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmarks de las rutas críticas del inventario sobre casas sintéticas.
+
+Mide construcción, obtener_valor_total, generar_reporte_financiero,
+obtener_inventario_completo, guardado/carga JSON con GestorArchivos y
+el render en consola, para cada tamaño pedido. Los resultados se guardan
+en JSON para comparar entre revisiones.
+
+Por defecto se mide de 1.000 a 10.000.000 objetos. Los casos que arman el
+inventario completo como lista de diccionarios (obtener_inventario_completo,
+JSON y consola) ocupan unos 2,5 KB por objeto, así que sobre
+MAX_INVENTARIO_COMPLETO objetos se omiten y sólo se miden construcción,
+totales y reporte. Aun así 10.000.000 objetos necesitan varios GB de memoria.
+
+Uso:
+    python benchmark_inventario.py --tamanos 1000 10000 100000 --salida base.json
+    python benchmark_inventario.py --salida nuevo.json --comparar base.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Any, Optional
+
+from almacen_columnar import AlmacenColumnar
+from generador_sintetico import generar_casa
+from main import GestorArchivos, mostrar_inventario_consola
+
+TAMANOS_POR_DEFECTO = [1000, 10000, 100000, 1000000, 10000000]
+MAX_INVENTARIO_COMPLETO = 1000000  # objetos; por encima se omiten los casos que lo materializan
+UMBRAL_REGRESION = 1.10  # 10% más lento que la base se reporta como regresión
+
+def _medir(funcion: Callable[[], Any], repeticiones: int) -> Dict[str, float]:
+    """Ejecuta la función varias veces y retorna el mejor tiempo y la mediana"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    return {"mejor_s": tiempos[0], "mediana_s": tiempos[len(tiempos) // 2]}
+
+def _revision() -> Optional[str]:
+    """Commit actual de git, si está disponible"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def medir_tamano(total_objetos: int, habitaciones: int, repeticiones: int,
+                 columnar: bool, semilla: int) -> Dict[str, Dict[str, float]]:
+    """Corre todos los casos sobre una casa de `total_objetos` objetos"""
+    resultados: Dict[str, Dict[str, float]] = {}
+    casas = []
+
+    def construir():
+        almacen = AlmacenColumnar() if columnar else None
+        casas.append(generar_casa(total_objetos, habitaciones, semilla=semilla, almacen=almacen))
+
+    resultados["construccion"] = _medir(construir, 1)
+    casa = casas[-1]
+    casas.clear()
+
+    resultados["obtener_valor_total"] = _medir(
+        lambda: [h.obtener_valor_total() for h in casa.habitaciones], repeticiones)
+
+    def reporte_sin_cache():
+        casa._reporte_cache = None
+        casa.generar_reporte_financiero()
+
+    resultados["generar_reporte_financiero"] = _medir(reporte_sin_cache, repeticiones)
+    if total_objetos > MAX_INVENTARIO_COMPLETO:
+        print(f"  (inventario completo, JSON y consola omitidos: más de "
+              f"{MAX_INVENTARIO_COMPLETO:,} objetos)", file=sys.stderr)
+        return _por_objeto(resultados, total_objetos)
+
+    resultados["obtener_inventario_completo"] = _medir(
+        casa.obtener_inventario_completo, repeticiones)
+
+    inventario = casa.obtener_inventario_completo()
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "inventario.json")
+        silencio = io.StringIO()
+        with contextlib.redirect_stdout(silencio):
+            resultados["guardar_json"] = _medir(
+                lambda: GestorArchivos.guardar_inventario_json(inventario, archivo), repeticiones)
+            resultados["cargar_json"] = _medir(
+                lambda: GestorArchivos.cargar_inventario_json(archivo), repeticiones)
+    del inventario
+
+    with open(os.devnull, "w", encoding="utf-8") as nulo:
+        with contextlib.redirect_stdout(nulo):
+            resultados["mostrar_inventario_consola"] = _medir(
+                lambda: mostrar_inventario_consola(casa), repeticiones)
+    return _por_objeto(resultados, total_objetos)
+
+def _por_objeto(resultados: Dict[str, Dict[str, float]],
+                total_objetos: int) -> Dict[str, Dict[str, float]]:
+    for caso in resultados.values():
+        caso["ns_por_objeto"] = caso["mejor_s"] / total_objetos * 1e9
+    return resultados
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any]) -> List[str]:
+    """Lista los casos cuyo mejor tiempo empeoró más que UMBRAL_REGRESION"""
+    regresiones = []
+    for tamano, casos in actual["resultados"].items():
+        casos_base = base.get("resultados", {}).get(tamano, {})
+        for caso, medida in casos.items():
+            if caso not in casos_base or casos_base[caso]["mejor_s"] <= 0:
+                continue
+            razon = medida["mejor_s"] / casos_base[caso]["mejor_s"]
+            if razon > UMBRAL_REGRESION:
+                regresiones.append(f"{tamano} {caso}: {razon:.2f}x más lento")
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del inventario del hogar")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS_POR_DEFECTO,
+                        help="cantidades de objetos a medir (hasta 10000000)")
+    parser.add_argument("--habitaciones", type=int, default=20)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--columnar", action="store_true",
+                        help="construir las casas sobre AlmacenColumnar")
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="resultados JSON de otra revisión")
+    args = parser.parse_args()
+
+    reporte: Dict[str, Any] = {
+        "revision": _revision(),
+        "fecha": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {
+            "habitaciones": args.habitaciones,
+            "repeticiones": args.repeticiones,
+            "semilla": args.semilla,
+            "columnar": args.columnar,
+        },
+        "resultados": {},
+    }
+
+    for tamano in args.tamanos:
+        print(f"Midiendo {tamano:,} objetos...", file=sys.stderr)
+        casos = medir_tamano(tamano, args.habitaciones, args.repeticiones,
+                             args.columnar, args.semilla)
+        reporte["resultados"][str(tamano)] = casos
+        for caso, medida in casos.items():
+            print(f"  {caso:<30}{medida['mejor_s']:>10.4f} s"
+                  f"{medida['ns_por_objeto']:>12.0f} ns/objeto", file=sys.stderr)
+
+    salida = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(salida)
+    else:
+        print(salida)
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            regresiones = comparar(reporte, json.load(f))
+        for regresion in regresiones:
+            print(f"REGRESIÓN {regresion}", file=sys.stderr)
+        if regresiones:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
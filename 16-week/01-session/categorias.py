@@ -4,9 +4,11 @@ Define la clase base abstracta y las categorías específicas.
 """
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import json
-from datetime import datetime
+from datetime import date, datetime
+
+from .depreciacion import MATERIAL_COMUN, meses_transcurridos, hoy
 
 class Categoria(Enum):
     """Enumeración de categorías disponibles"""
@@ -27,15 +29,24 @@ class EstadoConservacion(Enum):
 class ObjetoHogar(ABC):
     """Clase abstracta base para todos los objetos del hogar"""
     
+    # Sin atributos propios en slots: las subclases normales siguen usando
+    # __dict__ y las compactas (objetos_compactos) pueden prescindir de él
+    __slots__ = ()
+    
+    # Registro de obtener_informacion() en caché: (día en que se armó, registro).
+    # Se descarta al cambiar un atributo; el día entra porque el valor actual
+    # depende de la fecha.
+    _informacion: Optional[Tuple[date, Dict[str, Any]]] = None
+    
     def __init__(self, nombre: str, categoria: Categoria, ubicacion: str, 
                  estado: EstadoConservacion = EstadoConservacion.BUENO, 
-                 valor_estimado: float = 0.0):
+                 valor_estimado: float = 0.0, fecha_adquisicion: Optional[datetime] = None):
         self._nombre = nombre
         self._categoria = categoria
         self._ubicacion = ubicacion
         self._estado = estado
         self._valor_estimado = valor_estimado
-        self._fecha_adquisicion = datetime.now()
+        self._fecha_adquisicion = fecha_adquisicion if fecha_adquisicion is not None else datetime.now()
     
     @property
     def nombre(self) -> str:
@@ -57,14 +68,62 @@ class ObjetoHogar(ABC):
     def valor_estimado(self) -> float:
         return self._valor_estimado
     
+    # Estado y valor no tienen setter público: se cambian con
+    # Habitacion.cambiar_estado_objeto / actualizar_valor_objeto, que además
+    # actualizan los totales, el almacén y los índices
+    def _asignar_estado(self, estado: EstadoConservacion):
+        if not isinstance(estado, EstadoConservacion):
+            raise TypeError("El estado debe ser un EstadoConservacion")
+        self._estado = estado
+        self._informacion = None
+    
+    def _asignar_valor_estimado(self, valor: float):
+        if valor < 0:
+            raise ValueError("El valor estimado no puede ser negativo")
+        self._valor_estimado = valor
+        self._informacion = None
+    
+    @property
+    def fecha_adquisicion(self) -> datetime:
+        return self._fecha_adquisicion
+    
+    def _asignar_fecha_adquisicion(self, fecha: datetime):
+        """Usado al reconstruir objetos guardados (ver desde_informacion)"""
+        self._fecha_adquisicion = fecha
+        self._informacion = None
+    
+    def meses_uso(self, fecha: Optional[date] = None) -> int:
+        """Meses completos desde la adquisición hasta la fecha indicada (hoy por defecto)"""
+        return meses_transcurridos(
+            self.fecha_adquisicion, fecha if fecha is not None else hoy()
+        )
+    
+    @property
+    def codigo_material(self) -> int:
+        """Código de material usado por el motor de depreciación"""
+        return MATERIAL_COMUN
+    
     @abstractmethod
-    def calcular_valor_actual(self) -> float:
-        """Calcula el valor actual considerando depreciación"""
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
+        """Calcula el valor a la fecha indicada (hoy por defecto) considerando depreciación"""
         pass
     
-    @abstractmethod
     def obtener_informacion(self) -> Dict[str, Any]:
-        """Retorna información detallada del objeto"""
+        """
+        Retorna información detallada del objeto.
+        El registro se arma una vez (ver _crear_informacion) y se reutiliza
+        mientras el objeto no cambie; se retorna una copia para que quien lo
+        reciba pueda modificarlo.
+        """
+        dia = hoy()
+        informacion = self._informacion
+        if informacion is None or informacion[0] != dia:
+            informacion = self._informacion = (dia, self._crear_informacion())
+        return informacion[1].copy()
+    
+    @abstractmethod
+    def _crear_informacion(self) -> Dict[str, Any]:
+        """Arma el registro de información del objeto"""
         pass
     
     def __str__(self) -> str:
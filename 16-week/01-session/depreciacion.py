@@ -0,0 +1,189 @@
+"""
+Módulo del motor de depreciación.
+Calcula el valor de uno o de muchos objetos a partir de su valor estimado,
+un código de tipo, un código de material y los meses de uso, buscando el
+factor en tablas mensuales precalculadas.
+"""
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Sequence, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional, sin él se usa el cálculo en Python
+    np = None
+
+# Códigos de tipo de objeto (se guardan como int8)
+TIPO_ELECTRODOMESTICO = 0
+TIPO_HERRAMIENTA = 1
+TIPO_ROPA = 2
+TIPO_MUEBLE = 3
+TIPO_UTENSILIO_COCINA = 4
+TIPO_ARTICULO_LIMPIEZA = 5
+
+# Códigos de material (sólo los muebles los distinguen)
+MATERIAL_COMUN = 0
+MATERIAL_NOBLE = 1
+
+MATERIALES_NOBLES = ("madera solida", "roble", "caoba")
+
+# Tasa de depreciación anual (lineal) por tipo y material
+TASAS_DEPRECIACION = {
+    TIPO_ELECTRODOMESTICO: {MATERIAL_COMUN: 0.15, MATERIAL_NOBLE: 0.15},
+    TIPO_HERRAMIENTA: {MATERIAL_COMUN: 0.08, MATERIAL_NOBLE: 0.08},
+    TIPO_ROPA: {MATERIAL_COMUN: 0.3, MATERIAL_NOBLE: 0.3},
+    TIPO_MUEBLE: {MATERIAL_COMUN: 0.1, MATERIAL_NOBLE: 0.05},
+    TIPO_UTENSILIO_COCINA: {MATERIAL_COMUN: 0.12, MATERIAL_NOBLE: 0.12},
+    TIPO_ARTICULO_LIMPIEZA: {MATERIAL_COMUN: 0.4, MATERIAL_NOBLE: 0.4},
+}
+
+def _tabla_mensual(tasa: float) -> List[float]:
+    """Factor (1 - depreciación) para cada mes de uso, hasta llegar a cero"""
+    tabla = []
+    meses = 0
+    while True:
+        factor = max(0.0, 1 - tasa * (meses / 12))
+        tabla.append(factor)
+        if factor == 0.0:
+            return tabla
+        meses += 1
+
+# Factores precalculados por mes de uso: TABLAS_MENSUALES[tipo][material][meses].
+# Pasado el último mes de la tabla el factor se queda en cero.
+TABLAS_MENSUALES: List[List[List[float]]] = [
+    [_tabla_mensual(tasas[MATERIAL_COMUN]), _tabla_mensual(tasas[MATERIAL_NOBLE])]
+    for _, tasas in sorted(TASAS_DEPRECIACION.items())
+]
+MESES_TABLA = max(len(tabla) for tablas in TABLAS_MENSUALES for tabla in tablas)
+
+if np is not None:
+    # Las tablas se rellenan con ceros hasta MESES_TABLA y se agrega una
+    # columna final en cero para los objetos aún no adquiridos (meses < 0)
+    _TABLAS_NP = np.zeros((len(TABLAS_MENSUALES), 2, MESES_TABLA + 1), dtype=np.float64)
+    for _tipo, _tablas in enumerate(TABLAS_MENSUALES):
+        for _material, _tabla in enumerate(_tablas):
+            _TABLAS_NP[_tipo, _material, :len(_tabla)] = _tabla
+else:
+    _TABLAS_NP = None
+
+_hoy: Optional[date] = None
+_vence_hoy = 0.0  # instante (time.time) en que empieza el día siguiente
+
+def hoy() -> date:
+    """
+    Fecha local de hoy. Se guarda hasta la medianoche, así que cuesta una
+    llamada a time.time() en lugar de una a date.today() por objeto valuado.
+    """
+    global _hoy, _vence_hoy
+    if time.time() >= _vence_hoy:
+        _hoy = date.today()
+        _vence_hoy = datetime.combine(_hoy + timedelta(days=1), datetime.min.time()).timestamp()
+    return _hoy
+
+# Las fechas se codifican como un entero (mes absoluto * 32 + día) para
+# poder calcular meses de uso en lote sin crear objetos date
+DIAS_CODIGO = 32
+
+def codigo_fecha(fecha: date) -> int:
+    """Codifica una fecha (date o datetime) para calcular meses de uso en lote"""
+    return (fecha.year * 12 + fecha.month - 1) * DIAS_CODIGO + fecha.day
+
+def meses_transcurridos(desde: date, hasta: date) -> int:
+    """Meses completos entre dos fechas (negativo si `hasta` es anterior)"""
+    meses = (hasta.year - desde.year) * 12 + hasta.month - desde.month
+    if hasta.day < desde.day:
+        meses -= 1
+    return meses
+
+def _meses_por_codigo(codigo_adquisicion: int, codigo_referencia: int) -> int:
+    meses = codigo_referencia // DIAS_CODIGO - codigo_adquisicion // DIAS_CODIGO
+    if codigo_referencia % DIAS_CODIGO < codigo_adquisicion % DIAS_CODIGO:
+        meses -= 1
+    return meses
+
+def factor_depreciacion(codigo_tipo: int, codigo_material: int, meses_uso: int) -> float:
+    """Factor del valor que conserva un objeto con esos meses de uso"""
+    if meses_uso < 0:
+        return 0.0  # todavía no se había adquirido
+    tabla = TABLAS_MENSUALES[codigo_tipo][codigo_material]
+    return tabla[meses_uso] if meses_uso < len(tabla) else 0.0
+
+
+def codigo_material(material: str) -> int:
+    """Clasifica el material de un mueble (se llama una sola vez al crearlo)"""
+    return MATERIAL_NOBLE if material.lower() in MATERIALES_NOBLES else MATERIAL_COMUN
+
+
+def calcular_valor_actual(valor_estimado: float, codigo_tipo: int,
+                          codigo_material: int = MATERIAL_COMUN, meses_uso: int = 0) -> float:
+    """Calcula el valor de un solo objeto con los meses de uso indicados"""
+    return max(0, valor_estimado * factor_depreciacion(codigo_tipo, codigo_material, meses_uso))
+
+
+def calcular_valores_actuales(valores: Sequence[float], codigos_tipo: Sequence[int],
+                              codigos_material: Sequence[int],
+                              codigos_adquisicion: Sequence[int],
+                              fecha: Optional[date] = None
+                              ) -> Union[List[float], "np.ndarray"]:
+    """
+    Calcula el valor de muchos objetos a la fecha indicada (hoy por defecto).
+    Las fechas de adquisición van codificadas con codigo_fecha.
+    Con NumPy disponible retorna un ndarray, si no una lista.
+    """
+    referencia = codigo_fecha(fecha if fecha is not None else hoy())
+    if np is not None:
+        v = np.asarray(valores, dtype=np.float64)
+        t = np.asarray(codigos_tipo, dtype=np.intp)
+        m = np.asarray(codigos_material, dtype=np.intp)
+        return np.maximum(v * _TABLAS_NP[t, m, _meses_np(codigos_adquisicion, referencia)], 0.0)
+
+    tablas = TABLAS_MENSUALES
+    resultado = []
+    for v, t, m, c in zip(valores, codigos_tipo, codigos_material, codigos_adquisicion):
+        meses = _meses_por_codigo(c, referencia)
+        tabla = tablas[t][m]
+        factor = tabla[meses] if 0 <= meses < len(tabla) else 0.0
+        resultado.append(max(0, v * factor))
+    return resultado
+
+
+def _meses_np(codigos_adquisicion: Sequence[int], referencia: int) -> "np.ndarray":
+    """Meses de uso como índices de _TABLAS_NP (los negativos van a la columna en cero)"""
+    c = np.asarray(codigos_adquisicion, dtype=np.int64)
+    meses = referencia // DIAS_CODIGO - c // DIAS_CODIGO
+    meses -= (referencia % DIAS_CODIGO < c % DIAS_CODIGO)
+    return np.where(meses < 0, MESES_TABLA, np.minimum(meses, MESES_TABLA))
+
+
+def curva_valores(valores: Sequence[float], codigos_tipo: Sequence[int],
+                  codigos_material: Sequence[int], codigos_adquisicion: Sequence[int],
+                  fechas: Sequence[date]) -> List[float]:
+    """
+    Valor total de un conjunto de objetos en cada una de las fechas indicadas.
+    Los objetos adquiridos después de una fecha no suman en ella.
+    """
+    if np is not None:
+        v = np.asarray(valores, dtype=np.float64)
+        t = np.asarray(codigos_tipo, dtype=np.intp)
+        m = np.asarray(codigos_material, dtype=np.intp)
+        c = np.asarray(codigos_adquisicion, dtype=np.int64)
+        return [float(np.maximum(v * _TABLAS_NP[t, m, _meses_np(c, codigo_fecha(f))], 0.0).sum())
+                for f in fechas]
+
+    # Se agrupan los objetos por (tabla, fecha de adquisición) para hacer una
+    # búsqueda en la tabla por grupo y fecha en lugar de una por objeto
+    grupos: Dict[Tuple[int, int, int], float] = {}
+    for v, t, m, c in zip(valores, codigos_tipo, codigos_material, codigos_adquisicion):
+        clave = (t, m, c)
+        grupos[clave] = grupos.get(clave, 0.0) + v
+    curva = []
+    for f in fechas:
+        referencia = codigo_fecha(f)
+        total = 0.0
+        for (t, m, c), v in grupos.items():
+            meses = _meses_por_codigo(c, referencia)
+            tabla = TABLAS_MENSUALES[t][m]
+            if 0 <= meses < len(tabla):
+                total += v * tabla[meses]
+        curva.append(total)
+    return curva
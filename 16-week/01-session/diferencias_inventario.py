@@ -0,0 +1,321 @@
+"""
+Módulo de comparación de inventarios por huellas de contenido.
+Cada objeto tiene un hash de su registro (obtener_informacion sin el valor
+actual, que cambia con la fecha); cada habitación suma los hashes de sus
+objetos agrupados en cubetas, y la casa combina los hashes de sus
+habitaciones, al estilo de un árbol de Merkle. Al comparar dos huellas se
+saltean las habitaciones y las cubetas iguales, así el costo depende de
+cuántos objetos cambiaron y no del tamaño del inventario.
+
+Un objeto se identifica por sus datos fijos (todo menos estado y valor): si
+eso cambia, el objeto figura como eliminado y agregado; si sólo cambian
+estado o valor, figura como modificado.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from entities.categorias import EstadoConservacion, ObjetoHogar
+from entities.objetos_hogar import crear_desde_informacion
+from main import (
+    Casa, Habitacion, OBJETO_AGREGADO, OBJETO_ELIMINADO, OBJETO_MODIFICADO,
+    HABITACION_AGREGADA
+)
+
+BITS_HASH = 128
+MODULO_HASH = 1 << BITS_HASH
+BITS_CUBETA = 12  # hasta 4096 cubetas por habitación (sólo se guardan las no vacías)
+
+# Campos que no forman parte de la huella: dependen de la fecha de consulta
+CAMPOS_DERIVADOS = frozenset({"valor_actual"})
+# Campos que Habitacion permite modificar sin cambiar la identidad del objeto
+CAMPOS_MODIFICABLES = ("estado", "valor_original")
+
+class ErrorDiferencias(Exception):
+    """El conjunto de cambios no corresponde al estado de la casa"""
+
+def _digerir(texto: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(texto.encode('utf-8'), digest_size=BITS_HASH // 8).digest(), 'big'
+    )
+
+def _canonico(datos: Dict[str, Any]) -> str:
+    return json.dumps(datos, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+def _normalizar(valor: Any) -> Any:
+    """
+    Los números se digieren como float: según el almacén (lista, columnar o
+    snapshot) el mismo valor llega como 4500 o como 4500.0
+    """
+    if isinstance(valor, int) and not isinstance(valor, bool):
+        return float(valor)
+    return valor
+
+def huella_registro(registro: Dict[str, Any]) -> Tuple[int, int, Dict[str, Any]]:
+    """Retorna (clave de identidad, hash de contenido, registro sin campos derivados)"""
+    contenido = {campo: valor for campo, valor in registro.items()
+                 if campo not in CAMPOS_DERIVADOS}
+    identidad = _canonico({campo: _normalizar(valor) for campo, valor in contenido.items()
+                           if campo not in CAMPOS_MODIFICABLES})
+    # El contenido se digiere a partir de la identidad ya serializada: sólo
+    # se agregan los campos modificables, sin volver a serializar todo
+    modificables = _canonico([_normalizar(contenido.get(campo)) for campo in CAMPOS_MODIFICABLES])
+    return _digerir(identidad), _digerir(f"{identidad}\0{modificables}"), contenido
+
+class CambiosInventario(NamedTuple):
+    """Conjunto de cambios entre dos inventarios; se aplica con aplicar_cambios"""
+    habitaciones_agregadas: List[Tuple[str, float]]  # (nombre, metros cuadrados)
+    habitaciones_modificadas: List[Tuple[str, float]]  # metros cuadrados nuevos
+    habitaciones_eliminadas: List[str]
+    agregados: List[Tuple[str, Dict[str, Any]]]  # (habitación, registro)
+    eliminados: List[Tuple[str, Dict[str, Any]]]
+    modificados: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]  # (habitación, antes, después)
+
+    @property
+    def vacio(self) -> bool:
+        return not any(self)
+
+class HuellaHabitacion:
+    """Huellas de los objetos de una habitación agrupadas por cubeta"""
+
+    def __init__(self, nombre: str, metros_cuadrados: float):
+        self.nombre = nombre
+        self.metros_cuadrados = metros_cuadrados
+        # cubeta -> clave -> hash de contenido -> [cantidad, registro]
+        self._cubetas: Dict[int, Dict[int, Dict[int, List]]] = {}
+        # cubeta -> suma de los hashes de contenido de sus objetos
+        self._sumas: Dict[int, int] = {}
+        self._suma = 0
+        self.total_objetos = 0
+
+    @property
+    def hash(self) -> int:
+        return _digerir(f"{self.nombre}\0{float(self.metros_cuadrados)!r}\0{self._suma}")
+
+    def agregar(self, clave: int, contenido: int, registro: Dict[str, Any]):
+        cubeta = clave >> (BITS_HASH - BITS_CUBETA)
+        entradas = self._cubetas.setdefault(cubeta, {}).setdefault(clave, {})
+        entrada = entradas.get(contenido)
+        if entrada is None:
+            entradas[contenido] = [1, registro]
+        else:
+            entrada[0] += 1
+        self._sumas[cubeta] = (self._sumas.get(cubeta, 0) + contenido) % MODULO_HASH
+        self._suma = (self._suma + contenido) % MODULO_HASH
+        self.total_objetos += 1
+
+    def quitar(self, clave: int, contenido: int):
+        cubeta = clave >> (BITS_HASH - BITS_CUBETA)
+        claves = self._cubetas[cubeta]
+        entradas = claves[clave]
+        entradas[contenido][0] -= 1
+        if entradas[contenido][0] == 0:
+            del entradas[contenido]
+            if not entradas:
+                del claves[clave]
+                if not claves:
+                    del self._cubetas[cubeta]
+        self._sumas[cubeta] = (self._sumas[cubeta] - contenido) % MODULO_HASH
+        if cubeta not in self._cubetas:
+            del self._sumas[cubeta]
+        self._suma = (self._suma - contenido) % MODULO_HASH
+        self.total_objetos -= 1
+
+    def cubetas_distintas(self, otra: "HuellaHabitacion") -> Iterator[int]:
+        for cubeta in self._sumas.keys() | otra._sumas.keys():
+            if self._sumas.get(cubeta) != otra._sumas.get(cubeta):
+                yield cubeta
+
+    def entradas(self, cubeta: int) -> Dict[int, Dict[int, List]]:
+        return self._cubetas.get(cubeta, {})
+
+class HuellaCasa:
+    """
+    Huella de una casa. Se arma desde una Casa o desde un inventario JSON
+    (obtener_inventario_completo); con seguir=True se mantiene al día con
+    los cambios de la casa, así comparar no necesita recorrerla.
+    """
+
+    def __init__(self, nombre: str, direccion: str):
+        self.nombre = nombre
+        self.direccion = direccion
+        self._habitaciones: Dict[str, HuellaHabitacion] = {}
+        # id de objeto -> (huella de su habitación, clave, hash de contenido)
+        self._objetos: Dict[int, Tuple[HuellaHabitacion, int, int]] = {}
+
+    @property
+    def habitaciones(self) -> Dict[str, HuellaHabitacion]:
+        return dict(self._habitaciones)
+
+    @property
+    def hash(self) -> int:
+        return _digerir(_canonico({
+            "nombre": self.nombre, "direccion": self.direccion,
+            "habitaciones": sorted(
+                (nombre, huella.hash) for nombre, huella in self._habitaciones.items()
+            )
+        }))
+
+    @classmethod
+    def desde_casa(cls, casa: Casa, seguir: bool = False) -> "HuellaCasa":
+        huella = cls(casa._nombre, casa._direccion)
+        for habitacion in casa.habitaciones:
+            huella._agregar_habitacion(habitacion)
+        if seguir:
+            casa.agregar_observador_objetos(huella._registrar_evento)
+        return huella
+
+    @classmethod
+    def desde_inventario(cls, inventario: Dict[str, Any]) -> "HuellaCasa":
+        huella = cls(inventario["casa"]["nombre"], inventario["casa"]["direccion"])
+        for nombre, datos in inventario["habitaciones"].items():
+            habitacion = huella._habitaciones[nombre] = HuellaHabitacion(
+                nombre, datos["metros_cuadrados"]
+            )
+            for registro in datos["objetos"]:
+                habitacion.agregar(*huella_registro(registro))
+        return huella
+
+    def _agregar_habitacion(self, habitacion: Habitacion):
+        huella = self._habitaciones[habitacion.nombre] = HuellaHabitacion(
+            habitacion.nombre, habitacion.obtener_resumen()["metros_cuadrados"]
+        )
+        for id_objeto, objeto in habitacion.iterar_con_ids():
+            self._agregar_objeto(huella, id_objeto, objeto)
+
+    def _agregar_objeto(self, huella: HuellaHabitacion, id_objeto: int, objeto: ObjetoHogar):
+        clave, contenido, registro = huella_registro(objeto.obtener_informacion())
+        huella.agregar(clave, contenido, registro)
+        self._objetos[id_objeto] = (huella, clave, contenido)
+
+    def _quitar_objeto(self, id_objeto: int) -> HuellaHabitacion:
+        huella, clave, contenido = self._objetos.pop(id_objeto)
+        huella.quitar(clave, contenido)
+        return huella
+
+    def _registrar_evento(self, evento: str, habitacion: Habitacion,
+                          id_objeto: Optional[int], objeto: Optional[ObjetoHogar]):
+        if evento == HABITACION_AGREGADA:
+            self._agregar_habitacion(habitacion)
+        elif evento == OBJETO_AGREGADO:
+            self._agregar_objeto(self._habitaciones[habitacion.nombre], id_objeto, objeto)
+        elif evento == OBJETO_ELIMINADO:
+            self._quitar_objeto(id_objeto)
+        elif evento == OBJETO_MODIFICADO:
+            self._agregar_objeto(self._quitar_objeto(id_objeto), id_objeto, objeto)
+
+def _expandir(entradas: Dict[int, List], otras: Dict[int, List]) -> List[Dict[str, Any]]:
+    """Registros que están en `entradas` más veces que en `otras`"""
+    sobrantes = []
+    for contenido, (cantidad, registro) in entradas.items():
+        otra = otras.get(contenido)
+        sobrantes.extend([registro] * (cantidad - (otra[0] if otra else 0)))
+    return sobrantes
+
+def _comparar_habitaciones(antes: HuellaHabitacion, despues: HuellaHabitacion,
+                           cambios: CambiosInventario):
+    nombre = despues.nombre
+    for cubeta in antes.cubetas_distintas(despues):
+        claves_antes, claves_despues = antes.entradas(cubeta), despues.entradas(cubeta)
+        for clave in claves_antes.keys() | claves_despues.keys():
+            anteriores = claves_antes.get(clave, {})
+            nuevos = claves_despues.get(clave, {})
+            quitados = _expandir(anteriores, nuevos)
+            puestos = _expandir(nuevos, anteriores)
+            # Con la misma identidad, un registro que se va y otro que llega
+            # son el mismo objeto con otro estado o valor
+            pares = min(len(quitados), len(puestos))
+            cambios.modificados.extend(
+                (nombre, anterior, nuevo) for anterior, nuevo in zip(quitados, puestos)
+            )
+            cambios.eliminados.extend((nombre, registro) for registro in quitados[pares:])
+            cambios.agregados.extend((nombre, registro) for registro in puestos[pares:])
+
+def comparar(antes: HuellaCasa, despues: HuellaCasa) -> CambiosInventario:
+    """Cambios que llevan del inventario `antes` al inventario `despues`"""
+    cambios = CambiosInventario([], [], [], [], [], [])
+    if antes.hash == despues.hash:
+        return cambios
+    for nombre, nueva in despues._habitaciones.items():
+        anterior = antes._habitaciones.get(nombre)
+        if anterior is None:
+            cambios.habitaciones_agregadas.append((nombre, nueva.metros_cuadrados))
+            anterior = HuellaHabitacion(nombre, nueva.metros_cuadrados)
+        elif anterior.hash == nueva.hash:
+            continue
+        elif anterior.metros_cuadrados != nueva.metros_cuadrados:
+            cambios.habitaciones_modificadas.append((nombre, nueva.metros_cuadrados))
+        _comparar_habitaciones(anterior, nueva, cambios)
+    for nombre, anterior in antes._habitaciones.items():
+        if nombre not in despues._habitaciones:
+            cambios.habitaciones_eliminadas.append(nombre)
+            _comparar_habitaciones(anterior, HuellaHabitacion(nombre, 0), cambios)
+    return cambios
+
+def aplicar_cambios(casa: Casa, cambios: CambiosInventario):
+    """
+    Aplica un conjunto de cambios a una casa que está en el estado `antes`.
+    Primero se verifican las habitaciones de todas las secciones y se ubican
+    todos los objetos afectados; si algo falta, se lanza ErrorDiferencias sin
+    haber modificado la casa. Las habitaciones eliminadas quedan vacías:
+    Casa no permite quitar habitaciones.
+    """
+    habitaciones = {habitacion.nombre: habitacion for habitacion in casa.habitaciones}
+    afectados: Dict[str, Tuple[List, List]] = {}
+    for nombre, registro in cambios.eliminados:
+        afectados.setdefault(nombre, ([], []))[0].append(registro)
+    for nombre, anterior, nuevo in cambios.modificados:
+        afectados.setdefault(nombre, ([], []))[1].append((anterior, nuevo))
+
+    # Los objetos agregados pueden ir a una habitación que agrega el mismo conjunto
+    nuevas = {nombre for nombre, _ in cambios.habitaciones_agregadas}
+    existentes = [nombre for nombre, _ in cambios.habitaciones_modificadas]
+    existentes.extend(afectados)
+    faltantes = [nombre for nombre in existentes if nombre not in habitaciones]
+    faltantes.extend(nombre for nombre, _ in cambios.agregados
+                     if nombre not in habitaciones and nombre not in nuevas)
+    if faltantes:
+        raise ErrorDiferencias(f"La casa no tiene la habitación {faltantes[0]}")
+
+    planes = []
+    for nombre, (eliminados, modificados) in afectados.items():
+        habitacion = habitaciones[nombre]
+        # Sólo se recorren las habitaciones con objetos eliminados o modificados
+        ubicaciones: Dict[int, List[Tuple[int, int]]] = {}
+        for posicion, (id_objeto, objeto) in enumerate(habitacion.iterar_con_ids()):
+            contenido = huella_registro(objeto.obtener_informacion())[1]
+            ubicaciones.setdefault(contenido, []).append((posicion, id_objeto))
+
+        def ubicar(registro: Dict[str, Any]) -> Tuple[int, int]:
+            lista = ubicaciones.get(huella_registro(registro)[1])
+            if not lista:
+                raise ErrorDiferencias(f"{registro['nombre']} no está en la habitación {nombre}")
+            return lista.pop()
+
+        planes.append((
+            habitacion,
+            [(ubicar(anterior)[1], nuevo) for anterior, nuevo in modificados],
+            sorted((ubicar(registro)[0] for registro in eliminados), reverse=True)
+        ))
+
+    for nombre, metros_cuadrados in cambios.habitaciones_modificadas:
+        habitaciones[nombre]._metros_cuadrados = metros_cuadrados
+    for nombre, metros_cuadrados in cambios.habitaciones_agregadas:
+        if nombre not in habitaciones:
+            habitaciones[nombre] = casa.crear_habitacion(nombre, metros_cuadrados)
+
+    for habitacion, modificados, posiciones in planes:
+        for id_objeto, nuevo in modificados:
+            objeto = habitacion.obtener_objeto_por_id(id_objeto)
+            estado = EstadoConservacion(nuevo["estado"])
+            if objeto.estado != estado:
+                habitacion.cambiar_estado_objeto(habitacion.posicion_de(id_objeto), estado)
+            if objeto.valor_estimado != nuevo["valor_original"]:
+                habitacion.actualizar_valor_objeto(habitacion.posicion_de(id_objeto),
+                                                   nuevo["valor_original"])
+        # De la última posición a la primera, así las anteriores no se corren
+        for posicion in posiciones:
+            habitacion.eliminar_objeto(posicion)
+
+    for nombre, registro in cambios.agregados:
+        habitaciones[nombre].agregar_objeto(crear_desde_informacion(registro))
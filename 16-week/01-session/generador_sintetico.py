@@ -0,0 +1,107 @@
+"""
+Generador de inventarios sintéticos reproducibles.
+Construye casas con la cantidad de habitaciones y objetos que se pida,
+mezclando las seis subclases de entities en la proporción indicada.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Type
+
+from entities.categorias import ObjetoHogar, EstadoConservacion
+from entities.objetos_hogar import (
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+)
+from almacen_columnar import AlmacenColumnar
+from main import Casa, Habitacion
+
+MEZCLA_UNIFORME: Dict[Type[ObjetoHogar], float] = {
+    Electrodomestico: 1, Herramienta: 1, Ropa: 1,
+    Mueble: 1, UtensilioCocina: 1, ArticuloLimpieza: 1,
+}
+
+NOMBRES_HABITACION = ["Cocina", "Sala", "Dormitorio", "Garaje", "Baño", "Estudio", "Comedor"]
+ESTADOS = list(EstadoConservacion)
+MARCAS = ["Samsung", "LG", "Sony", "Philips", "Whirlpool"]
+MATERIALES = ["Madera", "Roble", "Caoba", "Metal", "Plástico", "Vidrio", "Madera Solida"]
+TELAS = ["Algodón", "Lana", "Seda", "Poliéster"]
+TALLAS = ["XS", "S", "M", "L", "XL"]
+TEMPORADAS = ["Verano", "Invierno", "Todo el año"]
+ESTILOS = ["Moderno", "Rústico", "Clásico", "Contemporáneo"]
+TIPOS_LIMPIEZA = ["Pisos", "Superficies", "Textiles", "Vidrios"]
+ANTIGUEDAD_MAXIMA_DIAS = 10 * 365
+
+def _fabrica(tipo: Type[ObjetoHogar]) -> Callable[[random.Random, str, datetime], ObjetoHogar]:
+    """Función que crea un objeto aleatorio del tipo indicado"""
+    def estado(r: random.Random) -> EstadoConservacion:
+        return r.choice(ESTADOS)
+
+    def valor(r: random.Random) -> float:
+        return round(r.uniform(50, 30000), 2)
+
+    if tipo is Electrodomestico:
+        return lambda r, ubicacion, fecha: Electrodomestico(
+            f"Electrodoméstico {r.randrange(1000)}", ubicacion, r.choice(MARCAS),
+            r.randrange(10, 3000), estado(r), valor(r), r.choice([6, 12, 24, 36]),
+            fecha_adquisicion=fecha)
+    if tipo is Herramienta:
+        return lambda r, ubicacion, fecha: Herramienta(
+            f"Herramienta {r.randrange(1000)}", ubicacion, r.choice(MATERIALES),
+            estado(r), valor(r), r.random() < 0.5,
+            fecha_adquisicion=fecha)
+    if tipo is Ropa:
+        return lambda r, ubicacion, fecha: Ropa(
+            f"Prenda {r.randrange(1000)}", ubicacion, r.choice(TELAS), r.choice(TALLAS),
+            estado(r), valor(r), r.choice(TEMPORADAS),
+            fecha_adquisicion=fecha)
+    if tipo is Mueble:
+        return lambda r, ubicacion, fecha: Mueble(
+            f"Mueble {r.randrange(1000)}", ubicacion, r.choice(MATERIALES), "1.0m x 1.0m",
+            estado(r), valor(r), r.choice(ESTILOS),
+            fecha_adquisicion=fecha)
+    if tipo is UtensilioCocina:
+        return lambda r, ubicacion, fecha: UtensilioCocina(
+            f"Utensilio {r.randrange(1000)}", ubicacion, r.choice(MATERIALES),
+            estado(r), valor(r), r.random() < 0.3,
+            fecha_adquisicion=fecha)
+    if tipo is ArticuloLimpieza:
+        return lambda r, ubicacion, fecha: ArticuloLimpieza(
+            f"Artículo {r.randrange(1000)}", ubicacion, r.choice(TIPOS_LIMPIEZA),
+            estado(r), valor(r), r.random() < 0.5,
+            fecha_adquisicion=fecha)
+    raise TypeError(f"Tipo de objeto no soportado: {tipo.__name__}")
+
+def generar_casa(total_objetos: int, total_habitaciones: int = 10,
+                 mezcla: Optional[Dict[Type[ObjetoHogar], float]] = None,
+                 semilla: int = 0, almacen: Optional[AlmacenColumnar] = None,
+                 nombre: str = "Casa Sintética",
+                 hoy: Optional[datetime] = None) -> Casa:
+    """
+    Genera una casa con `total_objetos` repartidos entre las habitaciones,
+    adquiridos en los últimos ANTIGUEDAD_MAXIMA_DIAS días antes de `hoy`.
+    La misma semilla (y el mismo `hoy`) produce siempre el mismo inventario.
+    """
+    if total_habitaciones < 1:
+        raise ValueError("La casa necesita al menos una habitación")
+    mezcla = mezcla or MEZCLA_UNIFORME
+    hoy = hoy if hoy is not None else datetime.now()
+    r = random.Random(semilla)
+    tipos: List[Type[ObjetoHogar]] = list(mezcla)
+    pesos = [mezcla[tipo] for tipo in tipos]
+    fabricas = [_fabrica(tipo) for tipo in tipos]
+
+    casa = Casa(nombre, f"Calle Sintética {semilla}", almacen)
+    habitaciones: List[Habitacion] = []
+    for i in range(total_habitaciones):
+        nombre_habitacion = f"{NOMBRES_HABITACION[i % len(NOMBRES_HABITACION)]} {i + 1}"
+        habitaciones.append(Habitacion(nombre_habitacion, round(r.uniform(6, 40), 1), almacen))
+
+    # Se elige el tipo de cada objeto de una sola vez para no sortear uno por uno
+    elegidos = r.choices(range(len(tipos)), weights=pesos, k=total_objetos)
+    for i, indice_tipo in enumerate(elegidos):
+        habitacion = habitaciones[i % total_habitaciones]
+        fecha = hoy - timedelta(days=r.randrange(ANTIGUEDAD_MAXIMA_DIAS))
+        habitacion.agregar_objeto(fabricas[indice_tipo](r, habitacion.nombre, fecha))
+
+    for habitacion in habitaciones:
+        casa.agregar_habitacion(habitacion)
+    return casa
@@ -0,0 +1,129 @@
+"""
+Módulo de lectura y escritura concurrente de inventarios JSON con asyncio.
+Variante de GestorArchivos para persistir muchas casas o habitaciones a la
+vez: limita cuántas operaciones hay en curso, escribe cada archivo de forma
+atómica (archivo temporal + rename) y retorna los resultados o los errores
+en lugar de imprimirlos.
+"""
+import asyncio
+import json
+import os
+import stat
+import tempfile
+import weakref
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+MAX_CONCURRENCIA = 32
+
+def _leer_umask() -> int:
+    # os.umask sólo se puede leer cambiándolo: se hace una vez al importar,
+    # y no en los hilos que escriben, donde otro hilo podría crear archivos
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+_UMASK = _leer_umask()
+
+class ResultadoArchivo(NamedTuple):
+    """Resultado de una operación: el valor leído (o None) o la excepción ocurrida"""
+    archivo: str
+    valor: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+def escribir_json_atomico(datos: Any, archivo: str):
+    """
+    Escribe JSON en un temporal del mismo directorio y lo renombra sobre el
+    destino, así el archivo nunca queda escrito a medias.
+    El resultado tiene los permisos que daría open(): los del archivo que
+    reemplaza o, si es nuevo, 0o666 menos la umask (mkstemp crea con 0o600).
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    try:
+        modo = stat.S_IMODE(os.stat(archivo).st_mode)
+    except FileNotFoundError:
+        modo = 0o666 & ~_UMASK
+    descriptor, temporal = tempfile.mkstemp(
+        dir=directorio, prefix=f".{os.path.basename(archivo)}.", suffix=".tmp"
+    )
+    try:
+        os.chmod(temporal, modo)
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, archivo)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+def leer_json(archivo: str) -> Any:
+    with open(archivo, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class GestorArchivosAsync:
+    """Carga y guarda inventarios JSON con a lo sumo `max_concurrencia` en curso"""
+
+    def __init__(self, max_concurrencia: int = MAX_CONCURRENCIA):
+        if max_concurrencia < 1:
+            raise ValueError("La concurrencia máxima debe ser al menos 1")
+        self._max_concurrencia = max_concurrencia
+        # Un semáforo por bucle de eventos: queda ligado al bucle donde se usa
+        # por primera vez, y la misma instancia puede usarse en varios asyncio.run
+        self._semaforos = weakref.WeakKeyDictionary()  # bucle -> asyncio.Semaphore
+
+    def _limite(self) -> asyncio.Semaphore:
+        bucle = asyncio.get_running_loop()
+        semaforo = self._semaforos.get(bucle)
+        if semaforo is None:
+            semaforo = self._semaforos[bucle] = asyncio.Semaphore(self._max_concurrencia)
+        return semaforo
+
+    async def guardar_inventario_json(self, inventario: Dict[str, Any],
+                                      archivo: str) -> ResultadoArchivo:
+        """Guarda un inventario de forma atómica"""
+        async with self._limite():
+            try:
+                await asyncio.to_thread(escribir_json_atomico, inventario, archivo)
+            except Exception as e:
+                return ResultadoArchivo(archivo, error=e)
+        return ResultadoArchivo(archivo)
+
+    async def cargar_inventario_json(self, archivo: str) -> ResultadoArchivo:
+        """Carga un inventario; los errores (incluido FileNotFoundError) se retornan"""
+        async with self._limite():
+            try:
+                datos = await asyncio.to_thread(leer_json, archivo)
+            except Exception as e:
+                return ResultadoArchivo(archivo, error=e)
+        return ResultadoArchivo(archivo, datos)
+
+    async def guardar_varios(self, inventarios: Iterable[Tuple[str, Dict[str, Any]]]
+                             ) -> List[ResultadoArchivo]:
+        """Guarda pares (archivo, inventario); los resultados siguen el orden de entrada"""
+        return await asyncio.gather(*(
+            self.guardar_inventario_json(inventario, archivo)
+            for archivo, inventario in inventarios
+        ))
+
+    async def cargar_varios(self, archivos: Iterable[str]) -> List[ResultadoArchivo]:
+        """Carga varios archivos; los resultados siguen el orden de entrada"""
+        return await asyncio.gather(*(
+            self.cargar_inventario_json(archivo) for archivo in archivos
+        ))
+
+def guardar_inventarios(inventarios: Iterable[Tuple[str, Dict[str, Any]]],
+                        max_concurrencia: int = MAX_CONCURRENCIA) -> List[ResultadoArchivo]:
+    """Versión bloqueante de GestorArchivosAsync.guardar_varios"""
+    return asyncio.run(GestorArchivosAsync(max_concurrencia).guardar_varios(inventarios))
+
+def cargar_inventarios(archivos: Iterable[str],
+                       max_concurrencia: int = MAX_CONCURRENCIA) -> List[ResultadoArchivo]:
+    """Versión bloqueante de GestorArchivosAsync.cargar_varios"""
+    return asyncio.run(GestorArchivosAsync(max_concurrencia).cargar_varios(archivos))
@@ -0,0 +1,206 @@
+"""
+Módulo de índices secundarios del inventario.
+Mantiene índices hash por categoría, estado, tipo y habitación, e índices
+ordenados por valor estimado y valor actual, para consultar sin recorrer
+todas las habitaciones. Los índices ordenados se arman recién cuando una
+consulta los usa; desde ahí cada cambio los actualiza con bisect, así
+alternar cambios y consultas no obliga a reordenar todo.
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple, Type
+
+from entities.categorias import ObjetoHogar, Categoria, EstadoConservacion
+
+ORDEN_VALOR_ESTIMADO = "valor_estimado"
+ORDEN_VALOR_ACTUAL = "valor_actual"
+
+
+class _Registro:
+    """Datos indexados de un objeto"""
+    __slots__ = ("habitacion", "categoria", "estado", "tipo", "valor", "actual")
+
+    def __init__(self, habitacion: Any, objeto: ObjetoHogar):
+        self.habitacion = habitacion
+        self.categoria = objeto.categoria
+        self.estado = objeto.estado
+        # Código y no clase: las variantes compactas comparten el código de su clase normal
+        self.tipo = objeto.CODIGO_TIPO
+        self.valor = objeto.valor_estimado
+        self.actual = objeto.calcular_valor_actual()
+
+
+class IndiceInventario:
+    """Índices secundarios sobre los objetos de una casa, identificados por id"""
+
+    def __init__(self):
+        self._registros: Dict[int, _Registro] = {}
+        self._por_categoria: Dict[Categoria, Set[int]] = {}
+        self._por_estado: Dict[EstadoConservacion, Set[int]] = {}
+        self._por_tipo: Dict[int, Set[int]] = {}
+        self._por_habitacion: Dict[Any, Set[int]] = {}
+        # (valor, id) ordenados; None hasta que se necesitan (ver _ordenados)
+        self._por_valor: Optional[List[Tuple[float, int]]] = None
+        self._por_actual: Optional[List[Tuple[float, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def __contains__(self, id_objeto: int) -> bool:
+        return id_objeto in self._registros
+
+    @staticmethod
+    def _agregar_a(indice: Dict[Any, Set[int]], clave: Any, id_objeto: int):
+        if clave not in indice:
+            indice[clave] = set()
+        indice[clave].add(id_objeto)
+
+    @staticmethod
+    def _quitar_de(indice: Dict[Any, Set[int]], clave: Any, id_objeto: int):
+        ids = indice[clave]
+        ids.discard(id_objeto)
+        if not ids:
+            del indice[clave]
+
+    def _ordenados(self, por: str) -> List[Tuple[float, int]]:
+        """Índice ordenado por valor estimado o actual, armado si hace falta"""
+        if por == ORDEN_VALOR_ESTIMADO:
+            if self._por_valor is None:
+                self._por_valor = sorted(
+                    (registro.valor, id_objeto) for id_objeto, registro in self._registros.items()
+                )
+            return self._por_valor
+        if self._por_actual is None:
+            self._por_actual = sorted(
+                (registro.actual, id_objeto) for id_objeto, registro in self._registros.items()
+            )
+        return self._por_actual
+
+    @staticmethod
+    def _quitar_ordenado(lista: Optional[List[Tuple[float, int]]], entrada: Tuple[float, int]):
+        if lista is not None:
+            del lista[bisect_left(lista, entrada)]
+
+    def agregar(self, id_objeto: int, habitacion: Any, objeto: ObjetoHogar):
+        """Indexa un objeto nuevo"""
+        if id_objeto in self._registros:
+            raise ValueError(f"El objeto {id_objeto} ya está indexado")
+        registro = _Registro(habitacion, objeto)
+        self._registros[id_objeto] = registro
+        self._agregar_a(self._por_categoria, registro.categoria, id_objeto)
+        self._agregar_a(self._por_estado, registro.estado, id_objeto)
+        self._agregar_a(self._por_tipo, registro.tipo, id_objeto)
+        self._agregar_a(self._por_habitacion, habitacion, id_objeto)
+        if self._por_valor is not None:
+            insort(self._por_valor, (registro.valor, id_objeto))
+        if self._por_actual is not None:
+            insort(self._por_actual, (registro.actual, id_objeto))
+
+    def agregar_lote(self, elementos: Iterable[Tuple[int, Any, ObjetoHogar]]):
+        """
+        Indexa muchos objetos (id, habitación, objeto) de una vez.
+        Los índices ordenados se descartan y se vuelven a ordenar en la
+        próxima consulta, que es más barato que insertar uno por uno.
+        """
+        self._por_valor = self._por_actual = None
+        for id_objeto, habitacion, objeto in elementos:
+            self.agregar(id_objeto, habitacion, objeto)
+
+    def eliminar(self, id_objeto: int):
+        """Quita un objeto de todos los índices"""
+        registro = self._registros.pop(id_objeto)
+        self._quitar_de(self._por_categoria, registro.categoria, id_objeto)
+        self._quitar_de(self._por_estado, registro.estado, id_objeto)
+        self._quitar_de(self._por_tipo, registro.tipo, id_objeto)
+        self._quitar_de(self._por_habitacion, registro.habitacion, id_objeto)
+        self._quitar_ordenado(self._por_valor, (registro.valor, id_objeto))
+        self._quitar_ordenado(self._por_actual, (registro.actual, id_objeto))
+
+    def actualizar(self, id_objeto: int, objeto: ObjetoHogar):
+        """Reindexa un objeto cuyo estado o valor cambió"""
+        habitacion = self._registros[id_objeto].habitacion
+        self.eliminar(id_objeto)
+        self.agregar(id_objeto, habitacion, objeto)
+
+    def quitar_habitacion(self, habitacion: Any):
+        for id_objeto in list(self._por_habitacion.get(habitacion, ())):
+            self.eliminar(id_objeto)
+
+    def habitacion_de(self, id_objeto: int) -> Any:
+        return self._registros[id_objeto].habitacion
+
+    def _rango(self, lista: List[Tuple[float, int]], minimo: Optional[float],
+               maximo: Optional[float]) -> Tuple[int, int]:
+        inicio = 0 if minimo is None else bisect_left(lista, (minimo, -1))
+        fin = len(lista) if maximo is None else bisect_right(lista, (maximo, float('inf')))
+        return inicio, max(inicio, fin)
+
+    def buscar(self, categoria: Optional[Categoria] = None,
+               estado: Optional[EstadoConservacion] = None,
+               tipo: Optional[Type[ObjetoHogar]] = None,
+               habitacion: Any = None,
+               valor_min: Optional[float] = None, valor_max: Optional[float] = None,
+               actual_min: Optional[float] = None, actual_max: Optional[float] = None
+               ) -> List[int]:
+        """
+        Retorna los ids que cumplen todos los filtros, ordenados.
+        Parte del índice con menos candidatos y verifica el resto de los
+        filtros sobre cada candidato, sin recorrer el inventario completo.
+        """
+        codigo_tipo = None
+        if tipo is not None:
+            codigo_tipo = getattr(tipo, "CODIGO_TIPO", None)
+            if codigo_tipo is None:
+                return []  # clase base o ajena: ningún objeto es de ese tipo concreto
+        fuentes: List[Tuple[int, Iterable[int]]] = []
+        for indice, clave in ((self._por_categoria, categoria), (self._por_estado, estado),
+                              (self._por_tipo, codigo_tipo), (self._por_habitacion, habitacion)):
+            if clave is not None:
+                ids = indice.get(clave, set())
+                fuentes.append((len(ids), ids))
+
+        filtra_valor = valor_min is not None or valor_max is not None
+        filtra_actual = actual_min is not None or actual_max is not None
+        if filtra_valor:
+            por_valor = self._ordenados(ORDEN_VALOR_ESTIMADO)
+            inicio, fin = self._rango(por_valor, valor_min, valor_max)
+            fuentes.append((fin - inicio, (i for _, i in por_valor[inicio:fin])))
+        if filtra_actual:
+            por_actual = self._ordenados(ORDEN_VALOR_ACTUAL)
+            inicio, fin = self._rango(por_actual, actual_min, actual_max)
+            fuentes.append((fin - inicio, (i for _, i in por_actual[inicio:fin])))
+
+        if not fuentes:
+            return sorted(self._registros)
+        _, candidatos = min(fuentes, key=lambda fuente: fuente[0])
+
+        resultado = []
+        for id_objeto in candidatos:
+            registro = self._registros[id_objeto]
+            if categoria is not None and registro.categoria != categoria:
+                continue
+            if estado is not None and registro.estado != estado:
+                continue
+            if codigo_tipo is not None and registro.tipo != codigo_tipo:
+                continue
+            if habitacion is not None and registro.habitacion is not habitacion:
+                continue
+            if valor_min is not None and registro.valor < valor_min:
+                continue
+            if valor_max is not None and registro.valor > valor_max:
+                continue
+            if actual_min is not None and registro.actual < actual_min:
+                continue
+            if actual_max is not None and registro.actual > actual_max:
+                continue
+            resultado.append(id_objeto)
+        resultado.sort()
+        return resultado
+
+    def mayores(self, k: int, por: str = ORDEN_VALOR_ACTUAL) -> List[int]:
+        """Ids de los k objetos de mayor valor, de mayor a menor"""
+        if por not in (ORDEN_VALOR_ACTUAL, ORDEN_VALOR_ESTIMADO):
+            raise ValueError(f"Orden desconocido: {por}")
+        if k <= 0:
+            return []
+        lista = self._ordenados(por)
+        return [id_objeto for _, id_objeto in reversed(lista[-k:])]
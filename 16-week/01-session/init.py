@@ -8,9 +8,28 @@ from .objetos_hogar import (
     Ropa,
     Mueble,
     UtensilioCocina,
-    ArticuloLimpieza
+    ArticuloLimpieza,
+    crear_desde_informacion
 )
 
+# Las variantes compactas se importan recién al pedirlas (entities.RopaCompacta,
+# from entities import RopaCompacta): el arranque por defecto no las usa
+_COMPACTOS = (
+    'ObjetoHogarCompacto',
+    'ElectrodomesticoCompacto',
+    'HerramientaCompacta',
+    'RopaCompacta',
+    'MuebleCompacto',
+    'UtensilioCocinaCompacto',
+    'ArticuloLimpiezaCompacto'
+)
+
+def __getattr__(nombre):
+    if nombre in _COMPACTOS:
+        from . import objetos_compactos
+        return getattr(objetos_compactos, nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
 __all__ = [
     'Categoria',
     'ObjetoHogar', 
@@ -20,5 +39,13 @@ __all__ = [
     'Ropa',
     'Mueble', 
     'UtensilioCocina',
-    'ArticuloLimpieza'
+    'ArticuloLimpieza',
+    'crear_desde_informacion',
+    'ObjetoHogarCompacto',
+    'ElectrodomesticoCompacto',
+    'HerramientaCompacta',
+    'RopaCompacta',
+    'MuebleCompacto',
+    'UtensilioCocinaCompacto',
+    'ArticuloLimpiezaCompacto'
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Módulo de instrumentación opcional de las rutas críticas.
+Los métodos se registran al importar los módulos, pero sólo se envuelven al
+llamar a activar(); mientras está desactivada las clases conservan sus
+métodos originales y la medición no cuesta nada.
+
+Por cada punto registrado se acumulan llamadas, tiempo de reloj (incluye el
+de las llamadas anidadas) y bloques de memoria asignados netos.
+"""
+import functools
+import sys
+import time
+from typing import Any, Callable, Dict, IO, List, Optional, Tuple
+
+# (clase, nombre del método) de cada punto registrado, en orden de registro
+_puntos: List[Tuple[type, str]] = []
+# Atributos originales reemplazados mientras la instrumentación está activa
+_originales: Dict[Tuple[type, str], Any] = {}
+# etiqueta -> [llamadas, segundos, bloques asignados]
+_estadisticas: Dict[str, List[float]] = {}
+
+
+class Medicion:
+    """Acumulado de un punto instrumentado"""
+    __slots__ = ("etiqueta", "llamadas", "segundos", "bloques")
+
+    def __init__(self, etiqueta: str, llamadas: int, segundos: float, bloques: int):
+        self.etiqueta = etiqueta
+        self.llamadas = llamadas
+        self.segundos = segundos
+        self.bloques = bloques
+
+    def __repr__(self) -> str:
+        return (f"Medicion({self.etiqueta!r}, llamadas={self.llamadas}, "
+                f"segundos={self.segundos:.6f}, bloques={self.bloques})")
+
+
+def registrar(clase: type, *nombres: str):
+    """Registra métodos (funciones, staticmethod o property) de una clase"""
+    for nombre in nombres:
+        if nombre not in clase.__dict__:
+            raise AttributeError(f"{clase.__name__} no define {nombre}")
+        if (clase, nombre) not in _puntos:
+            _puntos.append((clase, nombre))
+
+
+def esta_activa() -> bool:
+    return bool(_originales)
+
+
+def _medir(etiqueta: str, funcion: Callable) -> Callable:
+    estadistica = _estadisticas.setdefault(etiqueta, [0, 0.0, 0])
+    reloj = time.perf_counter
+    bloques = sys.getallocatedblocks
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        bloques_antes = bloques()
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            estadistica[1] += reloj() - inicio
+            estadistica[2] += bloques() - bloques_antes
+            estadistica[0] += 1
+    return envoltura
+
+
+def activar():
+    """Envuelve todos los puntos registrados (y los que falten, si ya estaba activa)"""
+    for clase, nombre in _puntos:
+        if (clase, nombre) in _originales:
+            continue
+        original = clase.__dict__[nombre]
+        etiqueta = f"{clase.__name__}.{nombre}"
+        if isinstance(original, staticmethod):
+            reemplazo = staticmethod(_medir(etiqueta, original.__func__))
+        elif isinstance(original, classmethod):
+            reemplazo = classmethod(_medir(etiqueta, original.__func__))
+        elif isinstance(original, property):
+            reemplazo = property(_medir(etiqueta, original.fget), original.fset,
+                                 original.fdel, original.__doc__)
+        else:
+            reemplazo = _medir(etiqueta, original)
+        _originales[(clase, nombre)] = original
+        setattr(clase, nombre, reemplazo)
+
+
+def desactivar():
+    """Restaura los métodos originales; las estadísticas se conservan"""
+    for (clase, nombre), original in _originales.items():
+        setattr(clase, nombre, original)
+    _originales.clear()
+
+
+def reiniciar():
+    """Pone en cero las estadísticas acumuladas"""
+    for estadistica in _estadisticas.values():
+        estadistica[:] = [0, 0.0, 0]
+
+
+def resumen() -> List[Medicion]:
+    """Mediciones de los puntos llamados al menos una vez, de mayor a menor tiempo"""
+    mediciones = [
+        Medicion(etiqueta, int(llamadas), segundos, int(bloques))
+        for etiqueta, (llamadas, segundos, bloques) in _estadisticas.items()
+        if llamadas
+    ]
+    mediciones.sort(key=lambda medicion: medicion.segundos, reverse=True)
+    return mediciones
+
+
+def imprimir_resumen(salida: Optional[IO[str]] = None):
+    """Escribe el resumen como tabla"""
+    salida = salida if salida is not None else sys.stdout
+    lineas = [f"{'Punto':<50}{'Llamadas':>10}{'Total ms':>12}{'µs/llamada':>12}{'Bloques':>10}"]
+    for medicion in resumen():
+        lineas.append(
+            f"{medicion.etiqueta:<50}{medicion.llamadas:>10}{medicion.segundos * 1e3:>12.3f}"
+            f"{medicion.segundos / medicion.llamadas * 1e6:>12.2f}{medicion.bloques:>10}"
+        )
+    salida.write("\n".join(lineas) + "\n")
@@ -2,109 +2,637 @@
 Sistema de Gestión de Inventario de Hogar
 Main module - Punto de entrada de la aplicación
 """
+from __future__ import annotations
+
 import json
 import os
-from typing import List, Dict, Any
-from datetime import datetime
+import sys
+from array import array
+from itertools import count, islice
+from typing import (
+    TYPE_CHECKING, IO, List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+)
+from datetime import date, datetime
 
 from entities.objetos_hogar import (
-    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza,
+    crear_desde_informacion
 )
-from entities.categorias import Categoria, EstadoConservacion
+from entities.categorias import Categoria, EstadoConservacion, ObjetoHogar
+from entities.depreciacion import hoy
+
+# argparse, gzip, snapshot_binario (con almacen_columnar), indices,
+# renderizado_consola, instrumentacion y objetos_compactos se importan recién
+# al usarlos: la ejecución por defecto necesita a lo sumo uno de ellos (ver
+# arranque_rapido.py). Las anotaciones no se evalúan.
+if TYPE_CHECKING:
+    from almacen_columnar import AlmacenColumnar
+    from indices import IndiceInventario
+    from snapshot_binario import SnapshotCasa
+
+# Identificadores únicos de objeto, estables aunque cambien las posiciones
+_contador_ids = count()
+
+# Eventos notificados a los observadores de objetos
+OBJETO_AGREGADO = "agregado"
+OBJETO_ELIMINADO = "eliminado"
+OBJETO_MODIFICADO = "modificado"
+# Evento de Casa: se agregó una habitación (id_objeto y objeto son None)
+HABITACION_AGREGADA = "habitacion_agregada"
 
 class Habitacion:
     """Representa una habitación con sus objetos (composición)"""
     
-    def __init__(self, nombre: str, metros_cuadrados: float):
+    def __init__(self, nombre: str, metros_cuadrados: float,
+                 almacen: Optional[AlmacenColumnar] = None):
         self._nombre = nombre
         self._metros_cuadrados = metros_cuadrados
         self._objetos: List[ObjetoHogar] = []
+        # Si hay almacén columnar los objetos viven en él y no en la lista
+        self._almacen = almacen
+        self._id_almacen = almacen.registrar_habitacion(nombre) if almacen is not None else None
+        # Totales que se actualizan con cada cambio en lugar de recalcularse
+        self._valor_original = 0
+        self._valor_actual = 0
+        self._totales: Dict[str, Dict[str, float]] = {}
+        self._cantidades: Dict[str, int] = {}
+        self._observadores: List[Callable[..., None]] = []
+        # Id de cada objeto por posición (en un arreglo compacto) y posición de
+        # cada id. Al eliminar, las posiciones desde la eliminada quedan
+        # desactualizadas y se recalculan juntas en la siguiente búsqueda
+        # (ver posicion_de): sólo las menores a _posiciones_validas son seguras
+        self._ids = array('q')
+        self._posiciones: Dict[int, int] = {}
+        self._posiciones_validas = 0
+        self._observadores_objetos: List[Callable[..., None]] = []
+        # Valor actual con el que cada objeto (por posición) entró en los
+        # totales y día en que se calculó: al quitarlo se resta lo mismo que
+        # se sumó, y si cambia el día se revalúa todo (ver _al_dia)
+        self._aportes = array('d')
+        self._dia = hoy()
+    
+    def agregar_observador(self, observador: Callable[..., None]):
+        """
+        Registra una función que se llama con
+        (habitacion, categoria, delta_original, delta_actual, delta_cantidad)
+        cada vez que cambian los totales de la habitación
+        """
+        self._observadores.append(observador)
+    
+    def agregar_observador_objetos(self, observador: Callable[..., None]):
+        """
+        Registra una función que se llama con (evento, habitacion, id_objeto, objeto)
+        cuando un objeto se agrega, se elimina o se modifica
+        """
+        self._observadores_objetos.append(observador)
+    
+    def _notificar_objeto(self, evento: str, id_objeto: int, objeto: ObjetoHogar):
+        for observador in self._observadores_objetos:
+            observador(evento, self, id_objeto, objeto)
+    
+    def _registrar_cambio(self, categoria: str, delta_original: float,
+                          delta_actual: float, delta_cantidad: int):
+        """Aplica un cambio a los totales y lo notifica a los observadores"""
+        if categoria not in self._totales:
+            self._totales[categoria] = {"original": 0, "actual": 0}
+            self._cantidades[categoria] = 0
+        self._totales[categoria]["original"] += delta_original
+        self._totales[categoria]["actual"] += delta_actual
+        self._cantidades[categoria] += delta_cantidad
+        if self._cantidades[categoria] == 0:
+            del self._totales[categoria]
+            del self._cantidades[categoria]
+        
+        self._valor_original += delta_original
+        self._valor_actual += delta_actual
+        if not self._totales:
+            # Sin objetos se descarta el error de redondeo acumulado
+            self._valor_original = 0
+            self._valor_actual = 0
+        
+        for observador in self._observadores:
+            observador(self, categoria, delta_original, delta_actual, delta_cantidad)
+    
+    def _al_dia(self):
+        """
+        Si cambió el día desde el último cálculo, revalúa los objetos y aplica
+        la diferencia a los totales (los observadores la reciben como cambio)
+        """
+        dia = hoy()
+        if dia == self._dia:
+            return
+        self._dia = dia
+        actuales: Dict[str, float] = {}
+        for posicion, objeto in enumerate(self.iterar_objetos()):
+            actual = objeto.calcular_valor_actual()
+            self._aportes[posicion] = actual
+            categoria = objeto.categoria.value
+            actuales[categoria] = actuales.get(categoria, 0) + actual
+        for categoria, actual in actuales.items():
+            delta = actual - self._totales[categoria]["actual"]
+            if delta:
+                self._registrar_cambio(categoria, 0, delta, 0)
+    
+    def agregar_objeto(self, objeto: ObjetoHogar) -> int:
+        """Agrega un objeto a la habitación y retorna su id"""
+        self._al_dia()
+        id_objeto = next(_contador_ids)
+        if self._almacen is not None:
+            self._almacen.agregar(objeto, self._id_almacen)
+        else:
+            self._objetos.append(objeto)
+        posicion = len(self._ids)
+        self._ids.append(id_objeto)
+        self._posiciones[id_objeto] = posicion
+        if self._posiciones_validas == posicion:
+            self._posiciones_validas += 1
+        actual = objeto.calcular_valor_actual()
+        self._aportes.append(actual)
+        self._registrar_cambio(objeto.categoria.value, objeto.valor_estimado, actual, 1)
+        self._notificar_objeto(OBJETO_AGREGADO, id_objeto, objeto)
+        return id_objeto
+    
+    def eliminar_objeto(self, posicion: int) -> ObjetoHogar:
+        """Quita el objeto en la posición indicada y lo retorna"""
+        self._al_dia()
+        if self._almacen is not None:
+            objeto = self._almacen.eliminar(self._id_almacen, posicion)
+        else:
+            objeto = self._objetos.pop(posicion)
+        id_objeto = self._ids.pop(posicion)
+        del self._posiciones[id_objeto]
+        self._posiciones_validas = min(self._posiciones_validas, posicion)
+        aporte = self._aportes.pop(posicion)
+        self._registrar_cambio(objeto.categoria.value, -objeto.valor_estimado, -aporte, -1)
+        self._notificar_objeto(OBJETO_ELIMINADO, id_objeto, objeto)
+        return objeto
+    
+    def cambiar_estado_objeto(self, posicion: int, estado: EstadoConservacion):
+        """Cambia el estado de conservación de un objeto de la habitación"""
+        self._al_dia()
+        objeto = self._obtener_objeto(posicion)
+        objeto._asignar_estado(estado)
+        if self._almacen is not None:
+            self._almacen.cambiar_estado(
+                self._almacen.fila_en_posicion(self._id_almacen, posicion), estado
+            )
+        actual = objeto.calcular_valor_actual()
+        self._registrar_cambio(objeto.categoria.value, 0, actual - self._aportes[posicion], 0)
+        self._aportes[posicion] = actual
+        self._notificar_objeto(OBJETO_MODIFICADO, self._ids[posicion], objeto)
     
-    def agregar_objeto(self, objeto: ObjetoHogar):
-        """Agrega un objeto a la habitación"""
-        self._objetos.append(objeto)
+    def actualizar_valor_objeto(self, posicion: int, valor_estimado: float):
+        """Cambia el valor estimado de un objeto de la habitación"""
+        self._al_dia()
+        objeto = self._obtener_objeto(posicion)
+        original_anterior = objeto.valor_estimado
+        objeto._asignar_valor_estimado(valor_estimado)
+        if self._almacen is not None:
+            self._almacen.cambiar_valor(
+                self._almacen.fila_en_posicion(self._id_almacen, posicion), valor_estimado
+            )
+        actual = objeto.calcular_valor_actual()
+        self._registrar_cambio(
+            objeto.categoria.value,
+            objeto.valor_estimado - original_anterior,
+            actual - self._aportes[posicion],
+            0
+        )
+        self._aportes[posicion] = actual
+        self._notificar_objeto(OBJETO_MODIFICADO, self._ids[posicion], objeto)
+    
+    def _obtener_objeto(self, posicion: int) -> ObjetoHogar:
+        if self._almacen is not None:
+            return self._almacen.obtener_objeto(
+                self._almacen.fila_en_posicion(self._id_almacen, posicion)
+            )
+        return self._objetos[posicion]
+    
+    def obtener_objeto_por_id(self, id_objeto: int) -> ObjetoHogar:
+        return self._obtener_objeto(self.posicion_de(id_objeto))
+    
+    def posicion_de(self, id_objeto: int) -> int:
+        """Posición actual del objeto con ese id (KeyError si no está en la habitación)"""
+        posicion = self._posiciones[id_objeto]
+        if posicion < self._posiciones_validas:
+            return posicion
+        # Recalcula de una vez las posiciones corridas por las eliminaciones
+        desde = self._posiciones_validas
+        self._posiciones.update(zip(self._ids[desde:], range(desde, len(self._ids))))
+        self._posiciones_validas = len(self._ids)
+        return self._posiciones[id_objeto]
+    
+    def iterar_con_ids(self) -> Iterator[Tuple[int, ObjetoHogar]]:
+        """Recorre los objetos junto con su id"""
+        return zip(self._ids, self.iterar_objetos())
     
     @property
     def objetos(self) -> List[ObjetoHogar]:
-        return self._objetos.copy()
+        return list(self.iterar_objetos())
     
     @property
     def nombre(self) -> str:
         return self._nombre
     
+    @property
+    def total_objetos(self) -> int:
+        if self._almacen is not None:
+            return self._almacen.total_filas(self._id_almacen)
+        return len(self._objetos)
+    
+    def iterar_objetos(self) -> Iterator[ObjetoHogar]:
+        """Recorre los objetos sin copiar la lista"""
+        if self._almacen is not None:
+            return self._almacen.iterar_objetos(self._id_almacen)
+        return iter(self._objetos)
+    
     def obtener_valor_total(self) -> float:
-        """Calcula el valor total de todos los objetos en la habitación"""
-        return sum(obj.calcular_valor_actual() for obj in self._objetos)
+        """Retorna el valor actual total de los objetos en la habitación"""
+        self._al_dia()
+        return self._valor_actual
     
+    def obtener_valor_original(self) -> float:
+        return self._valor_original
+    
+    def obtener_totales_por_categoria(self) -> Dict[str, Dict[str, float]]:
+        """Retorna los valores original y actual de la habitación por categoría"""
+        self._al_dia()
+        return {categoria: dict(valores) for categoria, valores in self._totales.items()}
+
+    def obtener_cantidades_por_categoria(self) -> Dict[str, int]:
+        """Retorna cuántos objetos de cada categoría hay en la habitación"""
+        return dict(self._cantidades)
+
     def obtener_inventario(self) -> List[Dict[str, Any]]:
         """Retorna inventario detallado de la habitación"""
-        return [obj.obtener_informacion() for obj in self._objetos]
+        return list(self.iterar_inventario())
+    
+    def iterar_inventario(self) -> Iterator[Dict[str, Any]]:
+        """Genera la información de cada objeto sin armar la lista completa"""
+        for obj in self.iterar_objetos():
+            yield obj.obtener_informacion()
+    
+    def obtener_resumen(self) -> Dict[str, Any]:
+        """Datos de la habitación sin el detalle de sus objetos"""
+        return {
+            "metros_cuadrados": self._metros_cuadrados,
+            "valor_total": self.obtener_valor_total(),
+            "total_objetos": self.total_objetos
+        }
 
 class Casa:
     """Representa la casa completa con todas sus habitaciones"""
     
-    def __init__(self, nombre: str, direccion: str):
+    def __init__(self, nombre: str, direccion: str,
+                 almacen: Optional[AlmacenColumnar] = None):
         self._nombre = nombre
         self._direccion = direccion
         self._habitaciones: List[Habitacion] = []
+        self._almacen = almacen
+        # Agregados financieros mantenidos por los avisos de cada habitación
+        self._valor_original = 0
+        self._valor_actual = 0
+        self._totales_categoria: Dict[str, Dict[str, float]] = {}
+        self._cantidades_categoria: Dict[str, int] = {}
+        self._reporte_cache: Optional[Dict[str, Any]] = None
+        # Índices secundarios: se arman con la primera consulta (ver _obtener_indice)
+        # para que una casa que no se consulta no pague su memoria
+        self._indice: Optional[IndiceInventario] = None
+        self._observadores_objetos: List[Callable[..., None]] = []
+        # Día de los valores actuales del reporte y del índice (ver _al_dia)
+        self._dia = hoy()
+    
+    @property
+    def almacen(self) -> Optional[AlmacenColumnar]:
+        return self._almacen
     
     def agregar_habitacion(self, habitacion: Habitacion):
         """Agrega una habitación a la casa"""
+        self._al_dia()
         self._habitaciones.append(habitacion)
+        for categoria, valores in habitacion.obtener_totales_por_categoria().items():
+            self._registrar_cambio(
+                habitacion, categoria, valores["original"], valores["actual"],
+                habitacion._cantidades[categoria]
+            )
+        habitacion.agregar_observador(self._registrar_cambio)
+        if self._indice is not None:
+            self._indice.agregar_lote(
+                (id_objeto, habitacion, objeto) for id_objeto, objeto in habitacion.iterar_con_ids()
+            )
+        habitacion.agregar_observador_objetos(self._registrar_cambio_objeto)
+        for observador in self._observadores_objetos:
+            observador(HABITACION_AGREGADA, habitacion, None, None)
+    
+    def agregar_observador_objetos(self, observador: Callable[..., None]):
+        """
+        Registra una función que se llama con (evento, habitacion, id_objeto, objeto)
+        por cada evento de objeto de cualquier habitación de la casa, y con
+        (HABITACION_AGREGADA, habitacion, None, None) al agregar una habitación
+        """
+        self._observadores_objetos.append(observador)
+    
+    def crear_habitacion(self, nombre: str, metros_cuadrados: float) -> Habitacion:
+        """Crea una habitación sobre el almacén de la casa y la agrega"""
+        habitacion = Habitacion(nombre, metros_cuadrados, self._almacen)
+        self.agregar_habitacion(habitacion)
+        return habitacion
+    
+    def _registrar_cambio(self, habitacion: Habitacion, categoria: str,
+                          delta_original: float, delta_actual: float, delta_cantidad: int):
+        """Actualiza los agregados de la casa e invalida el reporte en caché"""
+        if categoria not in self._totales_categoria:
+            self._totales_categoria[categoria] = {"original": 0, "actual": 0}
+            self._cantidades_categoria[categoria] = 0
+        self._totales_categoria[categoria]["original"] += delta_original
+        self._totales_categoria[categoria]["actual"] += delta_actual
+        self._cantidades_categoria[categoria] += delta_cantidad
+        if self._cantidades_categoria[categoria] == 0:
+            del self._totales_categoria[categoria]
+            del self._cantidades_categoria[categoria]
+        
+        self._valor_original += delta_original
+        self._valor_actual += delta_actual
+        if not self._totales_categoria:
+            self._valor_original = 0
+            self._valor_actual = 0
+        self._reporte_cache = None
+    
+    def _al_dia(self):
+        """
+        Si cambió el día, revalúa las habitaciones (que avisan sus diferencias
+        con _registrar_cambio) y descarta el índice, cuyo orden por valor
+        actual también depende de la fecha
+        """
+        dia = hoy()
+        if dia == self._dia:
+            return
+        self._dia = dia
+        for habitacion in self._habitaciones:
+            habitacion._al_dia()
+        self._reporte_cache = None
+        self._indice = None
+    
+    def _obtener_indice(self) -> IndiceInventario:
+        """El índice al día, armándolo si todavía no existe"""
+        self._al_dia()
+        if self._indice is None:
+            from indices import IndiceInventario
+            self._indice = IndiceInventario()
+            self._indice.agregar_lote(
+                (id_objeto, habitacion, objeto)
+                for habitacion in self._habitaciones
+                for id_objeto, objeto in habitacion.iterar_con_ids()
+            )
+        return self._indice
+    
+    def _registrar_cambio_objeto(self, evento: str, habitacion: Habitacion,
+                                 id_objeto: int, objeto: ObjetoHogar):
+        """Mantiene los índices secundarios (si ya existen) al día y reenvía el evento"""
+        indice = self._indice
+        if indice is not None:
+            if evento == OBJETO_AGREGADO:
+                indice.agregar(id_objeto, habitacion, objeto)
+            elif evento == OBJETO_ELIMINADO:
+                indice.eliminar(id_objeto)
+            elif evento == OBJETO_MODIFICADO:
+                indice.actualizar(id_objeto, objeto)
+        for observador in self._observadores_objetos:
+            observador(evento, habitacion, id_objeto, objeto)
+    
+    def _resolver_ids(self, indice: IndiceInventario, ids: List[int]) -> List[ObjetoHogar]:
+        return [indice.habitacion_de(i).obtener_objeto_por_id(i) for i in ids]
+    
+    def consultar(self, categoria: Optional[Categoria] = None,
+                  estado: Optional[EstadoConservacion] = None,
+                  tipo: Optional[type] = None,
+                  habitacion: Optional[Habitacion] = None,
+                  valor_min: Optional[float] = None, valor_max: Optional[float] = None,
+                  actual_min: Optional[float] = None, actual_max: Optional[float] = None
+                  ) -> List[ObjetoHogar]:
+        """
+        Busca objetos combinando los índices, por ejemplo:
+        casa.consultar(categoria=Categoria.ELECTRONICOS,
+                       estado=EstadoConservacion.MALO, actual_min=1000)
+        """
+        indice = self._obtener_indice()
+        return self._resolver_ids(indice, indice.buscar(
+            categoria, estado, tipo, habitacion, valor_min, valor_max, actual_min, actual_max
+        ))
+    
+    def objetos_mas_valiosos(self, k: int, por: Optional[str] = None) -> List[ObjetoHogar]:
+        """
+        Los k objetos de mayor valor, de mayor a menor: valor actual por
+        defecto, o el orden indicado (indices.ORDEN_VALOR_ESTIMADO, ...)
+        """
+        indice = self._obtener_indice()
+        ids = indice.mayores(k) if por is None else indice.mayores(k, por)
+        return self._resolver_ids(indice, ids)
+    
+    def curva_valor(self, fechas: Iterable[date]) -> List[float]:
+        """
+        Valor total de la casa en cada una de las fechas indicadas, buscando
+        cada objeto en las tablas mensuales de depreciación
+        """
+        from valoracion_portafolio import compactar_casa, curva_casa
+        return curva_casa(compactar_casa(self), list(fechas))
+    
+    def valor_en_fecha(self, fecha: date) -> float:
+        """Valor total de la casa a la fecha indicada"""
+        return self.curva_valor([fecha])[0]
+    
+    def obtener_totales_por_habitacion(self) -> Dict[str, Dict[str, float]]:
+        """Retorna los valores original y actual de cada habitación"""
+        return {
+            habitacion.nombre: {
+                "original": habitacion.obtener_valor_original(),
+                "actual": habitacion.obtener_valor_total()
+            }
+            for habitacion in self._habitaciones
+        }
+    
+    @property
+    def habitaciones(self) -> List[Habitacion]:
+        return self._habitaciones.copy()
+    
+    @classmethod
+    def desde_snapshot(cls, snapshot: SnapshotCasa,
+                       almacen: Optional[AlmacenColumnar] = None) -> "Casa":
+        """Construye una Casa decodificando todos los objetos de un snapshot"""
+        casa = cls(snapshot.nombre, snapshot.direccion, almacen)
+        for indice, datos in enumerate(snapshot.iterar_habitaciones()):
+            habitacion = Habitacion(datos["nombre"], datos["metros_cuadrados"], almacen)
+            for objeto in snapshot.iterar_objetos(indice):
+                habitacion.agregar_objeto(objeto)
+            casa.agregar_habitacion(habitacion)
+        return casa
+    
+    def obtener_datos_casa(self) -> Dict[str, Any]:
+        """Datos generales de la casa para el encabezado del inventario"""
+        return {
+            "nombre": self._nombre,
+            "direccion": self._direccion,
+            "total_habitaciones": len(self._habitaciones),
+            "fecha_inventario": datetime.now().isoformat()
+        }
     
     def obtener_inventario_completo(self) -> Dict[str, Any]:
         """Genera inventario completo de la casa"""
         inventario = {
-            "casa": {
-                "nombre": self._nombre,
-                "direccion": self._direccion,
-                "total_habitaciones": len(self._habitaciones),
-                "fecha_inventario": datetime.now().isoformat()
-            },
+            "casa": self.obtener_datos_casa(),
             "habitaciones": {}
         }
         
         for habitacion in self._habitaciones:
-            inventario["habitaciones"][habitacion.nombre] = {
-                "metros_cuadrados": habitacion._metros_cuadrados,
-                "valor_total": habitacion.obtener_valor_total(),
-                "total_objetos": len(habitacion.objetos),
-                "objetos": habitacion.obtener_inventario()
-            }
+            datos_habitacion = habitacion.obtener_resumen()
+            datos_habitacion["objetos"] = habitacion.obtener_inventario()
+            inventario["habitaciones"][habitacion.nombre] = datos_habitacion
         
         return inventario
     
     def generar_reporte_financiero(self) -> Dict[str, Any]:
-        """Genera un reporte financiero del inventario"""
-        total_valor_original = 0
-        total_valor_actual = 0
-        categorias_valor = {}
-        
-        for habitacion in self._habitaciones:
-            for obj in habitacion.objetos:
-                total_valor_original += obj.valor_estimado
-                total_valor_actual += obj.calcular_valor_actual()
-                
-                categoria = obj.categoria.value
-                if categoria not in categorias_valor:
-                    categorias_valor[categoria] = {"original": 0, "actual": 0}
-                
-                categorias_valor[categoria]["original"] += obj.valor_estimado
-                categorias_valor[categoria]["actual"] += obj.calcular_valor_actual()
-        
+        """
+        Genera un reporte financiero del inventario.
+        Usa los agregados mantenidos, así que no recorre los objetos
+        (salvo la primera vez de cada día, para revaluarlos).
+        """
+        self._al_dia()
+        if self._reporte_cache is None:
+            total_valor_original = self._valor_original
+            total_valor_actual = self._valor_actual
+            self._reporte_cache = {
+                "resumen_financiero": {
+                    "valor_total_original": round(total_valor_original, 2),
+                    "valor_total_actual": round(total_valor_actual, 2),
+                    "depreciacion_total": round(total_valor_original - total_valor_actual, 2),
+                    "porcentaje_depreciacion": round(
+                        ((total_valor_original - total_valor_actual) / total_valor_original * 100) 
+                        if total_valor_original > 0 else 0, 2
+                    )
+                },
+                "valor_por_categoria": {
+                    categoria: dict(valores)
+                    for categoria, valores in self._totales_categoria.items()
+                }
+            }
+        # Copia para que quien lo reciba no altere la caché
         return {
-            "resumen_financiero": {
-                "valor_total_original": round(total_valor_original, 2),
-                "valor_total_actual": round(total_valor_actual, 2),
-                "depreciacion_total": round(total_valor_original - total_valor_actual, 2),
-                "porcentaje_depreciacion": round(
-                    ((total_valor_original - total_valor_actual) / total_valor_original * 100) 
-                    if total_valor_original > 0 else 0, 2
-                )
-            },
-            "valor_por_categoria": categorias_valor
+            "resumen_financiero": dict(self._reporte_cache["resumen_financiero"]),
+            "valor_por_categoria": {
+                categoria: dict(valores)
+                for categoria, valores in self._reporte_cache["valor_por_categoria"].items()
+            }
         }
 
+TAMANO_BUFFER_ESCRITURA = 1024 * 1024  # 1 MiB por escritura al disco
+TAMANO_LOTE_LECTURA = 10000  # líneas leídas por lote
+MAX_ERRORES_GUARDADOS = 100
+
+class LectorInventarioJSONL:
+    """
+    Lee un inventario JSONL (como el de exportar_inventario_jsonl) por lotes,
+    sin cargar el archivo completo. Las líneas inválidas no se descartan en
+    silencio: se cuentan en `rechazadas` y las primeras se guardan en `errores`.
+    """
+    
+    def __init__(self, archivo: str, tamano_lote: int = TAMANO_LOTE_LECTURA):
+        self._archivo = archivo
+        self._tamano_lote = tamano_lote
+        self.leidas = 0
+        self.rechazadas = 0
+        self.errores: List[Tuple[int, str]] = []
+    
+    def _abrir(self) -> IO[str]:
+        if self._archivo.endswith('.gz'):
+            import gzip
+            return gzip.open(self._archivo, 'rt', encoding='utf-8')
+        return open(self._archivo, 'r', encoding='utf-8')
+    
+    def _rechazar(self, numero_linea: int, motivo: str):
+        self.rechazadas += 1
+        if len(self.errores) < MAX_ERRORES_GUARDADOS:
+            self.errores.append((numero_linea, motivo))
+    
+    def iterar_lotes(self) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+        """Genera lotes de (número de línea, registro) ya decodificados"""
+        numero_linea = 0
+        with self._abrir() as f:
+            while True:
+                lineas = list(islice(f, self._tamano_lote))
+                if not lineas:
+                    break
+                lote = []
+                for linea in lineas:
+                    numero_linea += 1
+                    if not linea.strip():
+                        continue
+                    self.leidas += 1
+                    try:
+                        registro = json.loads(linea)
+                    except json.JSONDecodeError as e:
+                        self._rechazar(numero_linea, f"JSON inválido: {e}")
+                        continue
+                    if not isinstance(registro, dict):
+                        self._rechazar(numero_linea, "El registro no es un objeto JSON")
+                        continue
+                    lote.append((numero_linea, registro))
+                yield lote
+    
+    def iterar_registros(self) -> Iterator[Dict[str, Any]]:
+        """Genera los registros uno a uno"""
+        for lote in self.iterar_lotes():
+            for _, registro in lote:
+                yield registro
+    
+    def iterar_objetos(self) -> Iterator[Tuple[Optional[str], ObjetoHogar]]:
+        """Genera (habitación, objeto) con la subclase indicada por "tipo" """
+        for lote in self.iterar_lotes():
+            for numero_linea, registro in lote:
+                if registro.get("registro", "objeto") != "objeto":
+                    continue
+                objeto = self._crear_objeto(numero_linea, registro)
+                if objeto is not None:
+                    yield registro.get("habitacion"), objeto
+    
+    def _crear_objeto(self, numero_linea: int, registro: Dict[str, Any]) -> Optional[ObjetoHogar]:
+        try:
+            return crear_desde_informacion(registro)
+        except KeyError as e:
+            self._rechazar(numero_linea, f"Falta el campo {e}")
+        except (TypeError, ValueError) as e:
+            self._rechazar(numero_linea, str(e))
+        return None
+    
+    def cargar_casa(self, almacen: Optional[AlmacenColumnar] = None) -> Casa:
+        """Reconstruye una Casa recorriendo el archivo una sola vez"""
+        casa = Casa("Casa sin nombre", "", almacen)
+        habitaciones: Dict[str, Habitacion] = {}
+        
+        def obtener_habitacion(nombre: str, metros_cuadrados: float = 0.0) -> Habitacion:
+            if nombre not in habitaciones:
+                habitaciones[nombre] = casa.crear_habitacion(nombre, metros_cuadrados)
+            return habitaciones[nombre]
+        
+        for lote in self.iterar_lotes():
+            for numero_linea, registro in lote:
+                tipo_registro = registro.get("registro", "objeto")
+                if tipo_registro == "casa":
+                    casa._nombre = registro.get("nombre", casa._nombre)
+                    casa._direccion = registro.get("direccion", casa._direccion)
+                elif tipo_registro == "habitacion":
+                    if "nombre" not in registro:
+                        self._rechazar(numero_linea, "Falta el campo 'nombre'")
+                        continue
+                    obtener_habitacion(registro["nombre"], registro.get("metros_cuadrados", 0.0))
+                elif tipo_registro == "objeto":
+                    objeto = self._crear_objeto(numero_linea, registro)
+                    if objeto is not None:
+                        nombre = registro.get("habitacion") or objeto.ubicacion
+                        obtener_habitacion(nombre).agregar_objeto(objeto)
+                else:
+                    self._rechazar(numero_linea, f"Registro desconocido: {tipo_registro}")
+        return casa
+
 class GestorArchivos:
     """Maneja la lectura y escritura de archivos"""
     
@@ -130,176 +658,301 @@ class GestorArchivos:
         except Exception as e:
             print(f"✗ Error cargando archivo: {e}")
             return {}
+    
+    @staticmethod
+    def cargar_inventario_jsonl(archivo: str,
+                                tamano_lote: int = TAMANO_LOTE_LECTURA) -> LectorInventarioJSONL:
+        """
+        Retorna un lector perezoso del inventario JSONL; el archivo se lee
+        recién al recorrerlo (iterar_objetos, cargar_casa, ...)
+        """
+        if not os.path.exists(archivo):
+            raise FileNotFoundError(f"No existe el archivo JSONL: {archivo}")
+        return LectorInventarioJSONL(archivo, tamano_lote)
+    
+    @staticmethod
+    def guardar_snapshot(casa: Casa, archivo: str) -> int:
+        """Guarda la casa en el formato binario de snapshot_binario"""
+        try:
+            import snapshot_binario
+            total = snapshot_binario.guardar_snapshot(casa, archivo)
+            print(f"✓ Snapshot guardado en {archivo} ({total} objetos)")
+            return total
+        except Exception as e:
+            print(f"✗ Error guardando snapshot: {e}")
+            return 0
+    
+    @staticmethod
+    def cargar_snapshot(archivo: str) -> Optional[SnapshotCasa]:
+        """
+        Abre un snapshot binario con mmap. No decodifica objetos: se leen al
+        accederlos, o todos juntos con Casa.desde_snapshot. Cerrar con cerrar().
+        """
+        from snapshot_binario import SnapshotCasa
+        try:
+            return SnapshotCasa(archivo)
+        except FileNotFoundError:
+            print(f"✗ Archivo {archivo} no encontrado")
+            return None
+        except Exception as e:
+            print(f"✗ Error cargando snapshot: {e}")
+            return None
+    
+    @staticmethod
+    def _abrir_escritura(archivo: str, comprimir: bool) -> IO[str]:
+        """Abre el archivo de salida, comprimiendo con gzip si se pide"""
+        if comprimir:
+            import gzip
+            return gzip.open(archivo, 'wt', encoding='utf-8')
+        return open(archivo, 'w', encoding='utf-8', buffering=TAMANO_BUFFER_ESCRITURA)
+    
+    @staticmethod
+    def exportar_inventario_json(casa: Casa, archivo: str, comprimir: bool = False) -> int:
+        """
+        Escribe el inventario en JSON objeto por objeto, sin armar el
+        diccionario completo en memoria. Retorna la cantidad de objetos escritos.
+        El resultado tiene la misma estructura que obtener_inventario_completo.
+        """
+        total = 0
+        try:
+            with GestorArchivos._abrir_escritura(archivo, comprimir) as f:
+                f.write('{"casa": ')
+                f.write(json.dumps(casa.obtener_datos_casa(), ensure_ascii=False))
+                f.write(', "habitaciones": {')
+                for i, habitacion in enumerate(casa.habitaciones):
+                    if i:
+                        f.write(', ')
+                    resumen = json.dumps(habitacion.obtener_resumen(), ensure_ascii=False)
+                    f.write(json.dumps(habitacion.nombre, ensure_ascii=False))
+                    f.write(': ')
+                    # Se reabre el resumen para agregar la lista de objetos
+                    f.write(resumen[:-1])
+                    f.write(', "objetos": [')
+                    for j, info in enumerate(habitacion.iterar_inventario()):
+                        if j:
+                            f.write(', ')
+                        f.write(json.dumps(info, ensure_ascii=False))
+                        total += 1
+                    f.write(']}')
+                f.write('}}\n')
+            print(f"✓ Inventario exportado en {archivo} ({total} objetos)")
+        except Exception as e:
+            print(f"✗ Error exportando archivo: {e}")
+        return total
+    
+    @staticmethod
+    def exportar_inventario_jsonl(casa: Casa, archivo: str, comprimir: bool = False) -> int:
+        """
+        Escribe el inventario en JSONL: una línea por registro.
+        El campo "registro" indica si la línea es la casa, una habitación
+        o un objeto; los objetos llevan el nombre de su habitación.
+        Retorna la cantidad de objetos escritos.
+        """
+        total = 0
+        try:
+            with GestorArchivos._abrir_escritura(archivo, comprimir) as f:
+                registro = {"registro": "casa"}
+                registro.update(casa.obtener_datos_casa())
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                for habitacion in casa.habitaciones:
+                    registro = {"registro": "habitacion", "nombre": habitacion.nombre}
+                    registro.update(habitacion.obtener_resumen())
+                    f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                    for info in habitacion.iterar_inventario():
+                        registro = {"registro": "objeto", "habitacion": habitacion.nombre}
+                        registro.update(info)
+                        f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                        total += 1
+            print(f"✓ Inventario exportado en {archivo} ({total} objetos)")
+        except Exception as e:
+            print(f"✗ Error exportando archivo: {e}")
+        return total
+
+def _hace_anios(anios: int) -> datetime:
+    """Misma fecha de hoy, `anios` años atrás (el 29 de febrero pasa al 28)"""
+    hoy = datetime.now()
+    try:
+        return hoy.replace(year=hoy.year - anios)
+    except ValueError:
+        return hoy.replace(year=hoy.year - anios, day=28)
 
-def crear_inventario_predefinido() -> Casa:
+def crear_inventario_predefinido(almacen: Optional[AlmacenColumnar] = None) -> Casa:
     """
-    Crea el inventario fijo de la casa con todos los objetos predefinidos
+    Crea el inventario fijo de la casa con todos los objetos predefinidos.
+    Si se indica un almacén columnar, los objetos se guardan en él.
     """
-    casa = Casa("Casa Familiar Ejemplo", "Calle Principal 123, Ciudad Ejemplo")
+    casa = Casa("Casa Familiar Ejemplo", "Calle Principal 123, Ciudad Ejemplo", almacen)
     
     # COCINA
-    cocina = Habitacion("Cocina", 15.0)
+    cocina = Habitacion("Cocina", 15.0, almacen)
     cocina.agregar_objeto(Electrodomestico(
         "Refrigerador", "Cocina", "Samsung", 350, 
-        EstadoConservacion.BUENO, 25000, 24
+        EstadoConservacion.BUENO, 25000, 24,
+        fecha_adquisicion=_hace_anios(2)
     ))
     cocina.agregar_objeto(Electrodomestico(
         "Horno Microondas", "Cocina", "LG", 1200,
-        EstadoConservacion.EXCELENTE, 8000, 18
+        EstadoConservacion.EXCELENTE, 8000, 18,
+        fecha_adquisicion=_hace_anios(2)
     ))
     cocina.agregar_objeto(UtensilioCocina(
         "Juego de Cubiertos", "Cocina", "Acero Inoxidable",
-        EstadoConservacion.BUENO, 1500, False
+        EstadoConservacion.BUENO, 1500, False,
+        fecha_adquisicion=_hace_anios(2)
     ))
     cocina.agregar_objeto(UtensilioCocina(
         "Sartén Antiadherente", "Cocina", "Tefal",
-        EstadoConservacion.REGULAR, 800, False
+        EstadoConservacion.REGULAR, 800, False,
+        fecha_adquisicion=_hace_anios(2)
     ))
     cocina.agregar_objeto(Mueble(
         "Mesa de Cocina", "Cocina", "Madera", "1.2m x 0.8m",
-        EstadoConservacion.BUENO, 4500, "Rústico"
+        EstadoConservacion.BUENO, 4500, "Rústico",
+        fecha_adquisicion=_hace_anios(4)
     ))
     casa.agregar_habitacion(cocina)
     
     # SALA
-    sala = Habitacion("Sala", 25.0)
+    sala = Habitacion("Sala", 25.0, almacen)
     sala.agregar_objeto(Mueble(
         "Sofá 3 Plazas", "Sala", "Cuero Sintético", "2.1m x 0.9m",
-        EstadoConservacion.BUENO, 12000, "Moderno"
+        EstadoConservacion.BUENO, 12000, "Moderno",
+        fecha_adquisicion=_hace_anios(4)
     ))
     sala.agregar_objeto(Mueble(
         "Mesa de Centro", "Sala", "Cristal y Metal", "1.0m x 0.6m",
-        EstadoConservacion.EXCELENTE, 3500, "Contemporáneo"
+        EstadoConservacion.EXCELENTE, 3500, "Contemporáneo",
+        fecha_adquisicion=_hace_anios(4)
     ))
     sala.agregar_objeto(Electrodomestico(
         "Televisor 55'", "Sala", "Sony", 180,
-        EstadoConservacion.EXCELENTE, 18000, 36
+        EstadoConservacion.EXCELENTE, 18000, 36,
+        fecha_adquisicion=_hace_anios(2)
     ))
     sala.agregar_objeto(Mueble(
         "Estantería", "Sala", "Madera MDF", "1.8m x 0.4m",
-        EstadoConservacion.BUENO, 2800, "Moderno"
+        EstadoConservacion.BUENO, 2800, "Moderno",
+        fecha_adquisicion=_hace_anios(4)
     ))
     casa.agregar_habitacion(sala)
     
     # DORMITORIO PRINCIPAL
-    dormitorio = Habitacion("Dormitorio Principal", 18.0)
+    dormitorio = Habitacion("Dormitorio Principal", 18.0, almacen)
     dormitorio.agregar_objeto(Mueble(
         "Cama Queen Size", "Dormitorio", "Madera de Roble", "2.0m x 1.6m",
-        EstadoConservacion.BUENO, 15000, "Clásico"
+        EstadoConservacion.BUENO, 15000, "Clásico",
+        fecha_adquisicion=_hace_anios(4)
     ))
     dormitorio.agregar_objeto(Mueble(
         "Armario Empotrado", "Dormitorio", "Madera", "2.2m x 1.8m",
-        EstadoConservacion.BUENO, 8500, "Moderno"
+        EstadoConservacion.BUENO, 8500, "Moderno",
+        fecha_adquisicion=_hace_anios(4)
     ))
     dormitorio.agregar_objeto(Ropa(
         "Traje Formal", "Dormitorio", "Lana", "M",
-        EstadoConservacion.EXCELENTE, 3000, "Invierno"
+        EstadoConservacion.EXCELENTE, 3000, "Invierno",
+        fecha_adquisicion=_hace_anios(1)
     ))
     dormitorio.agregar_objeto(Ropa(
         "Vestido de Noche", "Dormitorio", "Seda", "S",
-        EstadoConservacion.BUENO, 2500, "Verano"
+        EstadoConservacion.BUENO, 2500, "Verano",
+        fecha_adquisicion=_hace_anios(1)
     ))
     dormitorio.agregar_objeto(Electrodomestico(
         "Lámpara de Noche", "Dormitorio", "Philips", 15,
-        EstadoConservacion.REGULAR, 600, 6
+        EstadoConservacion.REGULAR, 600, 6,
+        fecha_adquisicion=_hace_anios(2)
     ))
     casa.agregar_habitacion(dormitorio)
     
     # GARAJE
-    garaje = Habitacion("Garaje", 30.0)
+    garaje = Habitacion("Garaje", 30.0, almacen)
     garaje.agregar_objeto(Herramienta(
         "Taladro Percutor", "Garaje", "Metal/Plástico",
-        EstadoConservacion.BUENO, 1800, True
+        EstadoConservacion.BUENO, 1800, True,
+        fecha_adquisicion=_hace_anios(3)
     ))
     garaje.agregar_objeto(Herramienta(
         "Juego de Llaves", "Garaje", "Acero Cromado",
-        EstadoConservacion.EXCELENTE, 1200, False
+        EstadoConservacion.EXCELENTE, 1200, False,
+        fecha_adquisicion=_hace_anios(3)
     ))
     garaje.agregar_objeto(Herramienta(
         "Escalera Extensible", "Garaje", "Aluminio",
-        EstadoConservacion.REGULAR, 3200, False
+        EstadoConservacion.REGULAR, 3200, False,
+        fecha_adquisicion=_hace_anios(3)
     ))
     garaje.agregar_objeto(ArticuloLimpieza(
         "Aspiradora", "Garaje", "Pisos/Muebles",
-        EstadoConservacion.BUENO, 4500, False
+        EstadoConservacion.BUENO, 4500, False,
+        fecha_adquisicion=_hace_anios(1)
     ))
     garaje.agregar_objeto(ArticuloLimpieza(
         "Juego de Trapos", "Garaje", "Superficies",
-        EstadoConservacion.MALO, 300, True
+        EstadoConservacion.MALO, 300, True,
+        fecha_adquisicion=_hace_anios(1)
     ))
     casa.agregar_habitacion(garaje)
     
     # BAÑO
-    bano = Habitacion("Baño Principal", 8.0)
+    bano = Habitacion("Baño Principal", 8.0, almacen)
     bano.agregar_objeto(Mueble(
         "Vanitorio", "Baño", "Mármol Sintético", "1.0m x 0.5m",
-        EstadoConservacion.BUENO, 5200, "Moderno"
+        EstadoConservacion.BUENO, 5200, "Moderno",
+        fecha_adquisicion=_hace_anios(4)
     ))
     bano.agregar_objeto(ArticuloLimpieza(
         "Juego de Toallas", "Baño", "Textiles",
-        EstadoConservacion.BUENO, 800, False
+        EstadoConservacion.BUENO, 800, False,
+        fecha_adquisicion=_hace_anios(1)
     ))
     bano.agregar_objeto(UtensilioCocina(
         "Espejo Aumento", "Baño", "Vidrio",
-        EstadoConservacion.EXCELENTE, 450, False
+        EstadoConservacion.EXCELENTE, 450, False,
+        fecha_adquisicion=_hace_anios(2)
     ))
     casa.agregar_habitacion(bano)
     
     return casa
 
-def mostrar_inventario_consola(casa: Casa):
-    """Muestra el inventario completo en la consola"""
-    print("=" * 80)
-    print("SISTEMA DE GESTIÓN DE INVENTARIO DE HOGAR")
-    print("=" * 80)
-    print(f"Casa: {casa._nombre}")
-    print(f"Dirección: {casa._direccion}")
-    print(f"Total habitaciones: {len(casa._habitaciones)}")
-    print("=" * 80)
-    
-    inventario = casa.obtener_inventario_completo()
-    reporte_financiero = casa.generar_reporte_financiero()
-    
-    for habitacion_nombre, datos_habitacion in inventario["habitaciones"].items():
-        print(f"\n🏠 HABITACIÓN: {habitacion_nombre.upper()}")
-        print(f"  Metros cuadrados: {datos_habitacion['metros_cuadrados']}m²")
-        print(f"  Total objetos: {datos_habitacion['total_objetos']}")
-        print(f"  Valor total: ${datos_habitacion['valor_total']:,.2f}")
-        print("  " + "-" * 50)
-        
-        for obj in datos_habitacion["objetos"]:
-            print(f"  • {obj['nombre']} ({obj['tipo']})")
-            print(f"    Estado: {obj['estado']} | Valor actual: ${obj['valor_actual']:,.2f}")
-    
-    # Mostrar reporte financiero
-    print("\n" + "=" * 80)
-    print("📊 REPORTE FINANCIERO DEL INVENTARIO")
-    print("=" * 80)
-    resumen = reporte_financiero["resumen_financiero"]
-    print(f"Valor total original: ${resumen['valor_total_original']:,.2f}")
-    print(f"Valor total actual: ${resumen['valor_total_actual']:,.2f}")
-    print(f"Depreciación total: ${resumen['depreciacion_total']:,.2f}")
-    print(f"Porcentaje de depreciación: {resumen['porcentaje_depreciacion']}%")
-    
-    print("\nVALOR POR CATEGORÍA:")
-    for categoria, valores in reporte_financiero["valor_por_categoria"].items():
-        print(f"  {categoria}:")
-        print(f"    Original: ${valores['original']:,.2f}")
-        print(f"    Actual: ${valores['actual']:,.2f}")
+def mostrar_inventario_consola(casa: Casa, inventario: Optional[Dict[str, Any]] = None,
+                               reporte_financiero: Optional[Dict[str, Any]] = None,
+                               habitaciones: Optional[List[str]] = None,
+                               categorias: Optional[List[str]] = None,
+                               pagina: int = 1, por_pagina: Optional[int] = None,
+                               salida: Optional[IO[str]] = None):
+    """
+    Muestra el inventario completo en la consola.
+    Acepta el inventario y el reporte ya calculados para no repetir el trabajo;
+    la salida se arma en un buffer y se escribe en bloques (ver RenderizadorConsola).
+    """
+    from renderizado_consola import RenderizadorConsola
+    RenderizadorConsola(salida).mostrar(
+        casa, inventario, reporte_financiero,
+        habitaciones=habitaciones, categorias=categorias,
+        pagina=pagina, por_pagina=por_pagina
+    )
 
-def main():
-    """Función principal del programa"""
+# Reporte que escribe la ejecución por defecto (relativo al directorio actual)
+RUTA_INVENTARIO_COMPLETO = 'data/inventario_completo.json'
+
+def ejecutar(casa: Optional[Casa] = None) -> bool:
+    """
+    Muestra y guarda el inventario predefinido (o la casa indicada, p. ej.
+    cargada de un snapshot); retorna si terminó bien
+    """
     try:
         # Crear inventario predefinido
-        casa = crear_inventario_predefinido()
+        if casa is None:
+            casa = crear_inventario_predefinido()
         
-        # Mostrar en consola
-        mostrar_inventario_consola(casa)
-        
-        # Guardar en archivo JSON
+        # Calcular una sola vez el inventario y el reporte
         inventario_completo = casa.obtener_inventario_completo()
         reporte_financiero = casa.generar_reporte_financiero()
         
+        # Mostrar en consola
+        mostrar_inventario_consola(casa, inventario_completo, reporte_financiero)
+        
         # Combinar ambos reportes
         reporte_completo = {
             "inventario": inventario_completo,
@@ -311,16 +964,71 @@ def main():
         
         # Guardar archivos
         GestorArchivos.guardar_inventario_json(
-            reporte_completo, 'data/inventario_completo.json'
+            reporte_completo, RUTA_INVENTARIO_COMPLETO
         )
         
         print(f"\n✅ Inventario procesado exitosamente!")
-        print(f"📁 Archivo guardado: data/inventario_completo.json")
+        print(f"📁 Archivo guardado: {RUTA_INVENTARIO_COMPLETO}")
+        return True
         
     except Exception as e:
         print(f"❌ Error en el sistema: {e}")
         import traceback
         traceback.print_exc()
+        return False
+
+def _leer_opciones(argv: List[str]) -> Tuple[bool, Optional[str]]:
+    """(instrumentar, perfil); argparse sólo se importa si hay opciones que leer"""
+    if not argv:
+        return False, None
+    import argparse
+    parser = argparse.ArgumentParser(description="Inventario del hogar")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="mostrar llamadas, tiempo y memoria de las rutas críticas")
+    parser.add_argument("--perfil", metavar="ARCHIVO",
+                        help="guardar un perfil de cProfile (leer con pstats)")
+    args = parser.parse_args(argv)
+    return args.instrumentar, args.perfil
+
+def _activar_instrumentacion():
+    """Registra los puntos medidos (ver instrumentacion.py), los activa y retorna el módulo"""
+    import instrumentacion
+    from entities.objetos_compactos import EQUIVALENTES
+    for clase in (*EQUIVALENTES.values(), *EQUIVALENTES):
+        instrumentacion.registrar(clase, "calcular_valor_actual", "_crear_informacion")
+    instrumentacion.registrar(ObjetoHogar, "obtener_informacion")
+    instrumentacion.registrar(Habitacion, "objetos", "obtener_inventario")
+    instrumentacion.registrar(Casa, "generar_reporte_financiero", "obtener_inventario_completo")
+    instrumentacion.registrar(
+        GestorArchivos, "guardar_inventario_json", "cargar_inventario_json",
+        "cargar_inventario_jsonl", "guardar_snapshot", "cargar_snapshot",
+        "exportar_inventario_json", "exportar_inventario_jsonl"
+    )
+    instrumentacion.activar()
+    return instrumentacion
+
+def main(argv: Optional[List[str]] = None):
+    """Función principal del programa"""
+    instrumentar, archivo_perfil = _leer_opciones(sys.argv[1:] if argv is None else argv)
+
+    if instrumentar:
+        instrumentacion = _activar_instrumentacion()
+    try:
+        if archivo_perfil:
+            import cProfile
+            perfil = cProfile.Profile()
+            perfil.runcall(ejecutar)
+            perfil.dump_stats(archivo_perfil)
+            print(f"📁 Perfil guardado: {archivo_perfil}")
+        else:
+            ejecutar()
+    finally:
+        if instrumentar:
+            instrumentacion.desactivar()
+            print("\n" + "=" * 80)
+            print("⏱  INSTRUMENTACIÓN")
+            print("=" * 80)
+            instrumentacion.imprimir_resumen()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Módulo con variantes compactas de los objetos del hogar.
+Usan __slots__ en lugar de __dict__ y guardan la fecha de adquisición como
+días desde 1970-01-01. Mantienen las mismas propiedades y la misma salida de
+obtener_informacion() que las clases de objetos_hogar.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Type
+
+from .categorias import ObjetoHogar, Categoria, EstadoConservacion
+from . import depreciacion
+from .objetos_hogar import (
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+)
+
+EPOCA = datetime(1970, 1, 1)
+_ORDINAL_EPOCA = EPOCA.toordinal()
+
+def dia_actual() -> int:
+    """
+    Días transcurridos desde 1970-01-01 hasta hoy (fecha local, como
+    datetime.now()). Usa la fecha guardada de depreciacion.hoy() en lugar de
+    consultar el reloj del sistema por cada objeto creado.
+    """
+    return depreciacion.hoy().toordinal() - _ORDINAL_EPOCA
+
+class ObjetoHogarCompacto(ObjetoHogar):
+    """Base compacta: atributos en slots y fecha como entero de días"""
+
+    __slots__ = ("_nombre", "_categoria", "_ubicacion", "_estado",
+                 "_valor_estimado", "_dias_adquisicion", "_informacion")
+
+    def __init__(self, nombre: str, categoria: Categoria, ubicacion: str,
+                 estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, dias_adquisicion: Optional[int] = None):
+        self._nombre = nombre
+        self._categoria = categoria
+        self._ubicacion = ubicacion
+        self._estado = estado
+        self._valor_estimado = valor_estimado
+        self._dias_adquisicion = dia_actual() if dias_adquisicion is None else dias_adquisicion
+        self._informacion = None
+
+    @property
+    def dias_adquisicion(self) -> int:
+        return self._dias_adquisicion
+
+    @property
+    def fecha_adquisicion(self) -> datetime:
+        return EPOCA + timedelta(days=self._dias_adquisicion)
+
+    def _asignar_fecha_adquisicion(self, fecha: datetime):
+        self._dias_adquisicion = (fecha - EPOCA).days
+        self._informacion = None
+
+class ElectrodomesticoCompacto(ObjetoHogarCompacto):
+    """Versión compacta de Electrodomestico"""
+
+    __slots__ = ("_marca", "_potencia_w", "_garantia_meses")
+    CODIGO_TIPO = Electrodomestico.CODIGO_TIPO
+    TIPO = Electrodomestico.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, marca: str,
+                 potencia_w: float, estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, garantia_meses: int = 12,
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.ELECTRONICOS, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._marca = marca
+        self._potencia_w = potencia_w
+        self._garantia_meses = garantia_meses
+
+    calcular_valor_actual = Electrodomestico.calcular_valor_actual
+    _crear_informacion = Electrodomestico._crear_informacion
+    desde_informacion = classmethod(Electrodomestico.desde_informacion.__func__)
+
+class HerramientaCompacta(ObjetoHogarCompacto):
+    """Versión compacta de Herramienta"""
+
+    __slots__ = ("_material", "_es_electrica")
+    CODIGO_TIPO = Herramienta.CODIGO_TIPO
+    TIPO = Herramienta.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, material: str,
+                 estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, es_electrica: bool = False,
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.HERRAMIENTAS, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._material = material
+        self._es_electrica = es_electrica
+
+    calcular_valor_actual = Herramienta.calcular_valor_actual
+    _crear_informacion = Herramienta._crear_informacion
+    desde_informacion = classmethod(Herramienta.desde_informacion.__func__)
+
+class RopaCompacta(ObjetoHogarCompacto):
+    """Versión compacta de Ropa"""
+
+    __slots__ = ("_tela", "_talla", "_temporada")
+    CODIGO_TIPO = Ropa.CODIGO_TIPO
+    TIPO = Ropa.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, tela: str, talla: str,
+                 estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, temporada: str = "Todo el año",
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.ROPA, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._tela = tela
+        self._talla = talla
+        self._temporada = temporada
+
+    calcular_valor_actual = Ropa.calcular_valor_actual
+    _crear_informacion = Ropa._crear_informacion
+    desde_informacion = classmethod(Ropa.desde_informacion.__func__)
+
+class MuebleCompacto(ObjetoHogarCompacto):
+    """Versión compacta de Mueble"""
+
+    __slots__ = ("_material", "_dimensiones", "_estilo", "_codigo_material")
+    CODIGO_TIPO = Mueble.CODIGO_TIPO
+    TIPO = Mueble.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, material: str,
+                 dimensiones: str, estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, estilo: str = "Moderno",
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.MUEBLES, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._material = material
+        self._dimensiones = dimensiones
+        self._estilo = estilo
+        self._codigo_material = depreciacion.codigo_material(material)
+
+    codigo_material = Mueble.codigo_material
+    calcular_valor_actual = Mueble.calcular_valor_actual
+    _crear_informacion = Mueble._crear_informacion
+    desde_informacion = classmethod(Mueble.desde_informacion.__func__)
+
+class UtensilioCocinaCompacto(ObjetoHogarCompacto):
+    """Versión compacta de UtensilioCocina"""
+
+    __slots__ = ("_material", "_es_afilable")
+    CODIGO_TIPO = UtensilioCocina.CODIGO_TIPO
+    TIPO = UtensilioCocina.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, material: str,
+                 estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, es_afilable: bool = False,
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.COCINA, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._material = material
+        self._es_afilable = es_afilable
+
+    calcular_valor_actual = UtensilioCocina.calcular_valor_actual
+    _crear_informacion = UtensilioCocina._crear_informacion
+    desde_informacion = classmethod(UtensilioCocina.desde_informacion.__func__)
+
+class ArticuloLimpiezaCompacto(ObjetoHogarCompacto):
+    """Versión compacta de ArticuloLimpieza"""
+
+    __slots__ = ("_tipo_limpieza", "_es_desechable")
+    CODIGO_TIPO = ArticuloLimpieza.CODIGO_TIPO
+    TIPO = ArticuloLimpieza.TIPO
+
+    def __init__(self, nombre: str, ubicacion: str, tipo_limpieza: str,
+                 estado: EstadoConservacion = EstadoConservacion.BUENO,
+                 valor_estimado: float = 0.0, es_desechable: bool = False,
+                 dias_adquisicion: Optional[int] = None):
+        super().__init__(nombre, Categoria.LIMPIEZA, ubicacion, estado,
+                         valor_estimado, dias_adquisicion)
+        self._tipo_limpieza = tipo_limpieza
+        self._es_desechable = es_desechable
+
+    calcular_valor_actual = ArticuloLimpieza.calcular_valor_actual
+    _crear_informacion = ArticuloLimpieza._crear_informacion
+    desde_informacion = classmethod(ArticuloLimpieza.desde_informacion.__func__)
+
+# Clase normal equivalente a cada clase compacta
+EQUIVALENTES: Dict[Type[ObjetoHogarCompacto], Type[ObjetoHogar]] = {
+    ElectrodomesticoCompacto: Electrodomestico,
+    HerramientaCompacta: Herramienta,
+    RopaCompacta: Ropa,
+    MuebleCompacto: Mueble,
+    UtensilioCocinaCompacto: UtensilioCocina,
+    ArticuloLimpiezaCompacto: ArticuloLimpieza,
+}
@@ -1,30 +1,44 @@
 """
 Módulo con las implementaciones específicas de objetos del hogar.
 """
+import sys
+
 from .categorias import ObjetoHogar, Categoria, EstadoConservacion
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from . import depreciacion
+from typing import Dict, Any, List, Optional
+from datetime import date, datetime, timedelta
+
+def _con_fecha(objeto: ObjetoHogar, datos: Dict[str, Any]) -> ObjetoHogar:
+    """Restaura la fecha de adquisición guardada por obtener_informacion(), si la hay"""
+    if "fecha_adquisicion" in datos:
+        objeto._asignar_fecha_adquisicion(datetime.fromisoformat(datos["fecha_adquisicion"]))
+    return objeto
 
 class Electrodomestico(ObjetoHogar):
     """Representa electrodomésticos del hogar"""
     
+    CODIGO_TIPO = depreciacion.TIPO_ELECTRODOMESTICO
+    TIPO = "Electrodoméstico"
+    
     def __init__(self, nombre: str, ubicacion: str, marca: str, 
                  potencia_w: float, estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, garantia_meses: int = 12):
-        super().__init__(nombre, Categoria.ELECTRONICOS, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, garantia_meses: int = 12,
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.ELECTRONICOS, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._marca = marca
         self._potencia_w = potencia_w
         self._garantia_meses = garantia_meses
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """Calcula valor con depreciación del 15% anual"""
-        años_uso = 2  # Simulado
-        depreciacion = 0.15 * años_uso
-        return max(0, self._valor_estimado * (1 - depreciacion))
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, meses_uso=self.meses_uso(fecha)
+        )
     
-    def obtener_informacion(self) -> Dict[str, Any]:
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Electrodoméstico",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "marca": self._marca,
             "categoria": self._categoria.value,
@@ -33,28 +47,42 @@ class Electrodomestico(ObjetoHogar):
             "potencia_w": self._potencia_w,
             "valor_original": self._valor_estimado,
             "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat(),
             "garantia_meses": self._garantia_meses
         }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "Electrodomestico":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["marca"], datos["potencia_w"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["garantia_meses"])
+        return _con_fecha(objeto, datos)
 
 class Herramienta(ObjetoHogar):
     """Representa herramientas del hogar"""
     
+    CODIGO_TIPO = depreciacion.TIPO_HERRAMIENTA
+    TIPO = "Herramienta"
+    
     def __init__(self, nombre: str, ubicacion: str, material: str,
                  estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, es_electrica: bool = False):
-        super().__init__(nombre, Categoria.HERRAMIENTAS, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, es_electrica: bool = False,
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.HERRAMIENTAS, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._material = material
         self._es_electrica = es_electrica
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """Herramientas se deprecian menos - 8% anual"""
-        años_uso = 3  # Simulado
-        depreciacion = 0.08 * años_uso
-        return max(0, self._valor_estimado * (1 - depreciacion))
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, meses_uso=self.meses_uso(fecha)
+        )
     
-    def obtener_informacion(self) -> Dict[str, Any]:
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Herramienta",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "material": self._material,
             "categoria": self._categoria.value,
@@ -62,29 +90,43 @@ class Herramienta(ObjetoHogar):
             "estado": self._estado.value,
             "electrica": self._es_electrica,
             "valor_original": self._valor_estimado,
-            "valor_actual": self.calcular_valor_actual()
+            "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat()
         }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "Herramienta":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["material"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["electrica"])
+        return _con_fecha(objeto, datos)
 
 class Ropa(ObjetoHogar):
     """Representa prendas de vestir"""
     
+    CODIGO_TIPO = depreciacion.TIPO_ROPA
+    TIPO = "Ropa"
+    
     def __init__(self, nombre: str, ubicacion: str, tela: str, talla: str,
                  estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, temporada: str = "Todo el año"):
-        super().__init__(nombre, Categoria.ROPA, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, temporada: str = "Todo el año",
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.ROPA, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._tela = tela
         self._talla = talla
         self._temporada = temporada
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """La ropa se deprecia rápido - 30% anual"""
-        años_uso = 1  # Simulado
-        depreciacion = 0.3 * años_uso
-        return max(0, self._valor_estimado * (1 - depreciacion))
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, meses_uso=self.meses_uso(fecha)
+        )
     
-    def obtener_informacion(self) -> Dict[str, Any]:
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Ropa",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "tela": self._tela,
             "talla": self._talla,
@@ -93,32 +135,49 @@ class Ropa(ObjetoHogar):
             "estado": self._estado.value,
             "temporada": self._temporada,
             "valor_original": self._valor_estimado,
-            "valor_actual": self.calcular_valor_actual()
+            "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat()
         }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "Ropa":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["tela"], datos["talla"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["temporada"])
+        return _con_fecha(objeto, datos)
 
 class Mueble(ObjetoHogar):
     """Representa muebles del hogar"""
     
+    CODIGO_TIPO = depreciacion.TIPO_MUEBLE
+    TIPO = "Mueble"
+    
     def __init__(self, nombre: str, ubicacion: str, material: str, 
                  dimensiones: str, estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, estilo: str = "Moderno"):
-        super().__init__(nombre, Categoria.MUEBLES, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, estilo: str = "Moderno",
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.MUEBLES, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._material = material
         self._dimensiones = dimensiones
         self._estilo = estilo
+        self._codigo_material = depreciacion.codigo_material(material)
+    
+    @property
+    def codigo_material(self) -> int:
+        return self._codigo_material
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """Muebles de buena calidad pueden mantener valor"""
-        años_uso = 4  # Simulado
-        if self._material.lower() in ["madera solida", "roble", "caoba"]:
-            depreciacion = 0.05 * años_uso  # Sólo 5% anual
-        else:
-            depreciacion = 0.1 * años_uso  # 10% anual
-        return max(0, self._valor_estimado * (1 - depreciacion))
-    
-    def obtener_informacion(self) -> Dict[str, Any]:
+        # Madera sólida, roble y caoba: 5% anual; otros materiales: 10% anual
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, self._codigo_material, self.meses_uso(fecha)
+        )
+    
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Mueble",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "material": self._material,
             "dimensiones": self._dimensiones,
@@ -127,28 +186,42 @@ class Mueble(ObjetoHogar):
             "estado": self._estado.value,
             "estilo": self._estilo,
             "valor_original": self._valor_estimado,
-            "valor_actual": self.calcular_valor_actual()
+            "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat()
         }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "Mueble":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["material"], datos["dimensiones"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["estilo"])
+        return _con_fecha(objeto, datos)
 
 class UtensilioCocina(ObjetoHogar):
     """Representa utensilios de cocina"""
     
+    CODIGO_TIPO = depreciacion.TIPO_UTENSILIO_COCINA
+    TIPO = "Utensilio Cocina"
+    
     def __init__(self, nombre: str, ubicacion: str, material: str,
                  estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, es_afilable: bool = False):
-        super().__init__(nombre, Categoria.COCINA, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, es_afilable: bool = False,
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.COCINA, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._material = material
         self._es_afilable = es_afilable
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """Utensilios se deprecian moderadamente"""
-        años_uso = 2  # Simulado
-        depreciacion = 0.12 * años_uso
-        return max(0, self._valor_estimado * (1 - depreciacion))
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, meses_uso=self.meses_uso(fecha)
+        )
     
-    def obtener_informacion(self) -> Dict[str, Any]:
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Utensilio Cocina",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "material": self._material,
             "categoria": self._categoria.value,
@@ -156,28 +229,42 @@ class UtensilioCocina(ObjetoHogar):
             "estado": self._estado.value,
             "afilable": self._es_afilable,
             "valor_original": self._valor_estimado,
-            "valor_actual": self.calcular_valor_actual()
+            "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat()
         }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "UtensilioCocina":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["material"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["afilable"])
+        return _con_fecha(objeto, datos)
 
 class ArticuloLimpieza(ObjetoHogar):
     """Representa artículos de limpieza"""
     
+    CODIGO_TIPO = depreciacion.TIPO_ARTICULO_LIMPIEZA
+    TIPO = "Artículo Limpieza"
+    
     def __init__(self, nombre: str, ubicacion: str, tipo_limpieza: str,
                  estado: EstadoConservacion = EstadoConservacion.BUENO,
-                 valor_estimado: float = 0.0, es_desechable: bool = False):
-        super().__init__(nombre, Categoria.LIMPIEZA, ubicacion, estado, valor_estimado)
+                 valor_estimado: float = 0.0, es_desechable: bool = False,
+                 fecha_adquisicion: Optional[datetime] = None):
+        super().__init__(nombre, Categoria.LIMPIEZA, ubicacion, estado, valor_estimado,
+                         fecha_adquisicion)
         self._tipo_limpieza = tipo_limpieza
         self._es_desechable = es_desechable
     
-    def calcular_valor_actual(self) -> float:
+    def calcular_valor_actual(self, fecha: Optional[date] = None) -> float:
         """Artículos de limpieza pierden valor rápido"""
-        años_uso = 1  # Simulado
-        depreciacion = 0.4 * años_uso
-        return max(0, self._valor_estimado * (1 - depreciacion))
+        return depreciacion.calcular_valor_actual(
+            self._valor_estimado, self.CODIGO_TIPO, meses_uso=self.meses_uso(fecha)
+        )
     
-    def obtener_informacion(self) -> Dict[str, Any]:
+    def _crear_informacion(self) -> Dict[str, Any]:
         return {
-            "tipo": "Artículo Limpieza",
+            "tipo": self.TIPO,
             "nombre": self._nombre,
             "tipo_limpieza": self._tipo_limpieza,
             "categoria": self._categoria.value,
@@ -185,5 +272,38 @@ class ArticuloLimpieza(ObjetoHogar):
             "estado": self._estado.value,
             "desechable": self._es_desechable,
             "valor_original": self._valor_estimado,
-            "valor_actual": self.calcular_valor_actual()
-        }
\ No newline at end of file
+            "valor_actual": self.calcular_valor_actual(),
+            "fecha_adquisicion": self.fecha_adquisicion.date().isoformat()
+        }
+    
+    @classmethod
+    def desde_informacion(cls, datos: Dict[str, Any]) -> "ArticuloLimpieza":
+        """Reconstruye el objeto a partir de lo que retorna obtener_informacion()"""
+        objeto = cls(datos["nombre"], datos["ubicacion"], datos["tipo_limpieza"],
+                     EstadoConservacion(datos["estado"]), datos["valor_original"],
+                     datos["desechable"])
+        return _con_fecha(objeto, datos)
+
+TIPOS_POR_NOMBRE: Dict[str, type] = {
+    clase.TIPO: clase
+    for clase in (Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza)
+}
+
+# Campos de texto que se repiten entre objetos: al cargar se internan para
+# que todos los objetos compartan la misma cadena
+CAMPOS_COMPARTIDOS = frozenset({
+    "ubicacion", "marca", "material", "dimensiones", "tela", "talla",
+    "temporada", "estilo", "tipo_limpieza"
+})
+
+def crear_desde_informacion(datos: Dict[str, Any]) -> ObjetoHogar:
+    """Crea la subclase correcta según el campo "tipo" de obtener_informacion()"""
+    clase = TIPOS_POR_NOMBRE.get(datos.get("tipo"))
+    if clase is None:
+        raise ValueError(f"Tipo de objeto desconocido: {datos.get('tipo')}")
+    datos = {
+        clave: sys.intern(valor) if clave in CAMPOS_COMPARTIDOS and isinstance(valor, str)
+        else valor
+        for clave, valor in datos.items()
+    }
+    return clase.desde_informacion(datos)
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Módulo de persistencia incremental del inventario.
+Cada cambio de una Casa (habitación agregada, objeto agregado, eliminado o
+modificado) se agrega como una línea JSONL a un registro de cambios, así que
+guardar cuesta lo que mide el cambio y no lo que mide el inventario.
+Cada tanto el registro se compacta en un snapshot binario completo, y al
+recuperar se carga el último snapshot y se reaplican los cambios.
+
+Estructura del directorio:
+    cambios.jsonl          registro; la primera línea indica la generación
+    snapshot-<gen>.bin     snapshot binario de esa generación
+
+Los objetos se identifican en el registro por una "clave" estable entre
+ejecuciones (los ids de Habitacion son sólo de la sesión): al compactar, las
+claves pasan a ser el orden de los objetos en el snapshot.
+"""
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from entities.categorias import EstadoConservacion, ObjetoHogar
+from entities.objetos_hogar import crear_desde_informacion
+from almacen_columnar import AlmacenColumnar
+import snapshot_binario
+from snapshot_binario import SnapshotCasa
+from main import (
+    Casa, Habitacion, OBJETO_AGREGADO, OBJETO_ELIMINADO, OBJETO_MODIFICADO,
+    HABITACION_AGREGADA
+)
+
+ARCHIVO_REGISTRO = "cambios.jsonl"
+COMPACTAR_CADA = 10000  # cambios acumulados antes de compactar automáticamente
+
+# Operaciones del registro
+OP_BASE = "base"
+OP_HABITACION = "habitacion"
+OP_AGREGAR = "agregar"
+OP_ELIMINAR = "eliminar"
+OP_MODIFICAR = "modificar"
+
+class ErrorRegistro(Exception):
+    """El registro de cambios no se puede aplicar sobre su snapshot"""
+
+def _archivo_snapshot(directorio: str, generacion: int) -> str:
+    return os.path.join(directorio, f"snapshot-{generacion}.bin")
+
+def _sincronizar_directorio(directorio: str):
+    """fsync del directorio para que los renames hechos en él sean durables"""
+    try:
+        descriptor = os.open(directorio, os.O_RDONLY)
+    except OSError:
+        return  # p. ej. Windows, donde no se pueden abrir directorios
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+class RegistroCambios:
+    """
+    Registro de cambios (write-ahead log) de una casa.
+    Usar RegistroCambios.iniciar para una casa nueva o RegistroCambios.recuperar
+    para reconstruirla desde disco; a partir de ahí los cambios hechos con la
+    API de Habitacion/Casa se registran solos.
+    """
+
+    def __init__(self, casa: Casa, directorio: str, generacion: int,
+                 compactar_cada: Optional[int] = COMPACTAR_CADA, sincronizar: bool = False):
+        self._casa = casa
+        self._directorio = directorio
+        self._generacion = generacion
+        self._compactar_cada = compactar_cada
+        self._sincronizar = sincronizar
+        self._claves: Dict[int, int] = {}
+        self._siguiente_clave = 0
+        self._cambios = 0
+        self._archivo = None
+
+    @property
+    def casa(self) -> Casa:
+        return self._casa
+
+    @property
+    def generacion(self) -> int:
+        return self._generacion
+
+    @property
+    def cambios_pendientes(self) -> int:
+        """Cambios registrados desde la última compactación"""
+        return self._cambios
+
+    @property
+    def _ruta_registro(self) -> str:
+        return os.path.join(self._directorio, ARCHIVO_REGISTRO)
+
+    @classmethod
+    def iniciar(cls, casa: Casa, directorio: str, **opciones) -> "RegistroCambios":
+        """Empieza a registrar una casa, escribiendo su primer snapshot"""
+        os.makedirs(directorio, exist_ok=True)
+        if os.path.exists(os.path.join(directorio, ARCHIVO_REGISTRO)):
+            raise ErrorRegistro(f"{directorio} ya tiene un registro de cambios")
+        registro = cls(casa, directorio, 0, **opciones)
+        registro.compactar()
+        casa.agregar_observador_objetos(registro._registrar_evento)
+        return registro
+
+    @classmethod
+    def recuperar(cls, directorio: str, almacen: Optional[AlmacenColumnar] = None,
+                  **opciones) -> "RegistroCambios":
+        """Carga el último snapshot, reaplica el registro y sigue registrando"""
+        ruta = os.path.join(directorio, ARCHIVO_REGISTRO)
+        with open(ruta, 'rb') as f:
+            base = json.loads(f.readline())
+            if base.get("op") != OP_BASE:
+                raise ErrorRegistro(f"{ruta} no empieza con el registro base")
+            with SnapshotCasa(_archivo_snapshot(directorio, base["generacion"])) as snapshot:
+                casa = Casa.desde_snapshot(snapshot, almacen)
+
+            registro = cls(casa, directorio, base["generacion"], **opciones)
+            objetos = registro._asignar_claves()
+            habitaciones = {habitacion.nombre: habitacion for habitacion in casa.habitaciones}
+            fin_valido = f.tell()
+            for numero_linea, linea in enumerate(iter(f.readline, b""), start=2):
+                try:
+                    cambio = json.loads(linea)
+                except json.JSONDecodeError:
+                    # Sólo la última línea puede quedar cortada por una caída
+                    if f.readline():
+                        raise ErrorRegistro(f"Línea {numero_linea} inválida en {ruta}")
+                    break
+                registro._aplicar(cambio, habitaciones, objetos)
+                registro._cambios += 1
+                fin_valido = f.tell()
+
+        # Se descarta la línea cortada para que los cambios nuevos no se peguen a ella
+        if os.path.getsize(ruta) != fin_valido:
+            os.truncate(ruta, fin_valido)
+        casa.agregar_observador_objetos(registro._registrar_evento)
+        return registro
+
+    def _asignar_claves(self) -> Dict[int, Tuple[Habitacion, int]]:
+        """Numera los objetos en el orden del snapshot; retorna clave -> (habitación, id)"""
+        objetos = {}
+        self._claves = {}
+        clave = 0
+        for habitacion in self._casa.habitaciones:
+            for id_objeto, _ in habitacion.iterar_con_ids():
+                self._claves[id_objeto] = clave
+                objetos[clave] = (habitacion, id_objeto)
+                clave += 1
+        self._siguiente_clave = clave
+        return objetos
+
+    def _aplicar(self, cambio: Dict[str, Any], habitaciones: Dict[str, Habitacion],
+                 objetos: Dict[int, Tuple[Habitacion, int]]):
+        op = cambio.get("op")
+        if op == OP_HABITACION:
+            habitacion = Habitacion(cambio["nombre"], cambio["metros_cuadrados"],
+                                    self._casa.almacen)
+            self._casa.agregar_habitacion(habitacion)
+            habitaciones[habitacion.nombre] = habitacion
+        elif op == OP_AGREGAR:
+            habitacion = habitaciones[cambio["habitacion"]]
+            id_objeto = habitacion.agregar_objeto(crear_desde_informacion(cambio["objeto"]))
+            self._claves[id_objeto] = cambio["clave"]
+            objetos[cambio["clave"]] = (habitacion, id_objeto)
+            self._siguiente_clave = max(self._siguiente_clave, cambio["clave"] + 1)
+        elif op == OP_ELIMINAR:
+            habitacion, id_objeto = objetos.pop(cambio["clave"])
+            habitacion.eliminar_objeto(habitacion.posicion_de(id_objeto))
+            del self._claves[id_objeto]
+        elif op == OP_MODIFICAR:
+            habitacion, id_objeto = objetos[cambio["clave"]]
+            posicion = habitacion.posicion_de(id_objeto)
+            objeto = habitacion.obtener_objeto_por_id(id_objeto)
+            estado = EstadoConservacion(cambio["estado"])
+            if objeto.estado != estado:
+                habitacion.cambiar_estado_objeto(posicion, estado)
+            if objeto.valor_estimado != cambio["valor_estimado"]:
+                habitacion.actualizar_valor_objeto(posicion, cambio["valor_estimado"])
+        else:
+            raise ErrorRegistro(f"Operación desconocida en el registro: {op}")
+
+    def _escribir(self, cambio: Dict[str, Any]):
+        if self._archivo is None:
+            self._archivo = open(self._ruta_registro, 'a', encoding='utf-8')
+        self._archivo.write(json.dumps(cambio, ensure_ascii=False) + "\n")
+        self._archivo.flush()
+        if self._sincronizar:
+            os.fsync(self._archivo.fileno())
+        self._cambios += 1
+
+    def _registrar_objeto(self, habitacion: Habitacion, id_objeto: int, objeto: ObjetoHogar):
+        clave = self._siguiente_clave
+        self._siguiente_clave += 1
+        self._claves[id_objeto] = clave
+        self._escribir({
+            "op": OP_AGREGAR, "clave": clave, "habitacion": habitacion.nombre,
+            "objeto": objeto.obtener_informacion()
+        })
+
+    def _registrar_evento(self, evento: str, habitacion: Habitacion,
+                          id_objeto: Optional[int], objeto: Optional[ObjetoHogar]):
+        if evento == HABITACION_AGREGADA:
+            self._escribir({
+                "op": OP_HABITACION, "nombre": habitacion.nombre,
+                "metros_cuadrados": habitacion.obtener_resumen()["metros_cuadrados"]
+            })
+            for id_existente, existente in habitacion.iterar_con_ids():
+                self._registrar_objeto(habitacion, id_existente, existente)
+        elif evento == OBJETO_AGREGADO:
+            self._registrar_objeto(habitacion, id_objeto, objeto)
+        elif evento == OBJETO_ELIMINADO:
+            self._escribir({"op": OP_ELIMINAR, "clave": self._claves.pop(id_objeto)})
+        elif evento == OBJETO_MODIFICADO:
+            self._escribir({
+                "op": OP_MODIFICAR, "clave": self._claves[id_objeto],
+                "estado": objeto.estado.value, "valor_estimado": objeto.valor_estimado
+            })
+
+        if self._compactar_cada is not None and self._cambios >= self._compactar_cada:
+            self.compactar()
+
+    def compactar(self):
+        """
+        Escribe un snapshot completo y empieza un registro vacío.
+        El registro nuevo se escribe aparte y reemplaza al anterior con un
+        rename, así una caída a mitad de camino deja la generación anterior intacta.
+        El snapshot se sincroniza con el disco antes de que el registro lo nombre.
+        """
+        self.cerrar()
+        generacion = self._generacion + 1
+        # guardar_snapshot escribe en un temporal y lo renombra
+        snapshot_binario.guardar_snapshot(
+            self._casa, _archivo_snapshot(self._directorio, generacion), sincronizar=True
+        )
+
+        temporal = self._ruta_registro + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"op": OP_BASE, "generacion": generacion}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self._ruta_registro)
+        # Los dos renames deben ser durables antes de borrar el snapshot anterior
+        _sincronizar_directorio(self._directorio)
+
+        anterior = _archivo_snapshot(self._directorio, self._generacion)
+        if os.path.exists(anterior):
+            os.remove(anterior)
+        self._generacion = generacion
+        self._cambios = 0
+        self._asignar_claves()
+
+    def cerrar(self):
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+    def __enter__(self) -> "RegistroCambios":
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
@@ -0,0 +1,182 @@
+"""
+Módulo de renderizado del inventario en consola.
+Arma la salida en un buffer y la escribe en bloques grandes, en lugar de
+hacer varios print por objeto. Permite paginar los objetos y filtrarlos
+por habitación o categoría.
+"""
+import sys
+from itertools import islice
+from typing import IO, List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+
+TAMANO_BUFFER_CONSOLA = 64 * 1024  # caracteres acumulados antes de escribir
+
+SEPARADOR = "=" * 80
+SEPARADOR_HABITACION = "  " + "-" * 50
+
+class RenderizadorConsola:
+    """
+    Escribe el inventario de una casa en un flujo de texto.
+    Sin filtros ni paginación produce exactamente la misma salida que
+    mostrar_inventario_consola.
+    """
+
+    def __init__(self, salida: Optional[IO[str]] = None,
+                 tamano_buffer: int = TAMANO_BUFFER_CONSOLA):
+        self._salida = salida
+        self._tamano_buffer = tamano_buffer
+        self._partes: List[str] = []
+        self._pendiente = 0
+
+    def _escribir(self, linea: str):
+        self._partes.append(linea)
+        self._pendiente += len(linea) + 1
+        if self._pendiente >= self._tamano_buffer:
+            self.vaciar()
+
+    def vaciar(self):
+        """Escribe lo acumulado en el buffer"""
+        if not self._partes:
+            return
+        # sys.stdout se resuelve al escribir para respetar redirecciones
+        salida = self._salida if self._salida is not None else sys.stdout
+        self._partes.append("")
+        salida.write("\n".join(self._partes))
+        self._partes = []
+        self._pendiente = 0
+
+    def mostrar(self, casa, inventario: Optional[Dict[str, Any]] = None,
+                reporte_financiero: Optional[Dict[str, Any]] = None,
+                habitaciones: Optional[Iterable[str]] = None,
+                categorias: Optional[Iterable[str]] = None,
+                pagina: int = 1, por_pagina: Optional[int] = None,
+                incluir_reporte: bool = True):
+        """
+        Escribe el inventario de la casa.
+
+        Args:
+            inventario: resultado de obtener_inventario_completo; si no se pasa,
+                se recorren las habitaciones sin armar el inventario completo
+            reporte_financiero: resultado de generar_reporte_financiero
+            habitaciones: nombres de las habitaciones a mostrar
+            categorias: valores de categoría (p. ej. "Electrónicos") a mostrar
+            pagina: número de página, desde 1
+            por_pagina: objetos por página; None muestra todos
+        """
+        if pagina < 1:
+            raise ValueError("La página debe ser mayor o igual a 1")
+        if por_pagina is not None and por_pagina < 1:
+            raise ValueError("Los objetos por página deben ser al menos 1")
+        filtro_habitaciones = set(habitaciones) if habitaciones is not None else None
+        filtro_categorias = set(categorias) if categorias is not None else None
+
+        self._escribir(SEPARADOR)
+        self._escribir("SISTEMA DE GESTIÓN DE INVENTARIO DE HOGAR")
+        self._escribir(SEPARADOR)
+        self._escribir(f"Casa: {casa._nombre}")
+        self._escribir(f"Dirección: {casa._direccion}")
+        self._escribir(f"Total habitaciones: {len(casa._habitaciones)}")
+        self._escribir(SEPARADOR)
+
+        if inventario is not None:
+            secciones = self._secciones_inventario(inventario, filtro_habitaciones)
+        else:
+            secciones = self._secciones_casa(casa, filtro_habitaciones)
+
+        inicio = (pagina - 1) * por_pagina if por_pagina is not None else 0
+        restantes = por_pagina
+        total_visibles = 0
+        for nombre, resumen, cantidad, objetos in secciones:
+            visibles = cantidad(filtro_categorias)
+            desde = min(max(inicio - total_visibles, 0), visibles)
+            total_visibles += visibles
+            if filtro_categorias is not None and visibles == 0:
+                continue
+            if por_pagina is not None and (restantes == 0 or desde == visibles):
+                continue
+
+            self._escribir(f"\n🏠 HABITACIÓN: {nombre.upper()}")
+            self._escribir(f"  Metros cuadrados: {resumen['metros_cuadrados']}m²")
+            self._escribir(f"  Total objetos: {resumen['total_objetos']}")
+            self._escribir(f"  Valor total: ${resumen['valor_total']:,.2f}")
+            self._escribir(SEPARADOR_HABITACION)
+
+            for obj in objetos(filtro_categorias, desde, restantes):
+                self._escribir(f"  • {obj['nombre']} ({obj['tipo']})")
+                self._escribir(
+                    f"    Estado: {obj['estado']} | Valor actual: ${obj['valor_actual']:,.2f}"
+                )
+                if restantes is not None:
+                    restantes -= 1
+
+        if por_pagina is not None:
+            total_paginas = max(1, -(-total_visibles // por_pagina))
+            self._escribir(f"\nPágina {pagina} de {total_paginas} ({total_visibles} objetos)")
+
+        if incluir_reporte:
+            if reporte_financiero is None:
+                reporte_financiero = casa.generar_reporte_financiero()
+            self._escribir_reporte(reporte_financiero)
+        self.vaciar()
+
+    def _escribir_reporte(self, reporte_financiero: Dict[str, Any]):
+        self._escribir("\n" + SEPARADOR)
+        self._escribir("📊 REPORTE FINANCIERO DEL INVENTARIO")
+        self._escribir(SEPARADOR)
+        resumen = reporte_financiero["resumen_financiero"]
+        self._escribir(f"Valor total original: ${resumen['valor_total_original']:,.2f}")
+        self._escribir(f"Valor total actual: ${resumen['valor_total_actual']:,.2f}")
+        self._escribir(f"Depreciación total: ${resumen['depreciacion_total']:,.2f}")
+        self._escribir(f"Porcentaje de depreciación: {resumen['porcentaje_depreciacion']}%")
+
+        self._escribir("\nVALOR POR CATEGORÍA:")
+        for categoria, valores in reporte_financiero["valor_por_categoria"].items():
+            self._escribir(f"  {categoria}:")
+            self._escribir(f"    Original: ${valores['original']:,.2f}")
+            self._escribir(f"    Actual: ${valores['actual']:,.2f}")
+
+    @staticmethod
+    def _secciones_inventario(inventario: Dict[str, Any],
+                              filtro_habitaciones: Optional[Set[str]]) -> Iterator[Tuple]:
+        """Secciones (nombre, resumen, cantidad, objetos) a partir del inventario ya armado"""
+        for nombre, datos in inventario["habitaciones"].items():
+            if filtro_habitaciones is not None and nombre not in filtro_habitaciones:
+                continue
+            lista = datos["objetos"]
+
+            def cantidad(filtro, lista=lista):
+                if filtro is None:
+                    return len(lista)
+                return sum(1 for obj in lista if obj["categoria"] in filtro)
+
+            def objetos(filtro, desde, limite, lista=lista):
+                seleccion = lista if filtro is None else (
+                    obj for obj in lista if obj["categoria"] in filtro)
+                fin = None if limite is None else desde + limite
+                return islice(seleccion, desde, fin)
+
+            yield nombre, datos, cantidad, objetos
+
+    @staticmethod
+    def _secciones_casa(casa, filtro_habitaciones: Optional[Set[str]]) -> Iterator[Tuple]:
+        """
+        Secciones leídas directamente de las habitaciones: sólo se arma la
+        información de los objetos que se van a mostrar
+        """
+        for habitacion in casa._habitaciones:
+            if filtro_habitaciones is not None and habitacion.nombre not in filtro_habitaciones:
+                continue
+
+            def cantidad(filtro, habitacion=habitacion):
+                if filtro is None:
+                    return habitacion.total_objetos
+                cantidades = habitacion.obtener_cantidades_por_categoria()
+                return sum(cantidades.get(categoria, 0) for categoria in filtro)
+
+            def objetos(filtro, desde, limite, habitacion=habitacion):
+                seleccion = habitacion.iterar_objetos()
+                if filtro is not None:
+                    seleccion = (obj for obj in seleccion if obj.categoria.value in filtro)
+                fin = None if limite is None else desde + limite
+                return (obj.obtener_informacion() for obj in islice(seleccion, desde, fin))
+
+            yield habitacion.nombre, habitacion.obtener_resumen(), cantidad, objetos
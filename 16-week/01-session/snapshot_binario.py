@@ -0,0 +1,327 @@
+"""
+Módulo del snapshot binario de una casa.
+Formato de ancho fijo que se abre con mmap: abrirlo no decodifica nada y
+cada objeto se decodifica recién cuando se accede a él.
+
+Estructura del archivo (little endian):
+    cabecera | habitaciones | objetos | offsets de cadenas | bytes de cadenas
+Los nombres, materiales y demás textos se guardan una sola vez en la tabla
+de cadenas y los registros sólo guardan su índice.
+"""
+import mmap
+import os
+import struct
+from array import array
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Type
+
+from entities.categorias import ObjetoHogar
+from entities import depreciacion
+from entities.objetos_hogar import (
+    Electrodomestico, Herramienta, Ropa, Mueble, UtensilioCocina, ArticuloLimpieza
+)
+from entities.objetos_compactos import EQUIVALENTES
+from almacen_columnar import CATEGORIAS, ESTADOS, TIPOS, CODIGO_CATEGORIA, CODIGO_ESTADO
+
+MAGIA = b'CASA'
+VERSION = 2
+
+# magia, versión, reservado, habitaciones, objetos, cadenas, nombre casa,
+# dirección casa, offset objetos, offset offsets de cadenas, offset bytes de cadenas
+CABECERA = struct.Struct('<4sHHIIIIIQQQ')
+# nombre, metros², primera fila, total objetos, valor original. El valor actual
+# no se guarda: depende de la fecha y se calcula al consultarlo
+HABITACION = struct.Struct('<IdIId')
+# La versión 1 además guardaba el valor actual del día en que se escribió
+HABITACION_V1 = struct.Struct('<IdIIdd')
+# valor, fecha, nombre, ubicación, categoría, estado, tipo, material, flags,
+# y tres campos propios de la subclase de 8 bytes cada uno
+OBJETO = struct.Struct('<ddIIbbbbB3x8s8s8s')
+OFFSET_CADENA = struct.Struct('<I')
+ENTERO = struct.Struct('<q')
+REAL = struct.Struct('<d')
+
+# Campos propios de cada subclase: (atributo, clase de dato)
+# 's' cadena, 'n' número (entero o real), 'b' booleano
+CAMPOS_TIPO: Dict[Type[ObjetoHogar], Tuple[Tuple[str, str], ...]] = {
+    Electrodomestico: (("_marca", "s"), ("_potencia_w", "n"), ("_garantia_meses", "n")),
+    Herramienta: (("_material", "s"), ("_es_electrica", "b")),
+    Ropa: (("_tela", "s"), ("_talla", "s"), ("_temporada", "s")),
+    Mueble: (("_material", "s"), ("_dimensiones", "s"), ("_estilo", "s")),
+    UtensilioCocina: (("_material", "s"), ("_es_afilable", "b")),
+    ArticuloLimpieza: (("_tipo_limpieza", "s"), ("_es_desechable", "b")),
+}
+
+for _compacta, _normal in EQUIVALENTES.items():
+    CAMPOS_TIPO[_compacta] = CAMPOS_TIPO[_normal]
+
+_VACIO = bytes(8)
+# Bit de flags: el valor estimado era entero (los bits 0-2 son de los campos propios)
+VALOR_ENTERO = 1 << 7
+
+
+class ErrorSnapshot(Exception):
+    """Error al leer un snapshot binario"""
+    pass
+
+
+class _TablaCadenas:
+    """Asigna un índice único a cada texto distinto"""
+
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+        self._cadenas: List[bytes] = []
+
+    def indice(self, texto: str) -> int:
+        indice = self._indices.get(texto)
+        if indice is None:
+            indice = len(self._cadenas)
+            self._indices[texto] = indice
+            self._cadenas.append(texto.encode('utf-8'))
+        return indice
+
+    def __len__(self) -> int:
+        return len(self._cadenas)
+
+    def escribir(self, f) -> Tuple[int, int]:
+        """Escribe offsets y bytes; retorna la posición de cada sección"""
+        inicio_offsets = f.tell()
+        posicion = 0
+        for cadena in self._cadenas:
+            f.write(OFFSET_CADENA.pack(posicion))
+            posicion += len(cadena)
+        f.write(OFFSET_CADENA.pack(posicion))
+        inicio_bytes = f.tell()
+        for cadena in self._cadenas:
+            f.write(cadena)
+        return inicio_offsets, inicio_bytes
+
+
+def guardar_snapshot(casa, archivo: str, sincronizar: bool = False) -> int:
+    """
+    Escribe la casa completa en formato binario y retorna la cantidad de objetos.
+    Se escribe en un temporal que después reemplaza al archivo, así una caída a
+    mitad de camino deja el snapshot anterior intacto.
+    Con sincronizar=True el temporal llega al disco (fsync) antes del reemplazo.
+    """
+    temporal = f"{archivo}.{os.getpid()}.tmp"
+    try:
+        total = _escribir_snapshot(casa, temporal, sincronizar)
+        os.replace(temporal, archivo)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+    return total
+
+
+def _escribir_snapshot(casa, archivo: str, sincronizar: bool) -> int:
+    """Escribe los objetos a medida que se recorren las habitaciones"""
+    cadenas = _TablaCadenas()
+    habitaciones = casa.habitaciones
+    registros_habitacion = []
+    fila = 0
+    with open(archivo, 'wb') as f:
+        f.seek(CABECERA.size + HABITACION.size * len(habitaciones))
+        inicio_objetos = f.tell()
+        for habitacion in habitaciones:
+            primera_fila = fila
+            for objeto in habitacion.iterar_objetos():
+                f.write(_empaquetar_objeto(objeto, cadenas))
+                fila += 1
+            registros_habitacion.append(HABITACION.pack(
+                cadenas.indice(habitacion.nombre), habitacion._metros_cuadrados,
+                primera_fila, fila - primera_fila, habitacion.obtener_valor_original()
+            ))
+        id_nombre = cadenas.indice(casa._nombre)
+        id_direccion = cadenas.indice(casa._direccion)
+        inicio_offsets, inicio_bytes = cadenas.escribir(f)
+
+        f.seek(0)
+        f.write(CABECERA.pack(
+            MAGIA, VERSION, 0, len(habitaciones), fila, len(cadenas),
+            id_nombre, id_direccion, inicio_objetos, inicio_offsets, inicio_bytes
+        ))
+        for registro in registros_habitacion:
+            f.write(registro)
+        if sincronizar:
+            f.flush()
+            os.fsync(f.fileno())
+    return fila
+
+
+def _empaquetar_objeto(objeto: ObjetoHogar, cadenas: _TablaCadenas) -> bytes:
+    tipo = type(objeto)
+    if tipo not in CAMPOS_TIPO:
+        raise TypeError(f"Tipo de objeto no soportado: {tipo.__name__}")
+    campos = []
+    flags = 0
+    for i, (atributo, clase_dato) in enumerate(CAMPOS_TIPO[tipo]):
+        valor = getattr(objeto, atributo)
+        if clase_dato == "s":
+            campos.append(ENTERO.pack(cadenas.indice(valor)))
+        elif clase_dato == "b":
+            campos.append(ENTERO.pack(int(valor)))
+        elif isinstance(valor, int):
+            campos.append(ENTERO.pack(valor))
+            flags |= 1 << i  # el número era entero
+        else:
+            campos.append(REAL.pack(valor))
+    campos.extend([_VACIO] * (3 - len(campos)))
+    if isinstance(objeto.valor_estimado, int):
+        flags |= VALOR_ENTERO
+    return OBJETO.pack(
+        objeto.valor_estimado, objeto.fecha_adquisicion.timestamp(),
+        cadenas.indice(objeto.nombre), cadenas.indice(objeto.ubicacion),
+        CODIGO_CATEGORIA[objeto.categoria], CODIGO_ESTADO[objeto.estado],
+        tipo.CODIGO_TIPO, objeto.codigo_material, flags, *campos
+    )
+
+
+class SnapshotCasa:
+    """
+    Vista de solo lectura sobre un snapshot abierto con mmap.
+    Abrirlo cuesta lo mismo sin importar el tamaño del inventario.
+    """
+
+    def __init__(self, archivo: str):
+        self._archivo_abierto = open(archivo, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo_abierto.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._archivo_abierto.close()
+            raise ErrorSnapshot(f"Snapshot vacío o inválido: {archivo}") from e
+        if len(self._mapa) < CABECERA.size:
+            self.cerrar()
+            raise ErrorSnapshot(f"Snapshot incompleto: {archivo}")
+        (magia, version, _, self._total_habitaciones, self._total_objetos, self._total_cadenas,
+         self._id_nombre, self._id_direccion, self._inicio_objetos,
+         self._inicio_offsets, self._inicio_bytes) = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or version not in (1, VERSION):
+            self.cerrar()
+            raise ErrorSnapshot(f"Formato de snapshot no reconocido: {archivo}")
+        self._registro_habitacion = HABITACION if version == VERSION else HABITACION_V1
+
+    def __enter__(self) -> "SnapshotCasa":
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def cerrar(self):
+        if not self._mapa.closed:
+            self._mapa.close()
+        self._archivo_abierto.close()
+
+    def __len__(self) -> int:
+        return self._total_objetos
+
+    def cadena(self, indice: int) -> str:
+        """Decodifica un texto de la tabla de cadenas"""
+        if not 0 <= indice < self._total_cadenas:
+            raise ErrorSnapshot(f"Cadena fuera de rango: {indice}")
+        posicion = self._inicio_offsets + indice * OFFSET_CADENA.size
+        inicio, fin = struct.unpack_from('<II', self._mapa, posicion)
+        return self._mapa[self._inicio_bytes + inicio:self._inicio_bytes + fin].decode('utf-8')
+
+    @property
+    def nombre(self) -> str:
+        return self.cadena(self._id_nombre)
+
+    @property
+    def direccion(self) -> str:
+        return self.cadena(self._id_direccion)
+
+    @property
+    def total_habitaciones(self) -> int:
+        return self._total_habitaciones
+
+    def obtener_habitacion(self, indice: int) -> Dict[str, Any]:
+        """Datos de una habitación, incluido su valor original total"""
+        if not 0 <= indice < self._total_habitaciones:
+            raise IndexError(f"Habitación fuera de rango: {indice}")
+        registro = self._registro_habitacion
+        id_nombre, metros, primera_fila, total, original = registro.unpack_from(
+            self._mapa, CABECERA.size + indice * registro.size
+        )[:5]
+        return {
+            "nombre": self.cadena(id_nombre),
+            "metros_cuadrados": metros,
+            "primera_fila": primera_fila,
+            "total_objetos": total,
+            "valor_original": original
+        }
+
+    def iterar_habitaciones(self) -> Iterator[Dict[str, Any]]:
+        for indice in range(self._total_habitaciones):
+            yield self.obtener_habitacion(indice)
+
+    def obtener_objeto(self, fila: int) -> ObjetoHogar:
+        """Decodifica el objeto de la fila indicada"""
+        if not 0 <= fila < self._total_objetos:
+            raise IndexError(f"Objeto fuera de rango: {fila}")
+        (valor, fecha, id_nombre, id_ubicacion, categoria, estado, codigo_tipo,
+         codigo_material, flags, *campos) = OBJETO.unpack_from(
+            self._mapa, self._inicio_objetos + fila * OBJETO.size
+        )
+        tipo = TIPOS[codigo_tipo]
+        objeto = tipo.__new__(tipo)
+        objeto._nombre = self.cadena(id_nombre)
+        objeto._categoria = CATEGORIAS[categoria]
+        objeto._ubicacion = self.cadena(id_ubicacion)
+        objeto._estado = ESTADOS[estado]
+        objeto._valor_estimado = int(valor) if flags & VALOR_ENTERO else valor
+        objeto._fecha_adquisicion = datetime.fromtimestamp(fecha)
+        for i, (atributo, clase_dato) in enumerate(CAMPOS_TIPO[tipo]):
+            if clase_dato == "s":
+                valor_campo = self.cadena(ENTERO.unpack(campos[i])[0])
+            elif clase_dato == "b":
+                valor_campo = bool(ENTERO.unpack(campos[i])[0])
+            elif flags & (1 << i):
+                valor_campo = ENTERO.unpack(campos[i])[0]
+            else:
+                valor_campo = REAL.unpack(campos[i])[0]
+            setattr(objeto, atributo, valor_campo)
+        if tipo is Mueble:
+            objeto._codigo_material = codigo_material
+        return objeto
+
+    def extraer_columnas(self) -> Tuple[array, array, array, array, array]:
+        """
+        Lee valor, tipo, material, categoría y fecha de adquisición codificada
+        (depreciacion.codigo_fecha) de todos los objetos sin decodificar
+        textos ni crear instancias
+        """
+        valores, tipos = array('d'), array('b')
+        materiales, categorias = array('b'), array('b')
+        fechas = array('i')
+        codigos: Dict[float, int] = {}
+        fin = self._inicio_objetos + self._total_objetos * OBJETO.size
+        vista = memoryview(self._mapa)[self._inicio_objetos:fin]
+        try:
+            for (valor, fecha, _, _, categoria, _, codigo_tipo,
+                 codigo_material, *_) in OBJETO.iter_unpack(vista):
+                valores.append(valor)
+                tipos.append(codigo_tipo)
+                materiales.append(codigo_material)
+                categorias.append(categoria)
+                codigo = codigos.get(fecha)
+                if codigo is None:
+                    codigo = codigos[fecha] = depreciacion.codigo_fecha(
+                        datetime.fromtimestamp(fecha))
+                fechas.append(codigo)
+        finally:
+            vista.release()
+        return valores, tipos, materiales, categorias, fechas
+
+    def iterar_objetos(self, indice_habitacion: Optional[int] = None) -> Iterator[ObjetoHogar]:
+        """Decodifica los objetos de una habitación (o de toda la casa) a medida que se piden"""
+        if indice_habitacion is None:
+            filas = range(self._total_objetos)
+        else:
+            datos = self.obtener_habitacion(indice_habitacion)
+            filas = range(datos["primera_fila"], datos["primera_fila"] + datos["total_objetos"])
+        for fila in filas:
+            yield self.obtener_objeto(fila)
@@ -0,0 +1,58 @@
+"""
+Pruebas de almacen_columnar: eliminar objetos compacta las columnas sin
+cambiar lo que ve cada habitación.
+
+Uso:
+    python -m unittest test_almacen_columnar
+"""
+import random
+import unittest
+
+from almacen_columnar import AlmacenColumnar
+from diferencias_inventario import HuellaCasa
+from generador_sintetico import generar_casa
+
+
+class PruebaCompactacion(unittest.TestCase):
+
+    def test_eliminar_y_modificar(self):
+        azar = random.Random(3)
+        normal = generar_casa(300, 3, semilla=5)
+        almacen = AlmacenColumnar()
+        columnar = generar_casa(300, 3, semilla=5, almacen=almacen)
+
+        for _ in range(250):
+            indice = azar.randrange(len(normal.habitaciones))
+            habitacion = normal.habitaciones[indice]
+            if not habitacion.total_objetos:
+                continue
+            posicion = azar.randrange(habitacion.total_objetos)
+            if azar.random() < 0.7:
+                habitacion.eliminar_objeto(posicion)
+                columnar.habitaciones[indice].eliminar_objeto(posicion)
+            else:
+                valor = round(azar.uniform(1, 10000), 2)
+                habitacion.actualizar_valor_objeto(posicion, valor)
+                columnar.habitaciones[indice].actualizar_valor_objeto(posicion, valor)
+            self.assertLessEqual(almacen._eliminadas, len(almacen._valor_estimado) // 2)
+
+        self.assertEqual(HuellaCasa.desde_casa(normal).hash, HuellaCasa.desde_casa(columnar).hash)
+        self.assertEqual(len(almacen), sum(h.total_objetos for h in normal.habitaciones))
+        self.assertLess(len(almacen._valor_estimado), 300)
+
+    def test_compactar(self):
+        almacen = AlmacenColumnar()
+        casa = generar_casa(40, 2, semilla=1, almacen=almacen)
+        habitacion = casa.habitaciones[0]
+        filas = almacen.filas(habitacion._id_almacen)
+        habitacion.eliminar_objeto(0)
+        antes = [objeto.obtener_informacion() for objeto in casa.habitaciones[1].iterar_objetos()]
+        almacen.compactar()
+        self.assertEqual(len(almacen._valor_estimado), len(almacen))
+        self.assertIs(almacen.filas(habitacion._id_almacen), filas)
+        self.assertEqual([objeto.obtener_informacion()
+                          for objeto in casa.habitaciones[1].iterar_objetos()], antes)
+
+
+if __name__ == "__main__":
+    unittest.main()
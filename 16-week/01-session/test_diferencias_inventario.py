@@ -0,0 +1,86 @@
+"""
+Pruebas de diferencias_inventario: el mismo inventario guardado en almacenes
+distintos no debe tener diferencias, y aplicar un conjunto de cambios es
+todo o nada.
+
+Uso:
+    python -m unittest test_diferencias_inventario
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import snapshot_binario
+from almacen_columnar import AlmacenColumnar
+from diferencias_inventario import ErrorDiferencias, HuellaCasa, aplicar_cambios, comparar
+from entities.objetos_hogar import crear_desde_informacion
+from main import Casa, crear_inventario_predefinido
+
+
+class PruebaMismoInventario(unittest.TestCase):
+
+    def setUp(self):
+        self.casa = crear_inventario_predefinido()
+        self.huella = HuellaCasa.desde_casa(self.casa)
+
+    def assertSinCambios(self, otra: HuellaCasa):
+        cambios = comparar(self.huella, otra)
+        self.assertTrue(cambios.vacio, cambios)
+        self.assertEqual(self.huella.hash, otra.hash)
+
+    def test_almacen_columnar(self):
+        columnar = crear_inventario_predefinido(AlmacenColumnar())
+        self.assertSinCambios(HuellaCasa.desde_casa(columnar))
+
+    def test_snapshot_binario(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "casa.bin")
+            snapshot_binario.guardar_snapshot(self.casa, archivo)
+            with snapshot_binario.SnapshotCasa(archivo) as snapshot:
+                cargada = Casa.desde_snapshot(snapshot)
+        self.assertSinCambios(HuellaCasa.desde_casa(cargada))
+
+    def test_inventario_json(self):
+        inventario = json.loads(json.dumps(self.casa.obtener_inventario_completo()))
+        self.assertSinCambios(HuellaCasa.desde_inventario(inventario))
+
+    def test_cambio_de_valor(self):
+        columnar = crear_inventario_predefinido(AlmacenColumnar())
+        habitacion = columnar.habitaciones[0]
+        habitacion.actualizar_valor_objeto(0, habitacion.objetos[0].valor_estimado + 1)
+        cambios = comparar(self.huella, HuellaCasa.desde_casa(columnar))
+        self.assertEqual(len(cambios.modificados), 1)
+        self.assertFalse(cambios.agregados or cambios.eliminados)
+
+
+class PruebaAplicarCambios(unittest.TestCase):
+
+    def setUp(self):
+        self.antes = crear_inventario_predefinido()
+        self.despues = crear_inventario_predefinido(AlmacenColumnar())
+        habitacion = self.despues.habitaciones[0]
+        habitacion.actualizar_valor_objeto(0, habitacion.objetos[0].valor_estimado + 1)
+        habitacion.eliminar_objeto(1)
+        self.despues.crear_habitacion("Ático", 12).agregar_objeto(
+            crear_desde_informacion(self.despues.habitaciones[1].objetos[0].obtener_informacion()))
+
+    def test_aplicar(self):
+        cambios = comparar(HuellaCasa.desde_casa(self.antes), HuellaCasa.desde_casa(self.despues))
+        aplicar_cambios(self.antes, cambios)
+        self.assertEqual(HuellaCasa.desde_casa(self.antes).hash,
+                         HuellaCasa.desde_casa(self.despues).hash)
+
+    def test_habitacion_faltante_no_modifica_la_casa(self):
+        cambios = comparar(HuellaCasa.desde_casa(self.antes), HuellaCasa.desde_casa(self.despues))
+        registro = self.antes.habitaciones[0].objetos[0].obtener_informacion()
+        cambios.habitaciones_agregadas.clear()  # "Ático" ya no se crea
+        cambios.agregados.append(("Sótano", registro))
+        hash_antes = HuellaCasa.desde_casa(self.antes).hash
+        with self.assertRaises(ErrorDiferencias):
+            aplicar_cambios(self.antes, cambios)
+        self.assertEqual(HuellaCasa.desde_casa(self.antes).hash, hash_antes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Pruebas de indices: consultas intercaladas con cambios deben coincidir con
+una búsqueda exhaustiva, sin volver a ordenar los índices en cada consulta.
+
+Uso:
+    python -m unittest test_indices
+"""
+import random
+import unittest
+
+from entities.objetos_hogar import crear_desde_informacion
+from generador_sintetico import generar_casa
+from indices import IndiceInventario, ORDEN_VALOR_ACTUAL, ORDEN_VALOR_ESTIMADO
+
+
+class PruebaCambiosIntercalados(unittest.TestCase):
+
+    def setUp(self):
+        casa = generar_casa(400, 4, semilla=1)
+        self.elementos = [(id_objeto, habitacion, objeto)
+                          for habitacion in casa.habitaciones
+                          for id_objeto, objeto in habitacion.iterar_con_ids()]
+
+    def assertCoincide(self, indice: IndiceInventario, modelo, azar: random.Random):
+        valores = sorted(objeto.valor_estimado for objeto in modelo.values())
+        minimo, maximo = sorted(azar.sample(valores, 2))
+        esperados = sorted(i for i, objeto in modelo.items()
+                           if minimo <= objeto.valor_estimado <= maximo)
+        self.assertEqual(indice.buscar(valor_min=minimo, valor_max=maximo), esperados)
+
+        actuales = sorted(objeto.calcular_valor_actual() for objeto in modelo.values())
+        esperados = sorted(i for i, objeto in modelo.items()
+                           if objeto.calcular_valor_actual() >= actuales[len(actuales) // 2])
+        self.assertEqual(indice.buscar(actual_min=actuales[len(actuales) // 2]), esperados)
+
+        k = azar.randint(1, 20)
+        self.assertEqual([modelo[i].valor_estimado for i in indice.mayores(k, ORDEN_VALOR_ESTIMADO)],
+                         valores[::-1][:k])
+        self.assertEqual([modelo[i].calcular_valor_actual() for i in indice.mayores(k)],
+                         actuales[::-1][:k])
+
+    def test_cambios_y_consultas(self):
+        azar = random.Random(7)
+        reserva = self.elementos[300:]
+        indice = IndiceInventario()
+        indice.agregar_lote(self.elementos[:300])
+        modelo = {id_objeto: objeto for id_objeto, _, objeto in self.elementos[:300]}
+        habitaciones = {id_objeto: habitacion for id_objeto, habitacion, _ in self.elementos}
+
+        self.assertCoincide(indice, modelo, azar)
+        por_valor = indice._ordenados(ORDEN_VALOR_ESTIMADO)
+        por_actual = indice._ordenados(ORDEN_VALOR_ACTUAL)
+
+        for _ in range(300):
+            operacion = azar.random()
+            if operacion < 0.3 and reserva:
+                id_objeto, habitacion, objeto = reserva.pop()
+                indice.agregar(id_objeto, habitacion, objeto)
+                modelo[id_objeto] = objeto
+            elif operacion < 0.6 and len(modelo) > 10:
+                id_objeto = azar.choice(list(modelo))
+                indice.eliminar(id_objeto)
+                del modelo[id_objeto]
+            else:
+                id_objeto = azar.choice(list(modelo))
+                informacion = modelo[id_objeto].obtener_informacion()
+                informacion["valor_original"] = round(azar.uniform(1, 10000), 2)
+                modelo[id_objeto] = crear_desde_informacion(informacion)
+                indice.actualizar(id_objeto, modelo[id_objeto])
+            self.assertCoincide(indice, modelo, azar)
+
+        for id_objeto in modelo:
+            self.assertIs(indice.habitacion_de(id_objeto), habitaciones[id_objeto])
+
+        # Los índices ordenados se actualizaron en su lugar, no se rearmaron
+        self.assertIs(indice._ordenados(ORDEN_VALOR_ESTIMADO), por_valor)
+        self.assertIs(indice._ordenados(ORDEN_VALOR_ACTUAL), por_actual)
+        self.assertEqual(len(por_valor), len(modelo))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Módulo de valoración de portafolios de casas en varios procesos.
+Cada casa viaja a los procesos como columnas compactas (o como la ruta de
+su snapshot binario), nunca como el grafo completo de objetos.
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from typing import List, Dict, Any, Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+
+from entities import depreciacion
+from almacen_columnar import CATEGORIAS, CODIGO_CATEGORIA
+from snapshot_binario import SnapshotCasa
+
+class CasaCompacta(NamedTuple):
+    """Representación picklable de una casa: sólo lo necesario para valorarla"""
+    nombre: str
+    valores: array
+    tipos: array
+    materiales: array
+    categorias: array
+    fechas: array  # fecha de adquisición codificada (depreciacion.codigo_fecha)
+
+# Totales de una casa: por código de categoría, (valor original, valor actual)
+TotalesCasa = Tuple[str, List[Tuple[float, float]]]
+
+def compactar_casa(casa) -> CasaCompacta:
+    """Extrae las columnas de valoración de una Casa"""
+    almacen = casa.almacen
+    if almacen is not None and all(h._almacen is almacen for h in casa.habitaciones):
+        filas = (fila for h in casa.habitaciones for fila in almacen.filas(h._id_almacen))
+        return CasaCompacta(casa._nombre, *almacen.extraer_columnas(filas))
+
+    valores, tipos = array('d'), array('b')
+    materiales, categorias = array('b'), array('b')
+    fechas = array('i')
+    for habitacion in casa.habitaciones:
+        for objeto in habitacion.iterar_objetos():
+            valores.append(objeto.valor_estimado)
+            tipos.append(objeto.CODIGO_TIPO)
+            materiales.append(objeto.codigo_material)
+            categorias.append(CODIGO_CATEGORIA[objeto.categoria])
+            fechas.append(depreciacion.codigo_fecha(objeto.fecha_adquisicion))
+    return CasaCompacta(casa._nombre, valores, tipos, materiales, categorias, fechas)
+
+def _valorar_columnas(nombre: str, valores: Sequence[float], tipos: Sequence[int],
+                      materiales: Sequence[int], categorias: Sequence[int],
+                      fechas: Sequence[int], fecha: Optional[date] = None) -> TotalesCasa:
+    actuales = depreciacion.calcular_valores_actuales(valores, tipos, materiales, fechas, fecha)
+    totales = [[0.0, 0.0] for _ in CATEGORIAS]
+    for valor, actual, categoria in zip(valores, actuales, categorias):
+        total = totales[categoria]
+        total[0] += valor
+        total[1] += float(actual)
+    return nombre, [(original, actual) for original, actual in totales]
+
+def _columnas(entrada: Union[CasaCompacta, str]) -> CasaCompacta:
+    if isinstance(entrada, str):
+        with SnapshotCasa(entrada) as snapshot:
+            return CasaCompacta(snapshot.nombre, *snapshot.extraer_columnas())
+    return entrada
+
+def valorar_casa(entrada: Union[CasaCompacta, str], fecha: Optional[date] = None) -> TotalesCasa:
+    """
+    Valora una casa compacta o el snapshot binario cuya ruta se indica,
+    a la fecha indicada (hoy por defecto)
+    """
+    return _valorar_columnas(*_columnas(entrada), fecha)
+
+def curva_casa(entrada: Union[CasaCompacta, str], fechas: Sequence[date]) -> List[float]:
+    """Valor total de una casa en cada una de las fechas indicadas"""
+    casa = _columnas(entrada)
+    return depreciacion.curva_valores(
+        casa.valores, casa.tipos, casa.materiales, casa.fechas, fechas
+    )
+
+def _resumen(original: float, actual: float) -> Dict[str, float]:
+    return {
+        "valor_total_original": round(original, 2),
+        "valor_total_actual": round(actual, 2),
+        "depreciacion_total": round(original - actual, 2),
+        "porcentaje_depreciacion": round(
+            ((original - actual) / original * 100) if original > 0 else 0, 2
+        )
+    }
+
+def valorar_portafolio(casas: Iterable[Union[CasaCompacta, str]],
+                       procesos: Optional[int] = None,
+                       casas_por_tarea: int = 16,
+                       fecha: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Valora muchas casas repartiéndolas entre procesos y une los resultados.
+    Las casas pueden ser CasaCompacta (ver compactar_casa) o rutas a snapshots.
+    Los resultados se combinan en el orden de entrada, así que el reporte es
+    el mismo sin importar cuántos procesos se usen.
+    """
+    if fecha is None:
+        # Una sola fecha para todo el portafolio, aunque cruce la medianoche
+        fecha = depreciacion.hoy()
+    return _combinar(_repartir(partial(valorar_casa, fecha=fecha), casas,
+                               procesos, casas_por_tarea))
+
+def curva_portafolio(casas: Iterable[Union[CasaCompacta, str]], fechas: Sequence[date],
+                     procesos: Optional[int] = None,
+                     casas_por_tarea: int = 16) -> List[float]:
+    """Valor total del portafolio en cada una de las fechas indicadas"""
+    fechas = list(fechas)
+    curva = [0.0] * len(fechas)
+    for curva_de_casa in _repartir(partial(curva_casa, fechas=fechas), casas,
+                                   procesos, casas_por_tarea):
+        for i, valor in enumerate(curva_de_casa):
+            curva[i] += valor
+    return curva
+
+def _repartir(funcion, casas, procesos: Optional[int], casas_por_tarea: int) -> Iterable:
+    """Aplica la función a cada casa, en este proceso o en varios, en orden"""
+    if procesos == 1:
+        yield from map(funcion, casas)
+        return
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        yield from ejecutor.map(funcion, casas, chunksize=casas_por_tarea)
+
+def _combinar(resultados: Iterable[TotalesCasa]) -> Dict[str, Any]:
+    totales = [[0.0, 0.0] for _ in CATEGORIAS]
+    por_casa: List[Dict[str, Any]] = []
+    for nombre, totales_casa in resultados:
+        original_casa = actual_casa = 0.0
+        for codigo, (original, actual) in enumerate(totales_casa):
+            totales[codigo][0] += original
+            totales[codigo][1] += actual
+            original_casa += original
+            actual_casa += actual
+        resumen_casa = {"casa": nombre}
+        resumen_casa.update(_resumen(original_casa, actual_casa))
+        por_casa.append(resumen_casa)
+
+    total_original = sum(original for original, _ in totales)
+    total_actual = sum(actual for _, actual in totales)
+    return {
+        "resumen_financiero": _resumen(total_original, total_actual),
+        "valor_por_categoria": {
+            CATEGORIAS[codigo].value: {"original": original, "actual": actual}
+            for codigo, (original, actual) in enumerate(totales)
+            if original or actual
+        },
+        "resumen_por_casa": por_casa,
+        "total_casas": len(por_casa)
+    }